@@ -14,20 +14,38 @@ This script will:
 3. Attach the Lambda as a target to the Gateway
 4. Save the configuration to gateway_config.json
 
-If a Gateway already exists (from gateway_config.json), it will be reused.
+The Lambda function and the OAuth authorizer are set up concurrently. Progress is saved to
+gateway_config.json after each step, so an interrupted run resumes where it
+stopped. If a Gateway already exists (from gateway_config.json), it will be reused.
 """
 
 import argparse
 import json
 import logging
 import time
-import zipfile
-import tempfile
 import os
+import sys
 from pathlib import Path
-import boto3
 from bedrock_agentcore_starter_toolkit.operations.gateway.client import GatewayClient
 
+# Add parent directory to path for common imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.aws_clients import get_client, get_default_region  # noqa: E402
+from common.lambda_utils import (  # noqa: E402
+    build_zip_package,
+    create_function_when_role_ready,
+    update_function_code_if_changed,
+)
+from common.resource_index import ResourceIndex  # noqa: E402
+from common.task_graph import Step, run_graph  # noqa: E402
+from common.waiter import fetch_or_none  # noqa: E402
+
+CONFIG_FILE = "gateway_config.json"
+
+# Local name -> ID index, so repeated runs resolve names without list calls
+RESOURCE_INDEX_FILE = ".resource_index.json"
+
 
 # Refund Lambda function code (Node.js)
 REFUND_LAMBDA_CODE = """
@@ -83,29 +101,39 @@ REFUND_TOOL_SCHEMA = [
 
 
 def load_existing_config() -> dict | None:
-    """Load existing gateway_config.json if it exists and has valid gateway info."""
-    config_path = Path("gateway_config.json")
+    """
+    Load existing gateway_config.json, which may be partial if a previous run
+    stopped early. Placeholder values (e.g. "<gateway-id>") are dropped.
+    """
+    config_path = Path(CONFIG_FILE)
     if not config_path.exists():
         return None
 
     try:
         with open(config_path, "r", encoding="utf-8") as f:
             config = json.load(f)
-
-        # Check if config has required gateway fields (not placeholders)
-        if config.get("gateway_id") and "<" not in config.get("gateway_id", "<"):
-            return config
     except (json.JSONDecodeError, IOError):
-        pass
+        return None
 
-    return None
+    return {
+        key: value for key, value in config.items()
+        if value and not (isinstance(value, str) and "<" in value)
+    }
+
+
+def save_config(config: dict) -> None:
+    """Write gateway_config.json atomically so an interrupted run leaves a valid file."""
+    tmp_path = Path(CONFIG_FILE + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(config, f, indent=2)
+    os.replace(tmp_path, CONFIG_FILE)
 
 
 def get_existing_gateway(
-    region: str, gateway_id: str = None, gateway_name: str = None
+    index: ResourceIndex, gateway_id: str = None, gateway_name: str = None
 ) -> dict | None:
     """Check if gateway exists by ID or name and return its details."""
-    boto_client = boto3.client("bedrock-agentcore-control", region_name=region)
+    boto_client = index.client
 
     # Try by ID first
     if gateway_id:
@@ -116,36 +144,39 @@ def get_existing_gateway(
         except Exception as exc:
             print(f"  Could not retrieve gateway by ID {gateway_id}: {exc}")
 
-    # Try to find by name
+    # Try to find by name (resolved from the local index, refreshed once if stale)
     if gateway_name:
         try:
-            response = boto_client.list_gateways()
-            for gw in response.get("items", []):
-                if gw.get("name") == gateway_name and gw.get("status") in [
-                    "READY",
-                    "ACTIVE",
-                ]:
-                    # Get full gateway details
-                    full_gw = boto_client.get_gateway(gatewayIdentifier=gw["gatewayId"])
-                    return full_gw
+            for _ in range(2):
+                entry = index.gateway(gateway_name)
+                if not entry:
+                    return None
+                gateway = fetch_or_none(boto_client.get_gateway, gatewayIdentifier=entry["id"])
+                if gateway:
+                    return gateway if gateway.get("status") in ["READY", "ACTIVE"] else None
+                index.invalidate("gateway")
         except Exception as exc:
             print(f"  Could not search for gateway by name: {exc}")
 
     return None
 
 
-def get_existing_target(region: str, gateway_id: str, target_name: str) -> dict | None:
+def get_existing_target(index: ResourceIndex, gateway_id: str, target_name: str) -> dict | None:
     """Check if a target with the given name exists on the gateway."""
-    boto_client = boto3.client("bedrock-agentcore-control", region_name=region)
+    boto_client = index.client
 
     try:
-        response = boto_client.list_gateway_targets(gatewayIdentifier=gateway_id)
-        targets = response.get("items", [])
-        print(f"  Found {len(targets)} existing target(s) on gateway")
-        for target in targets:
-            print(f"    - {target.get('name')} (ID: {target.get('targetId')})")
-            if target.get("name") == target_name:
+        for _ in range(2):
+            entry = index.target(gateway_id, target_name)
+            if not entry:
+                print(f"  No existing target named {target_name} on gateway")
+                return None
+            target = fetch_or_none(
+                boto_client.get_gateway_target, gatewayIdentifier=gateway_id, targetId=entry["id"]
+            )
+            if target:
                 return target
+            index.invalidate("target", gateway_id)
     except Exception as exc:
         print(f"  Could not list gateway targets: {exc}")
 
@@ -163,106 +194,92 @@ def create_refund_lambda(region: str, function_name: str = "RefundLambda") -> st
     Returns:
         Lambda function ARN
     """
-    lambda_client = boto3.client("lambda", region_name=region)
-    iam_client = boto3.client("iam", region_name=region)
-    sts_client = boto3.client("sts", region_name=region)
-
-    account_id = sts_client.get_caller_identity()["Account"]
+    lambda_client = get_client("lambda", region=region)
+    iam_client = get_client("iam", region=region)
+    sts_client = get_client("sts", region=region)
 
     print(f"\n📦 Setting up Refund Lambda function: {function_name}")
     print("-" * 60)
 
-    # Create deployment package (zip file with index.mjs)
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
-        zip_path = tmp_file.name
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            # Use .mjs extension for ES module support
-            zipf.writestr("index.mjs", REFUND_LAMBDA_CODE.strip())
+    # Create deployment package in memory (zip file with index.mjs)
+    # Use .mjs extension for ES module support
+    zip_content = build_zip_package({"index.mjs": REFUND_LAMBDA_CODE.strip()})
 
-    try:
-        with open(zip_path, "rb") as f:
-            zip_content = f.read()
-
-        # Try to update existing function first
-        try:
-            lambda_client.update_function_code(
-                FunctionName=function_name, ZipFile=zip_content
-            )
+    # Update an existing function only when its code differs (CodeSha256)
+    existing = update_function_code_if_changed(lambda_client, function_name, zip_content)
+    if existing:
+        if existing["updated"]:
             print(f"✓ Updated existing Lambda function: {function_name}")
+        else:
+            print(f"✓ Lambda function code unchanged, skipping update: {function_name}")
+        return existing["function_arn"]
 
-            # Wait for update to complete
-            waiter = lambda_client.get_waiter("function_updated_v2")
-            waiter.wait(FunctionName=function_name)
-
-            response = lambda_client.get_function(FunctionName=function_name)
-            return response["Configuration"]["FunctionArn"]
-
-        except lambda_client.exceptions.ResourceNotFoundException:
-            # Create new function with IAM role
-            role_name = f"{function_name}-execution-role"
-            role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
+    # Create new function with IAM role
+    account_id = sts_client.get_caller_identity()["Account"]
+    role_name = f"{function_name}-execution-role"
+    role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
 
-            # Create IAM role if needed
-            try:
-                iam_client.create_role(
-                    RoleName=role_name,
-                    AssumeRolePolicyDocument=json.dumps(
+    # Create IAM role if needed
+    role_created_at = time.monotonic()
+    try:
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=json.dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
                         {
-                            "Version": "2012-10-17",
-                            "Statement": [
-                                {
-                                    "Effect": "Allow",
-                                    "Principal": {"Service": "lambda.amazonaws.com"},
-                                    "Action": "sts:AssumeRole",
-                                }
-                            ],
+                            "Effect": "Allow",
+                            "Principal": {"Service": "lambda.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
                         }
-                    ),
-                    Description="Execution role for RefundLambda function",
-                )
-                iam_client.attach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn="arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
-                )
-                print(f"✓ Created IAM role: {role_name}")
-                print("  ⏳ Waiting for IAM role propagation (10s)...")
-                time.sleep(10)
-            except iam_client.exceptions.EntityAlreadyExistsException:
-                print(f"  IAM role already exists: {role_name}")
-
-            # Create Lambda function with Node.js 20.x runtime
-            response = lambda_client.create_function(
-                FunctionName=function_name,
-                Runtime="nodejs20.x",
-                Role=role_arn,
-                Handler="index.handler",
-                Code={"ZipFile": zip_content},
-                Description="Sample refund processing Lambda for AgentCore Policy tutorial",
-                Timeout=30,
-                MemorySize=128,
-            )
-            print(f"✓ Created Lambda function: {function_name}")
-
-            # Wait for function to be active
-            waiter = lambda_client.get_waiter("function_active_v2")
-            waiter.wait(FunctionName=function_name)
-
-            return response["FunctionArn"]
-
-    finally:
-        os.remove(zip_path)
+                    ],
+                }
+            ),
+            Description="Execution role for RefundLambda function",
+        )
+        iam_client.attach_role_policy(
+            RoleName=role_name,
+            PolicyArn="arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
+        )
+        print(f"✓ Created IAM role: {role_name}")
+    except iam_client.exceptions.EntityAlreadyExistsException:
+        print(f"  IAM role already exists: {role_name}")
+
+    # Create Lambda function with Node.js 20.x runtime, retrying until
+    # the new role has propagated instead of sleeping a fixed time
+    response, propagation_seconds = create_function_when_role_ready(
+        lambda_client,
+        since=role_created_at,
+        FunctionName=function_name,
+        Runtime="nodejs20.x",
+        Role=role_arn,
+        Handler="index.handler",
+        Code={"ZipFile": zip_content},
+        Description="Sample refund processing Lambda for AgentCore Policy tutorial",
+        Timeout=30,
+        MemorySize=128,
+    )
+    print(f"✓ Created Lambda function: {function_name} "
+          f"(IAM role propagation: {propagation_seconds:.1f}s)")
 
+    # Wait for function to be active
+    waiter = lambda_client.get_waiter("function_active_v2")
+    waiter.wait(FunctionName=function_name)
 
-def get_default_region() -> str:
-    """Get the default AWS region from the current session or environment."""
-    session = boto3.Session()
-    return session.region_name or os.environ.get("AWS_DEFAULT_REGION", "us-east-1")
+    return response["FunctionArn"]
 
 
 def setup_gateway(region: str = None, role_arn: str = None):
     """
     Setup AgentCore Gateway with Lambda target and policy engine.
 
+    Provisioning runs as a dependency graph: the Lambda function and the Cognito
+    authorizer are independent and are set up concurrently; the gateway waits for
+    Cognito and the target waits for both the gateway and the Lambda function.
+    Each completed step is saved to gateway_config.json, so a failed run resumes
+    from the last completed step.
+
     Args:
         region: AWS region (defaults to session region or us-east-1)
         role_arn: IAM role ARN with trust relationship (creates one if not provided)
@@ -274,101 +291,83 @@ def setup_gateway(region: str = None, role_arn: str = None):
     print("\n🚀 Setting up AgentCore Gateway...")
     print(f"Region: {region}\n")
 
-    # Initialize client
+    # Initialize clients
     client = GatewayClient(region_name=region)
     client.logger.setLevel(logging.INFO)
+    control_client = get_client("bedrock-agentcore-control", region=region)
+    index = ResourceIndex(control_client, path=RESOURCE_INDEX_FILE)
 
     # Gateway and target names used for this tutorial
     gateway_name = "TestGWforPolicyEngine"
     target_name = "RefundToolTarget"
     lambda_function_name = "RefundLambda"
 
-    # Check for existing configuration or gateway
-    existing_config = load_existing_config()
-    gateway = None
-    cognito_response = None
-    lambda_arn = None
-
-    if existing_config:
-        print("📋 Found existing gateway_config.json")
-        gateway_id = existing_config.get("gateway_id")
-
-        # Try to retrieve the existing gateway
-        print(f"  Checking if gateway '{gateway_id}' exists...")
-        gateway = get_existing_gateway(region, gateway_id=gateway_id)
+    # Resume from existing (possibly partial) configuration
+    config = load_existing_config() or {}
+    if config:
+        print(f"📋 Found existing {CONFIG_FILE}, resuming completed steps")
+    config["region"] = region
+
+    completed = {}
+    if config.get("lambda_arn"):
+        completed["lambda"] = config["lambda_arn"]
+    # Saved client_info has no authorizer config, so it is only reusable together
+    # with the saved gateway; otherwise the authorizer is recreated for a new gateway
+    saved_gateway = None
+    if config.get("gateway_id"):
+        print(f"  Checking if gateway '{config['gateway_id']}' exists...")
+        saved_gateway = get_existing_gateway(index, gateway_id=config["gateway_id"])
+        if not saved_gateway:
+            print(f"  Gateway '{config['gateway_id']}' not found or not ready")
+    if config.get("client_info") and saved_gateway:
+        completed["cognito"] = {"client_info": config["client_info"]}
+
+    def setup_lambda(results):
+        print("\n[lambda] Setting up Refund Lambda function")
+        lambda_arn = create_refund_lambda(region, lambda_function_name)
+        print(f"[lambda] ✓ Lambda ARN: {lambda_arn}")
+        return lambda_arn
 
-        if gateway:
-            print(
-                f"✓ Reusing existing gateway: {gateway.get('gatewayUrl', gateway_id)}\n"
-            )
-            # Reuse existing client_info if available
-            if existing_config.get("client_info"):
-                cognito_response = {"client_info": existing_config["client_info"]}
+    def setup_cognito(results):
+        print("\n[cognito] Creating OAuth authorization server")
+        cognito_response = client.create_oauth_authorizer_with_cognito("TestGateway")
+        print("[cognito] ✓ Authorization server created")
+        return cognito_response
 
-            # Check if Lambda ARN is stored in config
-            lambda_arn = existing_config.get("lambda_arn")
-        else:
-            print(f"  Gateway '{gateway_id}' not found or not ready.\n")
+    def setup_gateway_resource(results):
+        gateway = saved_gateway
+        if not gateway:
+            print(f"[gateway] 🔍 Checking for existing gateway named '{gateway_name}'...")
+            gateway = get_existing_gateway(index, gateway_name=gateway_name)
 
-    # If no gateway yet, check if one exists by name
-    if not gateway:
-        print(f"🔍 Checking for existing gateway named '{gateway_name}'...")
-        gateway = get_existing_gateway(region, gateway_name=gateway_name)
         if gateway:
-            print(f"✓ Found existing gateway: {gateway.get('gatewayUrl')}\n")
-
-    # Create or get Lambda function
-    if not lambda_arn:
-        print("\n" + "=" * 60)
-        print("Step 1: Setting up Refund Lambda function")
-        print("=" * 60)
-        lambda_arn = create_refund_lambda(region, lambda_function_name)
-        print(f"✓ Lambda ARN: {lambda_arn}\n")
-    else:
-        print(f"\n✓ Using existing Lambda ARN: {lambda_arn}\n")
-
-    # Create OAuth authorizer if we don't have existing client_info
-    if not cognito_response:
-        print("=" * 60)
-        print("Step 2: Creating OAuth authorization server")
-        print("=" * 60)
-        cognito_response = client.create_oauth_authorizer_with_cognito("TestGateway")
-        print("✓ Authorization server created\n")
+            print(f"[gateway] ✓ Reusing existing gateway: {gateway.get('gatewayUrl')}")
+            return gateway
 
-    # Create Gateway if we don't have an existing one
-    if not gateway:
-        print("=" * 60)
-        print("Step 3: Creating Gateway")
-        print("=" * 60)
+        print("[gateway] Creating Gateway")
         gateway = client.create_mcp_gateway(
             name=gateway_name,
             role_arn=role_arn,
-            authorizer_config=cognito_response.get("authorizer_config"),
+            authorizer_config=results["cognito"].get("authorizer_config"),
             enable_semantic_search=True,
         )
-        print(f"✓ Gateway created: {gateway['gatewayUrl']}\n")
-    else:
-        print("=" * 60)
-        print("Step 3: Skipping gateway creation (reusing existing)")
-        print("=" * 60 + "\n")
-
-    # Check if target already exists and add if not
-    print("=" * 60)
-    print("Step 4: Adding Lambda target")
-    print("=" * 60)
+        index.record_created("gateway", gateway)
+        print(f"[gateway] ✓ Gateway created: {gateway['gatewayUrl']}")
+        return gateway
+
+    def setup_target(results):
+        gateway = results["gateway"]
+        lambda_arn = results["lambda"]
+        gateway_id = gateway.get("gatewayId")
+        print(f"\n[target] Adding Lambda target '{target_name}' to gateway {gateway_id}")
+        print(f"  Lambda ARN: {lambda_arn}")
+
+        existing_target = get_existing_target(index, gateway_id, target_name)
+        if existing_target:
+            print(f"[target] ✓ Lambda target '{target_name}' already exists, reusing")
+            print(f"  Target ID: {existing_target.get('targetId')}")
+            return {"gatewayArn": gateway.get("gatewayArn")}
 
-    gateway_id = gateway.get("gatewayId")
-    print(f"  Gateway ID: {gateway_id}")
-    print(f"  Target name: {target_name}")
-    print(f"  Lambda ARN: {lambda_arn}")
-
-    existing_target = get_existing_target(region, gateway_id, target_name)
-
-    if existing_target:
-        print(f"✓ Lambda target '{target_name}' already exists, reusing")
-        print(f"  Target ID: {existing_target.get('targetId')}")
-        lambda_target = {"gatewayArn": gateway.get("gatewayArn")}
-    else:
         print(f"  Target '{target_name}' not found, creating...")
         try:
             lambda_target = client.create_mcp_gateway_target(
@@ -381,31 +380,58 @@ def setup_gateway(region: str = None, role_arn: str = None):
                 },
                 credentials=None,
             )
-            print(f"✓ Lambda target '{target_name}' created and attached to gateway\n")
+            index.record_created("target", lambda_target, scope=gateway_id)
+            print(f"[target] ✓ Lambda target '{target_name}' created and attached to gateway")
+            return lambda_target
         except Exception as exc:
             error_str = str(exc)
             if (
                 "ConflictException" in str(type(exc).__name__)
                 or "already exists" in error_str
             ):
-                print(f"✓ Lambda target '{target_name}' already exists, reusing\n")
-                lambda_target = {"gatewayArn": gateway.get("gatewayArn")}
-            else:
-                print(f"✗ Error creating target: {exc}")
-                raise
-
-    # Save configuration
-    config = {
-        "gateway_url": gateway.get("gatewayUrl"),
-        "gateway_id": gateway.get("gatewayId"),
-        "gateway_arn": lambda_target.get("gatewayArn") or gateway.get("gatewayArn"),
-        "region": region,
-        "client_info": cognito_response.get("client_info"),
-        "lambda_arn": lambda_arn,
-    }
+                print(f"[target] ✓ Lambda target '{target_name}' already exists, reusing")
+                return {"gatewayArn": gateway.get("gatewayArn")}
+            print(f"[target] ✗ Error creating target: {exc}")
+            raise
+
+    def save_progress(step_name, result):
+        if step_name == "lambda":
+            config["lambda_arn"] = result
+        elif step_name == "cognito":
+            config["client_info"] = result.get("client_info")
+        elif step_name == "gateway":
+            config["gateway_url"] = result.get("gatewayUrl")
+            config["gateway_id"] = result.get("gatewayId")
+            config["gateway_arn"] = result.get("gatewayArn")
+        elif step_name == "target":
+            config["gateway_arn"] = result.get("gatewayArn") or config.get("gateway_arn")
+        save_config(config)
+
+    steps = [
+        Step("lambda", setup_lambda),
+        Step("cognito", setup_cognito),
+        Step("gateway", setup_gateway_resource, depends_on=["cognito"]),
+        Step("target", setup_target, depends_on=["gateway", "lambda"]),
+    ]
+
+    start = time.perf_counter()
+    outcomes = run_graph(steps, completed=completed, on_complete=save_progress)
+    wall_seconds = time.perf_counter() - start
 
-    with open("gateway_config.json", "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2)
+    print("\n" + "=" * 60)
+    print("Step timings")
+    print("=" * 60)
+    for step in steps:
+        outcome = outcomes[step.name]
+        print(f"  {step.name:<10} {outcome['status']:<8} {outcome['seconds']:6.1f}s")
+    step_seconds = sum(outcome["seconds"] for outcome in outcomes.values())
+    print(f"  Wall clock: {wall_seconds:.1f}s (sum of steps: {step_seconds:.1f}s)")
+
+    failed = [name for name, outcome in outcomes.items() if outcome["status"] == "FAILED"]
+    if failed:
+        print(f"\n✗ Setup failed at step(s): {', '.join(failed)}")
+        print(f"  Completed steps are saved in {CONFIG_FILE}; rerun to resume")
+        raise outcomes[failed[0]]["error"]
 
     print("\n" + "=" * 60)
     print("✅ Gateway setup complete!")
@@ -414,7 +440,7 @@ def setup_gateway(region: str = None, role_arn: str = None):
     print(f"Gateway ID: {config['gateway_id']}")
     print(f"Gateway ARN: {config['gateway_arn']}")
     print(f"Lambda ARN: {config['lambda_arn']}")
-    print("\nConfiguration saved to: gateway_config.json")
+    print(f"\nConfiguration saved to: {CONFIG_FILE}")
     print("=" * 60)
 
     return config
@@ -15,9 +15,7 @@ Prerequisites:
 
 import sys
 import os
-import time
 import json
-import boto3
 from pathlib import Path
 from urllib.parse import quote
 
@@ -34,6 +32,13 @@ COGNITO_POOL_NAME = "RefundMCPServerPool"
 SCRIPT_DIR = Path(__file__).parent
 MCP_SERVER_FILE = SCRIPT_DIR / "mcp_server.py"
 
+# Add parent directory to path for common imports
+sys.path.insert(0, str(SCRIPT_DIR.resolve().parent))
+
+from common.auth_utils import get_bearer_token as request_bearer_token  # noqa: E402
+from common.aws_clients import get_client  # noqa: E402
+from common.waiter import fetch_or_none, wait_for_status  # noqa: E402
+
 
 def print_header(message: str):
     print(f"\n{'=' * 60}")
@@ -61,7 +66,7 @@ def setup_cognito_for_runtime() -> dict:
     """Set up Cognito User Pool and App Client for Runtime authentication."""
     print_header("Setting up Cognito for Runtime OAuth")
 
-    cognito_client = boto3.client("cognito-idp", region_name=REGION)
+    cognito_client = get_client("cognito-idp", region=REGION)
 
     # Check for existing pool
     pools = cognito_client.list_user_pools(MaxResults=60).get("UserPools", [])
@@ -179,24 +184,15 @@ def setup_cognito_for_runtime() -> dict:
     return cognito_config
 
 
-def get_bearer_token(cognito_config: dict) -> str:
-    """Get Bearer token using client credentials flow."""
-    import requests
-
-    data = {
-        "grant_type": "client_credentials",
-        "client_id": cognito_config["client_id"],
-        "client_secret": cognito_config["client_secret"],
-        "scope": cognito_config["scope"],
-    }
-
-    response = requests.post(
-        cognito_config["token_endpoint"],
-        headers={"Content-Type": "application/x-www-form-urlencoded"},
-        data=data,
+def get_bearer_token(cognito_config: dict, session=None) -> str:
+    """Get Bearer token using client credentials flow (shared pooled session by default)."""
+    return request_bearer_token(
+        token_endpoint=cognito_config["token_endpoint"],
+        client_id=cognito_config["client_id"],
+        client_secret=cognito_config["client_secret"],
+        scope=cognito_config["scope"],
+        session=session,
     )
-    response.raise_for_status()
-    return response.json()["access_token"]
 
 
 # ============================================================================
@@ -205,7 +201,7 @@ def get_bearer_token(cognito_config: dict) -> str:
 
 def get_agentcore_client():
     """Get bedrock-agentcore-control client."""
-    return boto3.client("bedrock-agentcore-control", region_name=REGION)
+    return get_client("bedrock-agentcore-control", region=REGION)
 
 
 def list_runtimes(client):
@@ -233,21 +229,21 @@ def delete_runtime(client, runtime_id: str):
     print(f"Deleting runtime: {runtime_id}")
     client.delete_agent_runtime(agentRuntimeId=runtime_id)
 
-    max_wait = 180
-    start = time.time()
-    while time.time() - start < max_wait:
-        try:
-            client.get_agent_runtime(agentRuntimeId=runtime_id)
-            print("  Waiting for deletion...")
-            time.sleep(10)
-        except client.exceptions.ResourceNotFoundException:
-            print_success("Runtime deleted")
-            return True
-        except Exception as e:
-            if "ResourceNotFoundException" in str(type(e).__name__):
-                print_success("Runtime deleted")
-                return True
-            time.sleep(10)
+    result = wait_for_status(
+        lambda: fetch_or_none(client.get_agent_runtime, agentRuntimeId=runtime_id) or {"status": "DELETED"},
+        success_states={"DELETED"},
+        timeout=180,
+        initial_interval=1.0,
+        max_interval=10,
+        on_status=lambda status: print(f"  Status: {status}"),
+    )
+
+    if result["ok"]:
+        print_success("Runtime deleted")
+        return True
+    if result["reason"] == "error":
+        print_error(f"Deletion status check error: {result['error']}")
+        return False
 
     print_error("Deletion timeout")
     return False
@@ -349,27 +345,29 @@ def deploy_with_starter_toolkit(cognito_config: dict):
 def wait_for_runtime_ready(client, runtime_id: str, max_wait: int = 600):
     """Wait for runtime to reach READY state."""
     print(f"\nWaiting for Runtime READY state...")
-    start = time.time()
-    attempt = 0
 
-    while time.time() - start < max_wait:
-        attempt += 1
+    def fetch():
         try:
-            runtime = get_runtime_details(client, runtime_id)
-            status = runtime.get("status")
-            print(f"  [{attempt}] Status: {status}")
-
-            if status == "READY":
-                return runtime
-            elif status in ["FAILED", "CREATE_FAILED", "UPDATE_FAILED"]:
-                reason = runtime.get("statusReason", "Unknown")
-                print_error(f"Runtime failed: {reason}")
-                return None
-
+            return get_runtime_details(client, runtime_id)
         except Exception as e:
             print_error(f"Status check error: {e}")
+            return None
+
+    result = wait_for_status(
+        fetch,
+        success_states={"READY"},
+        failure_states={"FAILED", "CREATE_FAILED", "UPDATE_FAILED"},
+        timeout=max_wait,
+        initial_interval=1.0,
+        max_interval=10,
+        on_status=lambda status: print(f"  Status: {status or 'UNKNOWN'}"),
+    )
 
-        time.sleep(10)
+    if result["ok"]:
+        return result["resource"]
+    if result["reason"] == "failure":
+        print_error(f"Runtime failed: {result['resource'].get('statusReason', 'Unknown')}")
+        return None
 
     print_error("Timeout waiting for runtime")
     return None
@@ -5,16 +5,30 @@ This MCP server provides a refund tool that can be used to test
 Cedar policy enforcement through AgentCore Gateway.
 
 Usage:
-    python mcp_server.py
+    python mcp_server.py [--workers N|auto] [--port PORT]
 
 The server runs on http://0.0.0.0:8000/mcp
+
+With --workers > 1 (or MCP_WORKERS=N in the environment, e.g. in the Docker
+image), uvicorn pre-forks N worker processes that share one listening socket.
+This works because the server is stateless (stateless_http=True): any worker
+can answer any request. On SIGTERM/SIGINT, workers stop accepting connections
+and finish in-flight requests for up to GRACEFUL_SHUTDOWN_SECONDS.
 """
 
+import argparse
 import json
 import logging
-from typing import Any
+import os
+from typing import Any, Optional
 
 from mcp.server.fastmcp import FastMCP
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from order_store import InMemoryOrderStore, OrderRepository, StaticOrderRepository
+from tool_cache import IdempotencyCache, ReadThroughCache
+from tool_offload import ToolExecutor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -29,8 +43,62 @@ mcp = FastMCP(
     stateless_http=True
 )
 
+# Sync tools run in this bounded thread pool instead of on the event loop, each
+# with its own concurrency limit, so one slow backend cannot starve other tools
+tool_executor = ToolExecutor(max_workers=int(os.environ.get("MCP_TOOL_THREADS", "32")))
+
+# Order backend for get_order: a JSONL/CSV fixture if MCP_ORDER_FIXTURE is set,
+# otherwise the tutorial fixture for any order ID
+ORDER_FIXTURE_ENV = "MCP_ORDER_FIXTURE"
+
+
+def load_order_repository() -> OrderRepository:
+    fixture = os.environ.get(ORDER_FIXTURE_ENV)
+    if not fixture:
+        return StaticOrderRepository()
+    store = InMemoryOrderStore.from_file(fixture)
+    logger.info(f"Loaded {len(store)} orders from {fixture}")
+    return store
+
+
+# Loaded by init_orders() in each serving process rather than at import, so
+# the multi-worker supervisor (which imports this module but serves nothing)
+# does not parse the order fixture as well
+orders: Optional[OrderRepository] = None
+order_cache: Optional[ReadThroughCache] = None
+
+
+def init_orders() -> None:
+    """Load the order repository and the get_order cache in front of it (once per process)."""
+    global orders, order_cache
+    if orders is not None:
+        return
+    orders = load_order_repository()
+    # get_order reads through this cache; unknown orders are cached for a shorter
+    # TTL, and refund invalidates the order it touches
+    order_cache = ReadThroughCache(
+        orders.get,
+        max_entries=int(os.environ.get("MCP_ORDER_CACHE_MAX_ENTRIES", "10000")),
+        ttl=float(os.environ.get("MCP_ORDER_CACHE_TTL", "30")),
+        negative_ttl=float(os.environ.get("MCP_ORDER_CACHE_NEGATIVE_TTL", "5")),
+    )
+
+
+# Agents retry tools/call through the gateway; side-effecting tools return the
+# stored result for a repeated call instead of processing it twice
+idempotency = IdempotencyCache(
+    max_entries=int(os.environ.get("MCP_IDEMPOTENCY_MAX_ENTRIES", "10000")),
+    ttl=float(os.environ.get("MCP_IDEMPOTENCY_TTL", "600")),
+)
+
+# Worker process count for the production launch mode ("auto" = one per CPU core)
+WORKERS_ENV = "MCP_WORKERS"
+GRACEFUL_SHUTDOWN_SECONDS = 30
+
 
 @mcp.tool()
+@idempotency.idempotent(key_arg="order_id")
+@tool_executor.limit(max_concurrency=8)
 def refund(amount: float, order_id: str, reason: str = "Customer request") -> dict[str, Any]:
     """
     Process a refund for an order.
@@ -54,12 +122,14 @@ def refund(amount: float, order_id: str, reason: str = "Customer request") -> di
         "reason": reason,
         "message": f"Refund of ${amount} for order {order_id} has been processed successfully."
     }
+    order_cache.invalidate(order_id)
 
     logger.info(f"Refund result: {json.dumps(result)}")
     return result
 
 
 @mcp.tool()
+@tool_executor.limit(max_concurrency=32)
 def get_order(order_id: str) -> dict[str, Any]:
     """
     Get order details by order ID.
@@ -72,22 +142,16 @@ def get_order(order_id: str) -> dict[str, Any]:
     """
     logger.info(f"Getting order: order_id={order_id}")
 
-    # Simulate order lookup
-    result = {
-        "order_id": order_id,
-        "status": "delivered",
-        "total": 150.00,
-        "items": [
-            {"name": "Widget A", "quantity": 2, "price": 50.00},
-            {"name": "Widget B", "quantity": 1, "price": 50.00}
-        ],
-        "customer": "customer-123"
-    }
+    result = order_cache.get(order_id)
+    if result is None:
+        return {"order_id": order_id, "status": "not_found", "message": f"Order {order_id} was not found."}
 
     return result
 
 
 @mcp.tool()
+@idempotency.idempotent(key_arg="claim_id")
+@tool_executor.limit(max_concurrency=8)
 def approve_claim(claim_id: str, amount: float, risk_level: str = "low") -> dict[str, Any]:
     """
     Approve an insurance claim.
@@ -113,13 +177,71 @@ def approve_claim(claim_id: str, amount: float, risk_level: str = "low") -> dict
     return result
 
 
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics(request: Request) -> JSONResponse:
+    """Per-tool queue depth, concurrency and timing, and cache counters for this worker process."""
+    return JSONResponse({
+        **tool_executor.metrics(),
+        "idempotency": idempotency.metrics(),
+        "order_cache": order_cache.metrics(),
+    })
+
+
+def create_app():
+    """ASGI application factory; each worker process builds its own app and loads its orders."""
+    init_orders()
+    return mcp.streamable_http_app()
+
+
+def resolve_workers(value: str | int | None) -> int:
+    """Parse a worker count setting: a positive integer or "auto" (CPU cores)."""
+    if value is None or value == "":
+        return 1
+    if str(value).lower() == "auto":
+        return os.cpu_count() or 1
+    workers = int(value)
+    if workers < 1:
+        raise ValueError(f"Worker count must be positive: {value}")
+    return workers
+
+
+def serve(workers: int = 1) -> None:
+    """Run the server with one process, or pre-fork `workers` processes on one socket."""
+    if workers == 1:
+        init_orders()
+        # Run the server with streamable-http transport
+        mcp.run(transport="streamable-http")
+        return
+
+    import uvicorn
+
+    uvicorn.run(
+        "mcp_server:create_app",
+        factory=True,
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        workers=workers,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_SECONDS,
+        log_level=mcp.settings.log_level.lower(),
+    )
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Refund MCP Server")
+    parser.add_argument("--workers", type=str, default=os.environ.get(WORKERS_ENV),
+                        help=f"Worker processes, or 'auto' for one per CPU core (env: {WORKERS_ENV}, default: 1)")
+    parser.add_argument("--port", type=int, default=mcp.settings.port)
+    args = parser.parse_args()
+
+    workers = resolve_workers(args.workers)
+    mcp.settings.port = args.port
+
     print("=" * 60)
     print("Starting Refund MCP Server")
     print("=" * 60)
-    print(f"Server URL: http://0.0.0.0:8000/mcp")
+    print(f"Server URL: http://{mcp.settings.host}:{mcp.settings.port}/mcp")
     print(f"Available tools: refund, get_order, approve_claim")
+    print(f"Workers: {workers}")
     print("=" * 60)
 
-    # Run the server with streamable-http transport
-    mcp.run(transport="streamable-http")
+    serve(workers)
@@ -0,0 +1,233 @@
+"""
+Order repositories for the refund MCP server.
+
+`get_order` reads orders through an OrderRepository, so the backend can be
+swapped without touching the tool:
+
+- StaticOrderRepository: the tutorial fixture, returned for any order ID (default)
+- InMemoryOrderStore: orders loaded from a JSONL or CSV fixture, with a hash
+  index on order_id and a secondary index on customer
+
+Fixtures are parsed by streaming over a memory-mapped file, and each order is
+kept as a compact __slots__ record with interned status/customer strings and
+shared line-item tuples, so millions of rows load without holding the file
+text or per-row dicts.
+
+Usage:
+    python order_store.py generate orders.jsonl [--rows 1000000] [--customers 50000]
+    python order_store.py bench orders.jsonl [--lookups 200000]
+
+Set MCP_ORDER_FIXTURE=orders.jsonl when starting mcp_server.py to serve it.
+"""
+
+import argparse
+import csv
+import json
+import mmap
+import random
+import sys
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Line items repeat heavily across orders; share one tuple per distinct item
+_ITEMS: Dict[Tuple[str, int, float], Tuple[str, int, float]] = {}
+
+
+def _shared_item(item: Dict[str, Any]) -> Tuple[str, int, float]:
+    key = (str(item["name"]), int(item["quantity"]), float(item["price"]))
+    return _ITEMS.setdefault(key, key)
+
+
+class OrderRecord:
+    """Compact order row; items are (name, quantity, price) tuples."""
+
+    __slots__ = ("order_id", "status", "total", "customer", "items")
+
+    def __init__(self, order_id: str, status: str, total: float, customer: str,
+                 items: Tuple[Tuple[str, int, float], ...]):
+        self.order_id = order_id
+        self.status = status
+        self.total = total
+        self.customer = customer
+        self.items = items
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "OrderRecord":
+        items = tuple(_shared_item(item) for item in data.get("items") or ())
+        return cls(
+            str(data["order_id"]),
+            sys.intern(str(data.get("status", "unknown"))),
+            float(data.get("total", 0.0)),
+            sys.intern(str(data.get("customer", ""))),
+            items,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "order_id": self.order_id,
+            "status": self.status,
+            "total": self.total,
+            "items": [{"name": name, "quantity": quantity, "price": price}
+                      for name, quantity, price in self.items],
+            "customer": self.customer,
+        }
+
+
+class OrderRepository(ABC):
+    """Interface for order lookups used by the MCP tools."""
+
+    @abstractmethod
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """Return the order as a dict, or None if it does not exist."""
+
+    @abstractmethod
+    def find_by_customer(self, customer: str) -> List[Dict[str, Any]]:
+        """Return all orders of a customer."""
+
+
+class StaticOrderRepository(OrderRepository):
+    """Returns the tutorial fixture for any order ID."""
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        return {
+            "order_id": order_id,
+            "status": "delivered",
+            "total": 150.00,
+            "items": [
+                {"name": "Widget A", "quantity": 2, "price": 50.00},
+                {"name": "Widget B", "quantity": 1, "price": 50.00}
+            ],
+            "customer": "customer-123"
+        }
+
+    def find_by_customer(self, customer: str) -> List[Dict[str, Any]]:
+        return []
+
+
+class InMemoryOrderStore(OrderRepository):
+    """
+    Orders indexed by order_id (hash map) and by customer.
+
+    Example:
+        >>> store = InMemoryOrderStore.from_file("orders.jsonl")
+        >>> store.get("order-42")
+        >>> store.find_by_customer("customer-7")
+    """
+
+    def __init__(self):
+        self._orders: Dict[str, OrderRecord] = {}
+        self._by_customer: Dict[str, List[OrderRecord]] = {}
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def add(self, record: OrderRecord) -> None:
+        previous = self._orders.get(record.order_id)
+        if previous is not None:
+            self._by_customer[previous.customer].remove(previous)
+        self._orders[record.order_id] = record
+        self._by_customer.setdefault(record.customer, []).append(record)
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        record = self._orders.get(order_id)
+        return record.to_dict() if record is not None else None
+
+    def find_by_customer(self, customer: str) -> List[Dict[str, Any]]:
+        return [record.to_dict() for record in self._by_customer.get(customer, ())]
+
+    @classmethod
+    def from_file(cls, path: str) -> "InMemoryOrderStore":
+        """Load a .jsonl or .csv fixture (see iter_jsonl_orders / iter_csv_orders)."""
+        store = cls()
+        loader = iter_csv_orders if Path(path).suffix.lower() == ".csv" else iter_jsonl_orders
+        for record in loader(path):
+            store.add(record)
+        return store
+
+
+def _iter_mapped_lines(path: str) -> Iterator[bytes]:
+    """Yield the lines of a file through a read-only memory map."""
+    with open(path, "rb") as f:
+        if Path(path).stat().st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for line in iter(mapped.readline, b""):
+                yield line
+
+
+def iter_jsonl_orders(path: str) -> Iterator[OrderRecord]:
+    """Parse one JSON order object per line."""
+    for line in _iter_mapped_lines(path):
+        line = line.strip()
+        if line:
+            yield OrderRecord.from_dict(json.loads(line))
+
+
+def iter_csv_orders(path: str) -> Iterator[OrderRecord]:
+    """
+    Parse a CSV fixture with a header row: order_id,status,total,customer,items
+    where `items` is a JSON array of {name, quantity, price}.
+    """
+    lines = (line.decode("utf-8") for line in _iter_mapped_lines(path))
+    for row in csv.DictReader(lines):
+        row["items"] = json.loads(row["items"]) if row.get("items") else []
+        yield OrderRecord.from_dict(row)
+
+
+def generate_fixture(path: str, rows: int, customers: int, seed: int = 0) -> None:
+    """Write a synthetic JSONL order fixture for load testing."""
+    rng = random.Random(seed)
+    statuses = ["pending", "shipped", "delivered", "returned", "cancelled"]
+    products = [(f"Widget {chr(65 + i)}", 10.0 * (i + 1)) for i in range(20)]
+    with open(path, "w", encoding="utf-8") as f:
+        for index in range(rows):
+            items = [
+                {"name": name, "quantity": rng.randint(1, 3), "price": price}
+                for name, price in rng.sample(products, rng.randint(1, 4))
+            ]
+            order = {
+                "order_id": f"order-{index}",
+                "status": rng.choice(statuses),
+                "total": round(sum(item["quantity"] * item["price"] for item in items), 2),
+                "items": items,
+                "customer": f"customer-{rng.randrange(customers)}",
+            }
+            f.write(json.dumps(order, separators=(",", ":")) + "\n")
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Order fixture tools")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    generate = subparsers.add_parser("generate", help="Write a synthetic JSONL fixture")
+    generate.add_argument("path")
+    generate.add_argument("--rows", type=int, default=1_000_000)
+    generate.add_argument("--customers", type=int, default=50_000)
+    bench = subparsers.add_parser("bench", help="Load a fixture and time lookups")
+    bench.add_argument("path")
+    bench.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    if args.command == "generate":
+        start = time.perf_counter()
+        generate_fixture(args.path, args.rows, args.customers)
+        print(f"✓ Wrote {args.rows:,} orders to {args.path} in {time.perf_counter() - start:.1f}s")
+        return 0
+
+    start = time.perf_counter()
+    store = InMemoryOrderStore.from_file(args.path)
+    print(f"✓ Loaded {len(store):,} orders in {time.perf_counter() - start:.1f}s")
+
+    order_ids = [f"order-{random.randrange(len(store))}" for _ in range(args.lookups)]
+    start = time.perf_counter()
+    for order_id in order_ids:
+        store.get(order_id)
+    elapsed = time.perf_counter() - start
+    print(f"  get(): {elapsed / len(order_ids) * 1e6:.2f}µs mean over {len(order_ids):,} lookups")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""
+Result caching for MCP tool handlers.
+
+- LRUCache: a size-bounded, TTL-expiring LRU map with hit/miss/eviction counters
+- ReadThroughCache: an LRUCache in front of a lookup function, which also caches
+  "not found" answers (for a shorter TTL) and can be invalidated per key
+- IdempotencyCache: makes a tool idempotent under agent retries. Calls are keyed
+  on (tool, business ID, hash of all arguments); a duplicate within the TTL gets
+  the stored result, and duplicates that arrive while the first call is still
+  running wait for it instead of executing again.
+
+Caches live in the worker process, so with --workers > 1 a retry that lands on
+another worker is not deduplicated.
+"""
+
+import asyncio
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 10_000
+DEFAULT_TTL_SECONDS = 600.0
+
+_MISSING = object()
+
+
+class LRUCache:
+    """
+    Size-bounded LRU map whose entries expire `ttl` seconds after being stored.
+
+    Thread-safe, so sync tools running in the tool thread pool can share it with
+    async tools on the event loop.
+
+    Args:
+        max_entries: Entries kept before the least recently used one is evicted
+        ttl: Seconds an entry stays valid (None = no expiry)
+
+    Example:
+        >>> cache = LRUCache(max_entries=1000, ttl=60)
+        >>> cache.set("order-1", order)
+        >>> cache.get("order-1")
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: Optional[float] = DEFAULT_TTL_SECONDS):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive: {max_entries}")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the live value for `key` (marking it recently used), else `default`."""
+        value = self.peek(key, _MISSING)
+        if value is _MISSING:
+            self.misses += 1
+            return default
+        self.hits += 1
+        return value
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """Like get(), but not counted as a hit or miss (callers keep their own counters)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    return value
+                del self._entries[key]
+                self.expirations += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store `value`, evicting the least recently used entries beyond max_entries.
+
+        `ttl` overrides the cache-wide TTL for this entry.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> bool:
+        """Drop `key`; returns whether it was cached."""
+        with self._lock:
+            return self._entries.pop(key, _MISSING) is not _MISSING
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class ReadThroughCache:
+    """
+    Caches the results of `loader(key)`, including "not found" (None) results.
+
+    Each get() returns a copy of the cached value, so callers may modify it.
+    `hit_ratio` counts only found values served from the cache; cached
+    "not found" answers are reported separately as `negative_hits`.
+
+    Args:
+        loader: Lookup function returning the value, or None if the key does not exist
+        max_entries: Entries kept before LRU eviction
+        ttl: Seconds a found value is served from the cache
+        negative_ttl: Seconds a "not found" answer is served from the cache
+        copy: Function applied to values returned to callers
+
+    Example:
+        >>> order_cache = ReadThroughCache(orders.get, max_entries=10_000, ttl=30, negative_ttl=5)
+        >>> order_cache.get("order-42")         # loads and caches
+        >>> order_cache.invalidate("order-42")  # after the order changes
+    """
+
+    def __init__(self, loader: Callable[[Hashable], Optional[Any]], max_entries: int = DEFAULT_MAX_ENTRIES,
+                 ttl: float = 30.0, negative_ttl: float = 5.0, copy: Callable[[Any], Any] = copy.deepcopy):
+        self.loader = loader
+        self.negative_ttl = negative_ttl
+        self.copy = copy
+        self.entries = LRUCache(max_entries=max_entries, ttl=ttl)
+        # Guards the counters; get() is called from tool pool threads
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        value = self.entries.peek(key, _MISSING)
+        if value is None:
+            with self._lock:
+                self.negative_hits += 1
+            return None
+        if value is not _MISSING:
+            with self._lock:
+                self.hits += 1
+            return self.copy(value)
+
+        with self._lock:
+            self.misses += 1
+        value = self.loader(key)
+        self.entries.set(key, value, ttl=self.negative_ttl if value is None else None)
+        return self.copy(value) if value is not None else None
+
+    def invalidate(self, key: Hashable) -> None:
+        if self.entries.delete(key):
+            with self._lock:
+                self.invalidations += 1
+
+    def metrics(self) -> Dict[str, Any]:
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            **self.entries.metrics(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "negative_ttl_seconds": self.negative_ttl,
+            "negative_hits": self.negative_hits,
+            "negative_hit_ratio": self.negative_hits / lookups if lookups else 0.0,
+            "invalidations": self.invalidations,
+        }
+
+
+def arguments_hash(arguments: Dict[str, Any]) -> str:
+    """Stable SHA-256 of a tool's arguments (key order does not matter)."""
+    canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class IdempotencyCache:
+    """
+    Deduplicates repeated calls of side-effecting tools.
+
+    Only successful results are stored; if the call raises, the error is passed
+    to the callers waiting on it and the next retry executes again. Cancelling
+    a caller (client disconnect, timeout) does not cancel the execution: it
+    finishes in the background, and retries wait for and reuse its result.
+
+    Args:
+        max_entries: Stored results kept before LRU eviction
+        ttl: Seconds a stored result is returned for duplicates
+
+    Example:
+        >>> idempotency = IdempotencyCache(max_entries=10_000, ttl=600)
+        >>> @mcp.tool()
+        ... @idempotency.idempotent(key_arg="order_id")
+        ... @tool_executor.limit(max_concurrency=8)
+        ... def refund(amount: float, order_id: str) -> dict:
+        ...     return payments_api.refund(order_id, amount)
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl: float = DEFAULT_TTL_SECONDS):
+        self.results = LRUCache(max_entries=max_entries, ttl=ttl)
+        self._in_flight: Dict[Tuple[str, str, str], asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    def wrap(self, func: Callable[..., Any], key_arg: str) -> Callable[..., Any]:
+        """
+        Return an async version of `func` that executes once per distinct call.
+
+        The wrapper keeps `func`'s name, docstring and signature, so FastMCP builds
+        the same tool schema as for the undecorated function.
+        """
+        name = func.__name__
+        signature = inspect.signature(func)
+        is_async = inspect.iscoroutinefunction(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (name, str(bound.arguments[key_arg]), arguments_hash(bound.arguments))
+
+            cached = self.results.get(key, _MISSING)
+            if cached is not _MISSING:
+                return cached
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is not None:
+                self.coalesced += 1
+                # shield: a cancelled duplicate must not cancel the shared execution
+                return await asyncio.shield(in_flight)
+
+            async def execute():
+                return await func(*args, **kwargs) if is_async else func(*args, **kwargs)
+
+            # The execution runs as its own task and stays in flight until it
+            # finishes, even if the caller that started it is cancelled, so a
+            # retry waits for (or reuses) its result instead of running it again
+            task = asyncio.ensure_future(execute())
+            self._in_flight[key] = task
+            self.executions += 1
+
+            def on_done(done: asyncio.Task) -> None:
+                del self._in_flight[key]
+                # exception() also marks a failure as retrieved when nobody awaits it
+                if not done.cancelled() and done.exception() is None:
+                    self.results.set(key, done.result())
+
+            task.add_done_callback(on_done)
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    def idempotent(self, key_arg: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator form of wrap(); apply it below `@mcp.tool()`."""
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return self.wrap(func, key_arg)
+        return decorator
+
+    def metrics(self) -> Dict[str, Any]:
+        """Stored-result cache counters plus execution and coalescing counts."""
+        return {
+            **self.results.metrics(),
+            "in_flight": len(self._in_flight),
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+        }
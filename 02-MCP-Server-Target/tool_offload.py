@@ -0,0 +1,164 @@
+"""
+Bounded execution for MCP tool handlers.
+
+FastMCP calls a plain `def` tool directly on the event loop, so a tool that
+blocks on a database or payments API stalls every other request in the worker.
+ToolExecutor wraps tools so that:
+
+- `async def` tools run natively on the event loop,
+- sync tools run in a shared, bounded thread pool,
+- each tool has its own concurrency limit, so a slow backend only queues calls
+  to its own tool instead of occupying every thread,
+- per-tool queue depth, wait time and run time are recorded for /metrics.
+"""
+
+import asyncio
+import functools
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_TOOL_CONCURRENCY = 8
+
+
+class _ToolStats:
+    __slots__ = ("queued", "running", "max_queued", "calls", "errors", "cancelled",
+                 "wait_seconds", "run_seconds")
+
+    def __init__(self):
+        self.queued = 0
+        self.running = 0
+        self.max_queued = 0
+        self.calls = 0
+        self.errors = 0
+        self.cancelled = 0
+        self.wait_seconds = 0.0
+        self.run_seconds = 0.0
+
+    def snapshot(self, limit: int) -> Dict[str, Any]:
+        return {
+            "concurrency_limit": limit,
+            "queued": self.queued,
+            "running": self.running,
+            "max_queued": self.max_queued,
+            "calls": self.calls,
+            "errors": self.errors,
+            "cancelled": self.cancelled,
+            "avg_wait_ms": self.wait_seconds / self.calls * 1000 if self.calls else 0.0,
+            "avg_run_ms": self.run_seconds / self.calls * 1000 if self.calls else 0.0,
+        }
+
+
+class ToolExecutor:
+    """
+    Runs MCP tool handlers with per-tool concurrency limits.
+
+    Args:
+        max_workers: Threads shared by all sync tools
+        default_concurrency: Per-tool limit when wrap() is not given one
+
+    Example:
+        >>> executor = ToolExecutor(max_workers=32)
+        >>> @mcp.tool()
+        ... @executor.limit(max_concurrency=4)
+        ... def refund(amount: float, order_id: str) -> dict:
+        ...     return payments_api.refund(order_id, amount)  # blocking call, runs in a thread
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS,
+                 default_concurrency: int = DEFAULT_TOOL_CONCURRENCY):
+        self.max_workers = max_workers
+        self.default_concurrency = default_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="mcp-tool")
+        self._stats: Dict[str, _ToolStats] = {}
+        self._limits: Dict[str, int] = {}
+
+    def wrap(self, func: Callable[..., Any], max_concurrency: Optional[int] = None) -> Callable[..., Any]:
+        """
+        Return an async version of `func` that respects the tool's concurrency limit.
+
+        The wrapper keeps `func`'s name, docstring and signature, so FastMCP builds
+        the same tool schema as for the undecorated function.
+        """
+        name = func.__name__
+        limit = max_concurrency or self.default_concurrency
+        stats = self._stats[name] = _ToolStats()
+        self._limits[name] = limit
+        semaphore = asyncio.Semaphore(limit)
+        is_async = inspect.iscoroutinefunction(func)
+
+        def run_in_thread(enqueued: float, args, kwargs):
+            started = time.perf_counter()
+            return started - enqueued, func(*args, **kwargs)
+
+        def finish(enqueued: float, wait: float) -> None:
+            stats.running -= 1
+            stats.calls += 1
+            stats.wait_seconds += wait
+            stats.run_seconds += time.perf_counter() - enqueued - wait
+            semaphore.release()
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            enqueued = time.perf_counter()
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+            try:
+                await semaphore.acquire()
+            finally:
+                stats.queued -= 1
+
+            stats.running += 1
+            wait = time.perf_counter() - enqueued
+            if is_async:
+                try:
+                    return await func(*args, **kwargs)
+                except asyncio.CancelledError:
+                    stats.cancelled += 1
+                    raise
+                except Exception:
+                    stats.errors += 1
+                    raise
+                finally:
+                    finish(enqueued, wait)
+
+            # A pool thread cannot be interrupted, so the slot is held until the
+            # thread finishes even if the caller is cancelled first
+            def on_thread_done(future: asyncio.Future) -> None:
+                thread_wait = wait
+                if future.cancelled() or future.exception() is not None:
+                    stats.errors += 1
+                else:
+                    # Wait for sync tools also covers time queued for a pool thread
+                    thread_wait = future.result()[0]
+                finish(enqueued, thread_wait)
+
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, run_in_thread, enqueued, args, kwargs)
+            future.add_done_callback(on_thread_done)
+            try:
+                _, result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                stats.cancelled += 1
+                raise
+            return result
+
+        return wrapper
+
+    def limit(self, max_concurrency: Optional[int] = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+        """Decorator form of wrap(); apply it below `@mcp.tool()`."""
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return self.wrap(func, max_concurrency)
+        return decorator
+
+    def metrics(self) -> Dict[str, Any]:
+        """Per-tool queue depth and timing, plus thread pool size."""
+        return {
+            "max_workers": self.max_workers,
+            "tools": {name: stats.snapshot(self._limits[name]) for name, stats in self._stats.items()},
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
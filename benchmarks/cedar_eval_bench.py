@@ -0,0 +1,186 @@
+"""
+Decision-latency benchmark for the local Cedar policy engine.
+
+Generates a large synthetic policy set in the style of the tutorial policies
+(department/group tags, amount limits, risk levels, forbid rules), loads it into
+common.cedar_local.LocalPolicyEngine and measures per-decision latency for
+random requests.
+
+Usage:
+    python cedar_eval_bench.py [--policies 5000] [--tools 500] [--requests 200000]
+
+Exits with status 1 when the mean is_authorized() latency exceeds --target-us
+or the p99 latency exceeds --p99-target-us, so it can run as a CI regression
+check. The p99 is taken from individually timed calls and includes GC pauses
+and timer overhead, so its target is looser than the mean target.
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path for common imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.cedar_local import LocalPolicyEngine  # noqa: E402
+
+GATEWAY_ARN = "arn:aws:bedrock-agentcore:us-east-1:123456789012:gateway/bench-gateway"
+DEPARTMENTS = ["finance", "engineering", "sales", "support", "legal"]
+GROUPS = ["admins", "team-finance", "team-ops", "auditors"]
+RISK_LEVELS = ["low", "medium", "high", "critical"]
+
+POLICY_TEMPLATES = [
+    '''permit(principal,
+    action == AgentCore::Action::"{tool}",
+    resource == AgentCore::Gateway::"{arn}")
+when {{
+    principal.hasTag("department_name") &&
+    principal.getTag("department_name") == "{department}" &&
+    context.input.amount <= {limit}
+}};''',
+    '''permit(principal,
+    action == AgentCore::Action::"{tool}",
+    resource == AgentCore::Gateway::"{arn}")
+when {{
+    principal.hasTag("groups") &&
+    principal.getTag("groups") like "*{group}*"
+}};''',
+    '''permit(principal,
+    action == AgentCore::Action::"{tool}",
+    resource == AgentCore::Gateway::"{arn}")
+when {{
+    context.input has risk_level &&
+    (context.input.risk_level == "low" || context.input.risk_level == "medium")
+}};''',
+    '''forbid(principal,
+    action == AgentCore::Action::"{tool}",
+    resource == AgentCore::Gateway::"{arn}")
+when {{
+    context.input.amount > {limit}
+}};''',
+    '''forbid(principal,
+    action == AgentCore::Action::"{tool}",
+    resource == AgentCore::Gateway::"{arn}")
+when {{
+    context.input has claim_id && context.input.claim_id like "*FRAUD*"
+}};''',
+]
+
+
+def generate_policies(count: int, tools: int, rng: random.Random) -> Dict[str, str]:
+    """Generate `count` policies spread evenly over `tools` tool actions."""
+    policies = {}
+    for index in range(count):
+        template = POLICY_TEMPLATES[index % len(POLICY_TEMPLATES)]
+        policies[f"policy-{index:05d}"] = template.format(
+            tool=f"Target{index % tools:04d}___tool",
+            arn=GATEWAY_ARN,
+            department=rng.choice(DEPARTMENTS),
+            group=rng.choice(GROUPS),
+            limit=rng.choice([100, 500, 1000, 5000, 10000]),
+        )
+    return policies
+
+
+def generate_requests(count: int, tools: int, rng: random.Random) -> List[Dict[str, Any]]:
+    """Generate random requests with JWT-style claims and tool arguments."""
+    requests = []
+    for _ in range(count):
+        claims = {"department_name": rng.choice(DEPARTMENTS)}
+        if rng.random() < 0.5:
+            claims["groups"] = ",".join(rng.sample(GROUPS, 2))
+        arguments = {"amount": rng.randint(1, 20000), "risk_level": rng.choice(RISK_LEVELS)}
+        if rng.random() < 0.3:
+            arguments["claim_id"] = rng.choice(["AUTO-1", "FRAUD-7", "CLM-2"])
+        requests.append({
+            "action": f"Target{rng.randrange(tools):04d}___tool",
+            "resource": GATEWAY_ARN,
+            "principal_tags": claims,
+            "context_input": arguments,
+        })
+    return requests
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Local Cedar policy engine decision benchmark")
+    parser.add_argument("--policies", type=int, default=5000)
+    parser.add_argument("--tools", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=200000)
+    parser.add_argument("--target-us", type=float, default=10.0,
+                        help="Fail if the mean is_authorized() latency exceeds this")
+    parser.add_argument("--p99-target-us", type=float, default=50.0,
+                        help="Fail if the p99 is_authorized() latency exceeds this")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+
+    print("\n🚀 Local Cedar engine benchmark")
+    print("=" * 60)
+
+    policies = generate_policies(args.policies, args.tools, rng)
+    start = time.perf_counter()
+    engine = LocalPolicyEngine(policies)
+    load_seconds = time.perf_counter() - start
+    print(f"  Policies: {len(engine.policies)} over {args.tools} tools")
+    print(f"  Parse + compile + index: {load_seconds:.2f}s")
+
+    requests = generate_requests(args.requests, args.tools, rng)
+    candidates = [engine.candidate_count(r["action"], r["resource"]) for r in requests[:1000]]
+    print(f"  Candidate policies per request: {sum(candidates) / len(candidates):.1f} "
+          f"(of {len(engine.policies)})")
+
+    is_authorized = engine.is_authorized
+    for request in requests[:1000]:
+        is_authorized(**request)
+
+    # Throughput: tight loop over all requests
+    start = time.perf_counter()
+    allowed = 0
+    for request in requests:
+        if is_authorized(**request) == "ALLOWED":
+            allowed += 1
+    elapsed = time.perf_counter() - start
+    mean_us = elapsed / len(requests) * 1e6
+
+    # Latency distribution: time each call individually
+    samples = []
+    clock = time.perf_counter_ns
+    for request in requests[:50000]:
+        begin = clock()
+        is_authorized(**request)
+        samples.append((clock() - begin) / 1000)
+    samples.sort()
+
+    print("-" * 60)
+    print(f"  Decisions: {len(requests)} ({allowed} allowed)")
+    print(f"  Throughput: {len(requests) / elapsed:,.0f} decisions/s")
+    p99_us = percentile(samples, 99)
+    print(f"  Mean: {mean_us:.2f}µs  p50: {percentile(samples, 50):.2f}µs  "
+          f"p99: {p99_us:.2f}µs  p99.9: {percentile(samples, 99.9):.2f}µs")
+    print("=" * 60)
+
+    failed = False
+    if mean_us > args.target_us:
+        print(f"✗ Mean decision latency {mean_us:.2f}µs exceeds target {args.target_us}µs")
+        failed = True
+    else:
+        print(f"✓ Mean decision latency within {args.target_us}µs target")
+    if p99_us > args.p99_target_us:
+        print(f"✗ p99 decision latency {p99_us:.2f}µs exceeds target {args.p99_target_us}µs")
+        failed = True
+    else:
+        print(f"✓ p99 decision latency within {args.p99_target_us}µs target")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,342 @@
+"""
+Load test and latency benchmark for AgentCore Gateway policy enforcement.
+
+Drives make_gateway_request from a pool of worker threads for a fixed duration
+and reports throughput plus latency percentiles split by outcome
+(ALLOWED / DENIED / ERROR, as classified by analyze_response).
+
+Usage:
+    # Against the gateway created by 01-Lambda-Target/setup-gateway.py
+    python gateway_load_test.py --config ../01-Lambda-Target/gateway_config.json
+
+    # Against a local stand-in gateway (no AWS required)
+    python gateway_load_test.py --local --concurrency 32 --duration 20
+
+    # Save results and compare with a previous run
+    python gateway_load_test.py --local --output run2.json --baseline run1.json
+
+Options:
+    --config PATH        gateway_config.json with gateway_url and client_info
+    --gateway-url URL    Gateway MCP endpoint (overrides --config)
+    --local              Start a local stand-in gateway and target it
+    --local-policy PATH  Cedar policy file enforced by the local stand-in
+    --mix PATH           JSON list of {"tool", "arguments", "weight"} entries
+    --concurrency N      Number of concurrent worker threads
+    --duration SECONDS   Measurement duration
+    --output PATH        Write results as JSON
+    --baseline PATH      Compare against a previous JSON result
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path for common imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.auth_utils import (  # noqa: E402
+    TokenCache,
+    analyze_response,
+    get_bearer_token,
+    make_gateway_request,
+)
+from common.cedar_local import LocalPolicyEngine  # noqa: E402
+from common.http_session import PooledSession  # noqa: E402
+
+from local_gateway import (  # noqa: E402
+    LOCAL_GATEWAY_ARN,
+    amount_limit_decision,
+    cedar_decision,
+    start_local_gateway,
+)
+
+OUTCOMES = ("ALLOWED", "DENIED", "ERROR")
+PERCENTILES = (50, 90, 99, 99.9)
+
+# Default tool/argument mix: one call under and one over the $1000 tutorial limit
+DEFAULT_MIX = [
+    {"tool": "RefundToolTarget___refund",
+     "arguments": {"amount": 500, "orderId": "bench-allow"}, "weight": 1},
+    {"tool": "RefundToolTarget___refund",
+     "arguments": {"amount": 5000, "orderId": "bench-deny"}, "weight": 1},
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize_latencies(latencies_ms: List[float]) -> Dict[str, Any]:
+    """Build count/mean/max and percentile statistics for one outcome."""
+    values = sorted(latencies_ms)
+    summary = {
+        "count": len(values),
+        "mean_ms": sum(values) / len(values) if values else 0.0,
+        "max_ms": values[-1] if values else 0.0,
+    }
+    for pct in PERCENTILES:
+        summary[f"p{pct:g}_ms"] = percentile(values, pct)
+    return summary
+
+
+def load_mix(path: Optional[str]) -> List[Dict[str, Any]]:
+    """Load the tool/argument mix from a JSON file, or return the default mix."""
+    if not path:
+        return DEFAULT_MIX
+    with open(path, "r", encoding="utf-8") as f:
+        mix = json.load(f)
+    for entry in mix:
+        entry.setdefault("arguments", {})
+        entry.setdefault("weight", 1)
+    return mix
+
+
+def run_load_test(
+    gateway_url: str,
+    token_provider,
+    mix: List[Dict[str, Any]],
+    concurrency: int,
+    duration: float,
+    warmup: float = 0.0,
+    seed: int = 0
+) -> Dict[str, Any]:
+    """
+    Run worker threads against the gateway and collect per-outcome latencies.
+
+    Args:
+        gateway_url: Gateway MCP endpoint URL
+        token_provider: Zero-argument callable returning a bearer token
+        mix: Weighted list of tool calls to issue
+        concurrency: Number of worker threads
+        duration: Measurement duration (seconds)
+        warmup: Warm-up duration excluded from results (seconds)
+        seed: Random seed for the call mix
+
+    Returns:
+        Result dictionary with throughput and latency statistics
+    """
+    # Retries would hide server latency, so the benchmark session never retries
+    session = PooledSession(pool_maxsize=concurrency, max_retries=0)
+    weights = [entry["weight"] for entry in mix]
+    start_barrier = threading.Barrier(concurrency + 1)
+    samples: List[List[Tuple[str, float]]] = [[] for _ in range(concurrency)]
+    measure_start = 0.0
+    measure_end = 0.0
+
+    def worker(index: int) -> None:
+        rng = random.Random(seed + index)
+        local = samples[index]
+        start_barrier.wait()
+        while True:
+            now = time.perf_counter()
+            if now >= measure_end:
+                return
+            entry = rng.choices(mix, weights=weights)[0]
+            start = time.perf_counter()
+            try:
+                result = make_gateway_request(
+                    gateway_url, token_provider(), entry["tool"], entry["arguments"], session
+                )
+                outcome = analyze_response(result)
+            except Exception:
+                outcome = "ERROR"
+            end = time.perf_counter()
+            if start >= measure_start:
+                local.append((outcome if outcome in OUTCOMES else "ERROR", (end - start) * 1000))
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(concurrency)]
+    for thread in threads:
+        thread.start()
+
+    measure_start = time.perf_counter() + warmup
+    measure_end = measure_start + duration
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - measure_start
+    session.close()
+
+    by_outcome: Dict[str, List[float]] = {outcome: [] for outcome in OUTCOMES}
+    for local in samples:
+        for outcome, latency_ms in local:
+            by_outcome[outcome].append(latency_ms)
+    all_latencies = [latency for values in by_outcome.values() for latency in values]
+
+    return {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "gateway_url": gateway_url,
+            "concurrency": concurrency,
+            "duration_s": duration,
+            "warmup_s": warmup,
+            "mix": mix,
+        },
+        "total_requests": len(all_latencies),
+        "elapsed_s": elapsed,
+        "throughput_rps": len(all_latencies) / elapsed if elapsed > 0 else 0.0,
+        "overall": summarize_latencies(all_latencies),
+        "outcomes": {outcome: summarize_latencies(values) for outcome, values in by_outcome.items()},
+    }
+
+
+def print_report(result: Dict[str, Any]) -> None:
+    """Print a throughput/latency table."""
+    print("\n" + "=" * 78)
+    print("Gateway Load Test Results")
+    print("=" * 78)
+    print(f"Requests: {result['total_requests']}  "
+          f"Elapsed: {result['elapsed_s']:.1f}s  "
+          f"Throughput: {result['throughput_rps']:.1f} req/s")
+    print("-" * 78)
+    header = f"{'Outcome':<10}{'Count':>8}{'Mean':>10}" + "".join(
+        f"{'p' + format(pct, 'g'):>10}" for pct in PERCENTILES
+    ) + f"{'Max':>10}"
+    print(header + "   (ms)")
+    rows = [("ALL", result["overall"])] + list(result["outcomes"].items())
+    for name, stats in rows:
+        line = f"{name:<10}{stats['count']:>8}{stats['mean_ms']:>10.2f}"
+        line += "".join(f"{stats[f'p{pct:g}_ms']:>10.2f}" for pct in PERCENTILES)
+        line += f"{stats['max_ms']:>10.2f}"
+        print(line)
+    print("=" * 78)
+
+
+def print_comparison(result: Dict[str, Any], baseline: Dict[str, Any]) -> None:
+    """Print relative change of throughput and latency percentiles versus a baseline run."""
+
+    def delta(current: float, previous: float) -> str:
+        if not previous:
+            return "n/a"
+        return f"{(current - previous) / previous * 100:+.1f}%"
+
+    print("\nComparison with baseline")
+    print("-" * 78)
+    print(f"Throughput: {result['throughput_rps']:.1f} vs {baseline['throughput_rps']:.1f} req/s "
+          f"({delta(result['throughput_rps'], baseline['throughput_rps'])})")
+    for outcome in ("overall",) + OUTCOMES:
+        current = result["overall"] if outcome == "overall" else result["outcomes"][outcome]
+        previous = (baseline["overall"] if outcome == "overall"
+                    else baseline.get("outcomes", {}).get(outcome))
+        if not previous or not current["count"]:
+            continue
+        changes = "  ".join(
+            f"p{pct:g} {delta(current[f'p{pct:g}_ms'], previous.get(f'p{pct:g}_ms', 0))}"
+            for pct in PERCENTILES
+        )
+        print(f"  {outcome:<8} {changes}")
+
+
+def build_token_provider(args, config: Dict[str, Any]):
+    """Return a callable that yields a (cached) bearer token."""
+    if args.local:
+        return lambda: "local-benchmark-token"
+    if args.bearer_token:
+        return lambda: args.bearer_token
+
+    client_info = config.get("client_info", {})
+    token_endpoint = args.token_endpoint or client_info.get("token_endpoint")
+    client_id = args.client_id or client_info.get("client_id")
+    client_secret = args.client_secret or client_info.get("client_secret")
+    if not (token_endpoint and client_id and client_secret):
+        raise SystemExit("Token endpoint and client credentials are required (use --config)")
+
+    cache = TokenCache()
+    session = PooledSession()
+    return lambda: get_bearer_token(
+        token_endpoint, client_id, client_secret, args.scope, cache=cache, session=session
+    )
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="AgentCore Gateway policy enforcement load test")
+    parser.add_argument("--config", type=str, default=None,
+                        help="gateway_config.json with gateway_url and client_info")
+    parser.add_argument("--gateway-url", type=str, default=None)
+    parser.add_argument("--token-endpoint", type=str, default=None)
+    parser.add_argument("--client-id", type=str, default=None)
+    parser.add_argument("--client-secret", type=str, default=None)
+    parser.add_argument("--scope", type=str, default="")
+    parser.add_argument("--bearer-token", type=str, default=None,
+                        help="Use a fixed bearer token instead of client credentials")
+    parser.add_argument("--local", action="store_true",
+                        help="Start a local stand-in gateway and target it")
+    parser.add_argument("--local-policy", type=str, default=None,
+                        help="Cedar policy file enforced by the local stand-in "
+                             f"(resource {LOCAL_GATEWAY_ARN})")
+    parser.add_argument("--local-latency-ms", type=float, default=0.0,
+                        help="Artificial delay added by the local stand-in")
+    parser.add_argument("--mix", type=str, default=None,
+                        help='JSON list of {"tool", "arguments", "weight"} entries')
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=str, default=None, help="Write results as JSON")
+    parser.add_argument("--baseline", type=str, default=None,
+                        help="Previous JSON result to compare against")
+    args = parser.parse_args(argv)
+
+    config: Dict[str, Any] = {}
+    if args.config:
+        with open(args.config, "r", encoding="utf-8") as f:
+            config = json.load(f)
+
+    server = None
+    if args.local:
+        if args.local_policy:
+            engine = LocalPolicyEngine([Path(args.local_policy).read_text(encoding="utf-8")])
+            decide = cedar_decision(engine)
+        else:
+            decide = amount_limit_decision(1000)
+        server, gateway_url = start_local_gateway(decide, latency_ms=args.local_latency_ms)
+    else:
+        gateway_url = args.gateway_url or config.get("gateway_url")
+        if not gateway_url:
+            parser.error("--gateway-url, --config or --local is required")
+
+    mix = load_mix(args.mix)
+    token_provider = build_token_provider(args, config)
+
+    print("\n🚀 Running gateway load test...")
+    print(f"  Gateway URL: {gateway_url}")
+    print(f"  Concurrency: {args.concurrency}")
+    print(f"  Duration: {args.duration}s (+{args.warmup}s warm-up)")
+    print(f"  Mix: {len(mix)} call type(s)")
+
+    try:
+        result = run_load_test(
+            gateway_url, token_provider, mix,
+            concurrency=args.concurrency,
+            duration=args.duration,
+            warmup=args.warmup,
+            seed=args.seed,
+        )
+    finally:
+        if server:
+            server.shutdown()
+
+    print_report(result)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            print_comparison(result, json.load(f))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
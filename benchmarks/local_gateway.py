@@ -0,0 +1,193 @@
+"""
+Local stand-in for an AgentCore Gateway MCP endpoint.
+
+Accepts JSON-RPC `tools/call` requests (single or batch) over HTTP and answers
+the way the Gateway does: a `result` when the call is allowed, or a JSON-RPC
+error with a policy-denial message when it is not. Decisions come either from a
+simple amount limit or from Cedar policies evaluated with common.cedar_local,
+using the bearer token's JWT claims as principal tags. Useful for exercising
+the load test and client code without AWS.
+
+Usage:
+    python local_gateway.py [--port PORT] [--max-amount N] [--latency-ms MS]
+    python local_gateway.py --policy-file policies.cedar [--gateway-arn ARN]
+"""
+
+import argparse
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Add parent directory to path for common imports
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.auth_utils import decode_token  # noqa: E402
+from common.cedar_local import ALLOWED, LocalPolicyEngine  # noqa: E402
+
+# decide(tool_name, arguments, claims) -> True if the call is allowed
+DecisionFunction = Callable[[str, Dict[str, Any], Dict[str, Any]], bool]
+
+DENIED_MESSAGE = "Tool call not allowed due to policy enforcement"
+LOCAL_GATEWAY_ARN = "arn:aws:bedrock-agentcore:local:000000000000:gateway/local-gateway"
+
+
+def amount_limit_decision(max_amount: float) -> DecisionFunction:
+    """Allow calls whose `amount` argument is at most `max_amount`."""
+
+    def decide(tool_name: str, arguments: Dict[str, Any], claims: Dict[str, Any]) -> bool:
+        return float(arguments.get("amount", 0)) <= max_amount
+
+    return decide
+
+
+def cedar_decision(engine: LocalPolicyEngine, gateway_arn: str = LOCAL_GATEWAY_ARN) -> DecisionFunction:
+    """Allow calls permitted by the Cedar policies loaded in `engine`."""
+
+    def decide(tool_name: str, arguments: Dict[str, Any], claims: Dict[str, Any]) -> bool:
+        return engine.is_authorized(tool_name, gateway_arn, claims, arguments) == ALLOWED
+
+    return decide
+
+
+class _GatewayHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; avoid Nagle/delayed-ACK stalls on keep-alive
+    disable_nagle_algorithm = True
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        try:
+            request = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError:
+            self._send_json(400, {"jsonrpc": "2.0", "id": None,
+                                  "error": {"code": -32700, "message": "Parse error"}})
+            return
+
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+
+        claims = self._token_claims()
+        if isinstance(request, list):
+            self._send_json(200, [self._handle_call(item, claims) for item in request])
+        else:
+            self._send_json(200, self._handle_call(request, claims))
+
+    def _token_claims(self) -> Dict[str, Any]:
+        authorization = self.headers.get("Authorization", "")
+        try:
+            return decode_token(authorization.replace("Bearer ", "", 1))
+        except ValueError:
+            return {}
+
+    def _handle_call(self, request: Dict[str, Any], claims: Dict[str, Any]) -> Dict[str, Any]:
+        request_id = request.get("id")
+        if request.get("method") != "tools/call":
+            return {"jsonrpc": "2.0", "id": request_id,
+                    "error": {"code": -32601, "message": "Method not found"}}
+
+        params = request.get("params", {})
+        tool_name = params.get("name", "")
+        arguments = params.get("arguments", {})
+
+        try:
+            allowed = self.server.decide(tool_name, arguments, claims)
+        except Exception as e:
+            return {"jsonrpc": "2.0", "id": request_id,
+                    "error": {"code": -32603, "message": f"Internal error: {e}"}}
+
+        if not allowed:
+            return {"jsonrpc": "2.0", "id": request_id,
+                    "error": {"code": -32002, "message": DENIED_MESSAGE}}
+
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": {
+                "isError": False,
+                "content": [{"type": "text", "text": json.dumps(
+                    {"tool": tool_name, "arguments": arguments, "status": "Done"}
+                )}],
+            },
+        }
+
+    def _send_json(self, status: int, body: Any) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_local_gateway(
+    decide: DecisionFunction,
+    host: str = "127.0.0.1",
+    port: int = 0,
+    latency_ms: float = 0.0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Start the stand-in gateway on a background thread.
+
+    Args:
+        decide: Function deciding whether a tool call is allowed
+        host: Bind address
+        port: Bind port (0 picks a free port)
+        latency_ms: Artificial delay added to every HTTP request
+
+    Returns:
+        (server, gateway_url) - call server.shutdown() to stop it
+    """
+    server = ThreadingHTTPServer((host, port), _GatewayHandler)
+    server.daemon_threads = True
+    server.decide = decide
+    server.latency_ms = latency_ms
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    return server, f"http://{host}:{server.server_port}/mcp"
+
+
+def main(argv: Optional[list] = None) -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for an AgentCore Gateway")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--max-amount", type=float, default=1000,
+                        help="Deny calls whose amount exceeds this value")
+    parser.add_argument("--policy-file", type=str, default=None,
+                        help="Cedar policy file to enforce instead of the amount limit")
+    parser.add_argument("--gateway-arn", type=str, default=LOCAL_GATEWAY_ARN,
+                        help="Resource ARN used when evaluating Cedar policies")
+    parser.add_argument("--latency-ms", type=float, default=0.0,
+                        help="Artificial delay added to every request")
+    args = parser.parse_args(argv)
+
+    if args.policy_file:
+        engine = LocalPolicyEngine([Path(args.policy_file).read_text(encoding="utf-8")])
+        decide = cedar_decision(engine, args.gateway_arn)
+    else:
+        decide = amount_limit_decision(args.max_amount)
+
+    server, url = start_local_gateway(
+        decide,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+    )
+    print(f"Local gateway listening on {url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
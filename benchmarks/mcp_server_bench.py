@@ -0,0 +1,166 @@
+"""
+Throughput benchmark for the refund MCP server in multi-worker mode.
+
+Starts 02-MCP-Server-Target/mcp_server.py locally with each requested worker
+count, drives concurrent JSON-RPC `tools/call` requests at its streamable-HTTP
+endpoint and reports calls/s and latency percentiles, so the scaling with
+CPU cores can be compared.
+
+Usage:
+    python mcp_server_bench.py [--workers 1,2,4] [--concurrency 64] [--duration 10]
+
+Worker counts above the number of CPU cores will not scale further.
+"""
+
+import argparse
+import asyncio
+import itertools
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+SERVER_FILE = Path(__file__).resolve().parent.parent / "02-MCP-Server-Target" / "mcp_server.py"
+MCP_HEADERS = {"Content-Type": "application/json", "Accept": "application/json, text/event-stream"}
+# Each call gets a unique order_id/claim_id, so the server's idempotency and
+# order caches do not answer repeated calls and every call executes the tool
+TOOL_CALLS = [
+    ("refund", lambda n: {"amount": 120, "order_id": f"order-{n}"}),
+    ("get_order", lambda n: {"order_id": f"order-{n}"}),
+    ("approve_claim", lambda n: {"claim_id": f"claim-{n}", "amount": 800, "risk_level": "low"}),
+]
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    rank = max(1, int(-(-pct * len(sorted_values) // 100)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def start_server(workers: int, port: int) -> subprocess.Popen:
+    """Launch the MCP server as a subprocess with `workers` worker processes."""
+    return subprocess.Popen(
+        [sys.executable, str(SERVER_FILE), "--workers", str(workers), "--port", str(port)],
+        cwd=SERVER_FILE.parent,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    payload = {"jsonrpc": "2.0", "id": 0, "method": "tools/list"}
+    async with httpx.AsyncClient(timeout=2.0) as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.post(url, json=payload, headers=MCP_HEADERS)
+                if response.status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"MCP server at {url} did not become ready")
+
+
+async def drive_load(url: str, concurrency: int, duration: float, warmup: float) -> Dict[str, Any]:
+    """Send tools/call requests from `concurrency` tasks for `duration` seconds."""
+    request_ids = itertools.count(1)
+    calls = itertools.cycle(TOOL_CALLS)
+    latencies_ms: List[float] = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=30.0, limits=limits) as client:
+        measure_from = time.monotonic() + warmup
+        stop_at = measure_from + duration
+
+        async def worker():
+            nonlocal errors
+            while True:
+                now = time.monotonic()
+                if now >= stop_at:
+                    return
+                name, make_arguments = next(calls)
+                request_id = next(request_ids)
+                payload = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "tools/call",
+                    "params": {"name": name, "arguments": make_arguments(request_id)},
+                }
+                try:
+                    response = await client.post(url, json=payload, headers=MCP_HEADERS)
+                    ok = response.status_code == 200 and '"result"' in response.text
+                except httpx.HTTPError:
+                    ok = False
+                if now < measure_from:
+                    continue
+                if ok:
+                    latencies_ms.append((time.monotonic() - now) * 1000)
+                else:
+                    errors += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+    latencies_ms.sort()
+    return {
+        "calls": len(latencies_ms),
+        "errors": errors,
+        "throughput": len(latencies_ms) / duration,
+        "p50_ms": percentile(latencies_ms, 50) if latencies_ms else 0.0,
+        "p99_ms": percentile(latencies_ms, 99) if latencies_ms else 0.0,
+    }
+
+
+def run_for_workers(workers: int, args) -> Dict[str, Any]:
+    url = f"http://127.0.0.1:{args.port}/mcp"
+    server = start_server(workers, args.port)
+    try:
+        asyncio.run(wait_until_ready(url))
+        return asyncio.run(drive_load(url, args.concurrency, args.duration, args.warmup))
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            server.kill()
+
+
+def main(argv: Optional[list] = None) -> int:
+    parser = argparse.ArgumentParser(description="Refund MCP server multi-worker throughput benchmark")
+    parser.add_argument("--workers", type=str, default=None,
+                        help="Comma-separated worker counts (default: 1,2,4,... up to CPU cores)")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--warmup", type=float, default=2.0)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args(argv)
+
+    cores = os.cpu_count() or 1
+    if args.workers:
+        worker_counts = [int(value) for value in args.workers.split(",")]
+    else:
+        worker_counts = sorted({1, *(2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores), cores})
+
+    print("\n🚀 MCP server multi-worker benchmark")
+    print("=" * 60)
+    print(f"  CPU cores: {cores}  Concurrency: {args.concurrency}  Duration: {args.duration}s")
+    print("-" * 60)
+
+    baseline = None
+    for workers in worker_counts:
+        result = run_for_workers(workers, args)
+        baseline = baseline or result["throughput"]
+        speedup = result["throughput"] / baseline if baseline else 0.0
+        print(f"  workers={workers:<3} {result['throughput']:8.0f} calls/s  x{speedup:4.2f}  "
+              f"p50 {result['p50_ms']:6.1f}ms  p99 {result['p99_ms']:6.1f}ms  errors {result['errors']}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,12 +3,29 @@ MCP Server Policy Control - Utility Scripts
 """
 
 from .auth_utils import (
+    TokenCache,
     get_bearer_token,
     decode_token,
     make_gateway_request,
+    make_gateway_batch_request,
     analyze_response,
     display_test_result,
 )
+from .aws_clients import get_client, configure_clients
+from .http_session import (
+    PooledSession,
+    get_http_session,
+    set_http_session,
+)
+from .async_gateway import AsyncGatewayClient
+from .cedar_local import (
+    LocalPolicyEngine,
+    CedarSyntaxError,
+    parse_policies,
+)
+from .cedar_batch import evaluate_batch
+from .waiter import Deadline, wait_for_status, wait_for_many
+from .async_control import AsyncControlPlane
 from .gateway_utils import (
     get_gateway_details,
     wait_for_gateway_ready,
@@ -16,24 +33,58 @@ from .gateway_utils import (
     attach_policy_engine_to_gateway,
     create_mcp_server_target,
     synchronize_gateway_targets,
+    iter_gateways,
+    iter_gateway_targets,
+    find_gateway,
+    find_gateway_target,
     list_gateway_targets,
 )
+from .resource_index import ResourceIndex
+from .task_graph import Step, run_graph
 from .policy_utils import (
     get_policy_engine,
     create_cedar_policy,
     wait_for_policy_active,
+    wait_for_policies_active,
+    apply_policies,
     delete_policy,
+    delete_policies,
+    iter_policies,
+    iter_policy_engines,
+    find_policy_engine,
     cleanup_existing_policies,
+    sync_policies,
+    cedar_statement_hash,
     ensure_policy_engine,
 )
 
 __all__ = [
     # Auth
+    "TokenCache",
     "get_bearer_token",
     "decode_token",
     "make_gateway_request",
+    "make_gateway_batch_request",
     "analyze_response",
     "display_test_result",
+    # AWS clients
+    "get_client",
+    "configure_clients",
+    # HTTP
+    "PooledSession",
+    "get_http_session",
+    "set_http_session",
+    "AsyncGatewayClient",
+    # Local Cedar evaluation
+    "LocalPolicyEngine",
+    "CedarSyntaxError",
+    "parse_policies",
+    "evaluate_batch",
+    # Waiters
+    "Deadline",
+    "wait_for_status",
+    "wait_for_many",
+    "AsyncControlPlane",
     # Gateway
     "get_gateway_details",
     "wait_for_gateway_ready",
@@ -41,12 +92,27 @@ __all__ = [
     "attach_policy_engine_to_gateway",
     "create_mcp_server_target",
     "synchronize_gateway_targets",
+    "iter_gateways",
+    "iter_gateway_targets",
+    "find_gateway",
+    "find_gateway_target",
     "list_gateway_targets",
+    "ResourceIndex",
+    "Step",
+    "run_graph",
     # Policy
     "get_policy_engine",
     "create_cedar_policy",
     "wait_for_policy_active",
+    "wait_for_policies_active",
+    "apply_policies",
     "delete_policy",
+    "delete_policies",
+    "iter_policies",
+    "iter_policy_engines",
+    "find_policy_engine",
     "cleanup_existing_policies",
+    "sync_policies",
+    "cedar_statement_hash",
     "ensure_policy_engine",
 ]
@@ -0,0 +1,237 @@
+"""
+비동기 제어 평면 모듈
+
+하나의 이벤트 루프에서 여러 Gateway의 Target 생성, Policy Engine 연결, 정책 생성을
+동시에 진행할 수 있도록 gateway_utils / policy_utils 함수를 asyncio API로 제공합니다.
+
+boto3 호출은 전용 스레드 풀에서 실행하므로 이벤트 루프를 막지 않습니다.
+상태 대기 함수는 조회만 스레드 풀에서 실행하고 조회 사이의 대기는 asyncio.sleep으로 하므로,
+수십 개의 대기가 동시에 진행되어도 대기 중에는 스레드를 점유하지 않습니다.
+"""
+
+import asyncio
+import functools
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from . import gateway_utils, policy_utils
+from .waiter import Deadline, async_wait_for_many, fetch_or_none
+
+DEFAULT_MAX_WORKERS = 16
+
+# 제어 평면 클라이언트를 첫 번째 인자로 받는 함수의 인자 이름
+_CLIENT_PARAMETERS = ("gateway_control_client", "policy_client")
+
+
+def _collect_client_functions() -> Dict[str, Callable[..., Any]]:
+    functions = {}
+    for module in (gateway_utils, policy_utils):
+        for name, func in inspect.getmembers(module, inspect.isfunction):
+            # 제너레이터(iter_*)는 다음 페이지 조회가 이벤트 루프에서 실행되므로 제외
+            if name.startswith("_") or func.__module__ != module.__name__ or inspect.isgeneratorfunction(func):
+                continue
+            parameters = list(inspect.signature(func).parameters)
+            if parameters and parameters[0] in _CLIENT_PARAMETERS:
+                functions[name] = func
+    return functions
+
+
+# 비동기로 감쌀 수 있는 함수 {이름: 함수}
+_WRAPPED = _collect_client_functions()
+
+
+class AsyncControlPlane:
+    """
+    bedrock-agentcore-control 클라이언트용 asyncio 래퍼.
+
+    gateway_utils / policy_utils의 공개 함수를 같은 이름의 코루틴으로 제공하며,
+    클라이언트 인자는 자동으로 채워집니다. boto3 클라이언트는 스레드 안전하므로
+    하나의 클라이언트를 스레드 풀 전체가 공유합니다.
+
+    wait_for_* 함수는 대기 중에 스레드를 점유하지 않는 비동기 구현을 사용합니다.
+    내부에서 상태 대기를 포함하는 함수(예: attach_policy_engine_to_gateway)는
+    대기하는 동안 스레드 하나를 사용하므로, 동시에 진행할 작업 수에 맞게
+    max_workers를 설정하세요.
+
+    Args:
+        control_client: bedrock-agentcore-control boto3 클라이언트
+        max_workers: boto3 호출을 실행할 최대 스레드 수
+
+    Example:
+        >>> async with AsyncControlPlane(control_client, max_workers=32) as control:
+        ...     targets = await asyncio.gather(*[
+        ...         control.create_mcp_server_target(gateway_id, f"{gateway_id}-target", runtime_url, provider_arn)
+        ...         for gateway_id in gateway_ids
+        ...     ])
+        ...     ready = await asyncio.gather(*[
+        ...         control.wait_for_gateway_ready(gateway_id) for gateway_id in gateway_ids
+        ...     ])
+    """
+
+    def __init__(self, control_client, max_workers: int = DEFAULT_MAX_WORKERS):
+        self.client = control_client
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agentcore-control")
+
+    async def __aenter__(self) -> "AsyncControlPlane":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """스레드 풀을 종료합니다. 실행 중인 호출은 끝날 때까지 기다립니다."""
+        self._executor.shutdown(wait=True)
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        클라이언트를 첫 번째 인자로 하여 함수를 스레드 풀에서 실행합니다.
+
+        Args:
+            func: (client, *args, **kwargs)를 받는 함수 (예: policy_utils.create_cedar_policy)
+            *args: 클라이언트 다음 위치 인자
+            **kwargs: 키워드 인자
+
+        Returns:
+            함수 반환값
+        """
+        return await self.call(func, self.client, *args, **kwargs)
+
+    async def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """임의의 블로킹 함수를 스레드 풀에서 실행합니다 (예: client.get_gateway)."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        func = _WRAPPED.get(name)
+        if func is None:
+            raise AttributeError(f"{type(self).__name__!s} has no attribute {name!r}")
+
+        async def wrapper(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+
+        wrapper.__name__ = name
+        wrapper.__doc__ = func.__doc__
+        return wrapper
+
+    def __dir__(self):
+        return sorted(set(super().__dir__()) | set(_WRAPPED))
+
+    async def _wait_for_one(self, fetch: Callable[[], Optional[Dict[str, Any]]], label: str,
+                            success_states, failure_states, timeout, deadline, max_interval,
+                            fail_if_missing: bool = False) -> Dict[str, Any]:
+        async def fetch_all(keys):
+            resource = await self.call(fetch)
+            return {key: resource for key in keys}
+
+        results = await async_wait_for_many(
+            fetch_all,
+            [label],
+            success_states,
+            failure_states,
+            timeout=timeout,
+            deadline=deadline,
+            max_interval=max_interval,
+            fail_if_missing=fail_if_missing,
+            on_status=lambda key, status: print(f"  {key} status: {status or 'NOT_FOUND'}"),
+        )
+        result = results[label]
+        if not result["ok"]:
+            detail = result["error"] or result["status"] or ""
+            print(f"  ✗ {label} wait failed: {result['reason']} {detail}".rstrip())
+        return result
+
+    async def wait_for_gateway_ready(
+        self,
+        gateway_id: str,
+        max_wait: int = 300,
+        poll_interval: int = 5,
+        deadline: Optional[Deadline] = None
+    ) -> bool:
+        """gateway_utils.wait_for_gateway_ready의 비동기 버전."""
+        result = await self._wait_for_one(
+            functools.partial(fetch_or_none, self.client.get_gateway, gatewayIdentifier=gateway_id),
+            f"Gateway {gateway_id}",
+            {"READY"}, {"FAILED", "UPDATE_UNSUCCESSFUL"},
+            max_wait, deadline, poll_interval,
+        )
+        return result["ok"]
+
+    async def wait_for_target_ready(
+        self,
+        gateway_id: str,
+        target_id: str,
+        max_wait: int = 120,
+        poll_interval: int = 5,
+        deadline: Optional[Deadline] = None
+    ) -> bool:
+        """gateway_utils.wait_for_target_ready의 비동기 버전."""
+        result = await self._wait_for_one(
+            functools.partial(fetch_or_none, self.client.get_gateway_target,
+                              gatewayIdentifier=gateway_id, targetId=target_id),
+            f"Target {gateway_id}/{target_id}",
+            {"READY"}, {"FAILED", "CREATE_FAILED"},
+            max_wait, deadline, poll_interval,
+            fail_if_missing=True,
+        )
+        return result["ok"]
+
+    async def wait_for_policy_engine_active(
+        self,
+        policy_engine_id: str,
+        timeout: int = 300,
+        deadline: Optional[Deadline] = None
+    ) -> bool:
+        """policy_utils.wait_for_policy_engine_active의 비동기 버전."""
+        result = await self._wait_for_one(
+            functools.partial(fetch_or_none, self.client.get_policy_engine, policyEngineId=policy_engine_id),
+            f"Policy Engine {policy_engine_id}",
+            {"ACTIVE"}, {"CREATE_FAILED", "UPDATE_FAILED", "DELETE_FAILED"},
+            timeout, deadline, 5,
+        )
+        return result["ok"]
+
+    async def wait_for_policy_active(
+        self,
+        policy_engine_id: str,
+        policy_id: str,
+        timeout: int = 60,
+        deadline: Optional[Deadline] = None
+    ) -> bool:
+        """policy_utils.wait_for_policy_active의 비동기 버전."""
+        result = await self._wait_for_one(
+            functools.partial(fetch_or_none, self.client.get_policy,
+                              policyEngineId=policy_engine_id, policyId=policy_id),
+            f"Policy {policy_id}",
+            {"ACTIVE"}, {"CREATE_FAILED", "UPDATE_FAILED"},
+            timeout, deadline, 3, fail_if_missing=True,
+        )
+        return result["ok"]
+
+    async def wait_for_policies_active(
+        self,
+        policy_engine_id: str,
+        policy_ids: Iterable[str],
+        timeout: int = 300,
+        deadline: Optional[Deadline] = None
+    ) -> Dict[str, bool]:
+        """policy_utils.wait_for_policies_active의 비동기 버전."""
+        def fetch_policies():
+            return {p.get("policyId"): p for p in policy_utils.iter_policies(self.client, policy_engine_id)}
+
+        async def fetch_all(ids):
+            return await self.call(fetch_policies)
+
+        results = await async_wait_for_many(
+            fetch_all,
+            policy_ids,
+            success_states={"ACTIVE"},
+            failure_states={"CREATE_FAILED", "UPDATE_FAILED"},
+            timeout=timeout,
+            deadline=deadline,
+            max_interval=3,
+        )
+        for policy_id, result in results.items():
+            if not result["ok"]:
+                print(f"  ✗ 정책 대기 실패 {policy_id}: {result['reason']}")
+        return {policy_id: result["ok"] for policy_id, result in results.items()}
@@ -0,0 +1,129 @@
+"""
+비동기 Gateway 클라이언트 모듈
+
+asyncio 기반으로 여러 `tools/call` 요청을 동시에 Gateway로 보내는 클라이언트를 제공합니다.
+"""
+
+import asyncio
+import itertools
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+import httpx
+
+from .auth_utils import analyze_response, build_gateway_headers, build_tools_call_payload
+from .http_session import DEFAULT_CONNECT_TIMEOUT, DEFAULT_READ_TIMEOUT
+
+
+class AsyncGatewayClient:
+    """
+    세마포어로 동시 요청 수를 제한하는 비동기 Gateway 클라이언트.
+
+    하나의 httpx.AsyncClient 커넥션 풀을 공유하며, 각 호출 결과에
+    응답, 판정 결과(ALLOWED/DENIED/ERROR), 지연 시간을 함께 기록합니다.
+
+    Args:
+        gateway_url: Gateway MCP 엔드포인트 URL
+        bearer_token: OAuth2 Access Token
+        max_concurrency: 동시에 처리할 최대 요청 수
+        connect_timeout: 연결 타임아웃 (초)
+        read_timeout: 응답 대기 타임아웃 (초)
+
+    Example:
+        >>> async with AsyncGatewayClient(gateway_url, token, max_concurrency=100) as client:
+        ...     results = await client.call_tools([
+        ...         ("RefundToolTarget___refund", {"amount": 500, "orderId": "o-1"}),
+        ...         ("RefundToolTarget___refund", {"amount": 5000, "orderId": "o-2"}),
+        ...     ])
+        >>> print([r["outcome"] for r in results])
+    """
+
+    def __init__(
+        self,
+        gateway_url: str,
+        bearer_token: str,
+        max_concurrency: int = 50,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT
+    ):
+        self.gateway_url = gateway_url
+        self.bearer_token = bearer_token
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._request_ids = itertools.count(1)
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+        )
+
+    async def __aenter__(self) -> "AsyncGatewayClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """커넥션 풀을 닫습니다."""
+        await self._client.aclose()
+
+    async def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        단일 `tools/call` 요청을 보냅니다.
+
+        HTTP 오류나 타임아웃은 예외로 던지지 않고 결과의 `error` 필드에 기록되므로,
+        대량 호출 중 일부 실패가 나머지 호출을 중단시키지 않습니다.
+
+        Args:
+            tool_name: 호출할 도구 이름
+            arguments: 도구 인자
+
+        Returns:
+            호출 결과 딕셔너리
+            (tool_name, arguments, response, outcome, latency_ms, error)
+        """
+        payload = build_tools_call_payload(tool_name, arguments, next(self._request_ids))
+        response: Optional[Dict[str, Any]] = None
+        error: Optional[str] = None
+
+        async with self._semaphore:
+            start = time.perf_counter()
+            try:
+                http_response = await self._client.post(
+                    self.gateway_url,
+                    headers=build_gateway_headers(self.bearer_token),
+                    json=payload,
+                )
+                http_response.raise_for_status()
+                response = http_response.json()
+            except (httpx.HTTPError, ValueError) as e:
+                error = f"{type(e).__name__}: {e}"
+            latency_ms = (time.perf_counter() - start) * 1000
+
+        return {
+            "tool_name": tool_name,
+            "arguments": arguments,
+            "response": response,
+            "outcome": analyze_response(response) if response is not None else "ERROR",
+            "latency_ms": latency_ms,
+            "error": error,
+        }
+
+    async def call_tools(
+        self,
+        calls: Iterable[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 `tools/call` 요청을 동시에 보내고 요청 순서대로 결과를 반환합니다.
+
+        Args:
+            calls: (도구 이름, 도구 인자) 튜플 목록
+
+        Returns:
+            요청 순서와 동일한 순서의 호출 결과 목록
+        """
+        return await asyncio.gather(
+            *(self.call_tool(tool_name, arguments) for tool_name, arguments in calls)
+        )
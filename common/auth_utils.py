@@ -6,16 +6,192 @@ OAuth2 토큰 발급 및 JWT 디코딩 관련 함수를 제공합니다.
 
 import json
 import base64
-from typing import Dict, Any
+import itertools
+import threading
+import time
+from typing import Dict, Any, List, Optional, Sequence, Tuple, Union
 
 import requests
 
+from .http_session import get_http_session
+
+# 프로세스 전체에서 고유한 JSON-RPC 요청 ID
+_request_ids = itertools.count(1)
+
+# 배치 요청을 거부한 Gateway URL (이후 개별 요청으로 바로 전송)
+_batch_unsupported_urls = set()
+
+# 배치(배열 본문)를 지원하지 않는 엔드포인트임을 나타내는 HTTP 상태 코드
+_BATCH_UNSUPPORTED_STATUS_CODES = {404, 405, 501}
+
+# 해당 요청만 거부된 경우 (URL은 계속 배치 대상으로 두고, 이 청크만 개별 요청으로 전송)
+_BATCH_REQUEST_REJECTED_STATUS_CODES = {400, 415, 422}
+
+# 본문이 너무 큰 경우 (청크를 반으로 나누어 재시도)
+_PAYLOAD_TOO_LARGE = 413
+
+
+class TokenCache:
+    """
+    (token_endpoint, client_id, scope) 단위로 Access Token을 캐싱합니다.
+
+    토큰 만료 시각은 JWT의 `exp` 클레임에서 읽으며, 만료 `expiry_skew`초 전까지
+    캐시된 토큰을 반환합니다. 만료가 `refresh_ahead`초 이내로 다가오면 기존 토큰을
+    그대로 반환하면서 백그라운드에서 갱신합니다. 같은 키에 대한 발급 요청은
+    동시에 하나만 수행되며(single-flight), 나머지 호출자는 그 결과를 기다립니다.
+
+    Args:
+        expiry_skew: 만료로 간주할 여유 시간 (초)
+        refresh_ahead: 백그라운드 갱신을 시작할 시점 (만료 skew 기준 몇 초 전)
+
+    Example:
+        >>> cache = TokenCache(expiry_skew=60)
+        >>> token = get_bearer_token(endpoint, client_id, secret, cache=cache)
+        >>> print(cache.stats())
+    """
+
+    def __init__(self, expiry_skew: float = 60.0, refresh_ahead: float = 300.0):
+        self.expiry_skew = expiry_skew
+        self.refresh_ahead = refresh_ahead
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+        self._inflight: Dict[Tuple[str, str, str], threading.Event] = {}
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_errors = 0
+
+    def get_token(
+        self,
+        token_endpoint: str,
+        client_id: str,
+        client_secret: str,
+        scope: str = "",
+        session: Optional[requests.Session] = None
+    ) -> str:
+        """
+        캐시된 토큰을 반환하고, 없거나 만료된 경우 새로 발급받습니다.
+
+        Args:
+            token_endpoint: Cognito 토큰 엔드포인트 URL
+            client_id: Cognito App Client ID
+            client_secret: Cognito App Client Secret
+            scope: OAuth2 scope (선택사항)
+            session: HTTP 세션 (선택사항, 기본값은 공유 세션)
+
+        Returns:
+            Access Token 문자열
+        """
+        key = (token_endpoint, client_id, scope)
+        credentials = (token_endpoint, client_id, client_secret, scope, session)
+
+        while True:
+            with self._lock:
+                now = time.time()
+                entry = self._entries.get(key)
+                if entry and now < entry[1] - self.expiry_skew:
+                    self.hits += 1
+                    refresh_at = entry[1] - self.expiry_skew - self.refresh_ahead
+                    if now >= refresh_at and key not in self._inflight:
+                        self._inflight[key] = threading.Event()
+                        threading.Thread(
+                            target=self._background_refresh,
+                            args=(key, credentials),
+                            daemon=True,
+                        ).start()
+                    return entry[0]
+
+                event = self._inflight.get(key)
+                is_owner = event is None
+                if is_owner:
+                    self.misses += 1
+                    event = threading.Event()
+                    self._inflight[key] = event
+
+            if not is_owner:
+                # 다른 호출자가 발급 중이므로 완료 후 캐시를 다시 확인
+                event.wait()
+                continue
+
+            try:
+                return self._fetch(key, credentials)
+            finally:
+                self._finish(key)
+
+    def invalidate(self, token_endpoint: Optional[str] = None, client_id: Optional[str] = None) -> None:
+        """
+        캐시된 토큰을 삭제합니다. 인자를 생략하면 전체를 삭제합니다.
+
+        클레임을 바꾼 뒤(예: Lambda 트리거 업데이트) 새 토큰이 필요할 때 사용합니다.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if token_endpoint and key[0] != token_endpoint:
+                    continue
+                if client_id and key[1] != client_id:
+                    continue
+                del self._entries[key]
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 hit/miss/refresh 카운터를 반환합니다."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "refreshes": self.refreshes,
+                "refresh_errors": self.refresh_errors,
+                "size": len(self._entries),
+            }
+
+    def _fetch(self, key: Tuple[str, str, str], credentials: Tuple) -> str:
+        token_response = _request_token(*credentials)
+        access_token = token_response["access_token"]
+        expires_at = _token_expiry(access_token, token_response)
+        with self._lock:
+            self._entries[key] = (access_token, expires_at)
+        return access_token
+
+    def _background_refresh(
+        self,
+        key: Tuple[str, str, str],
+        credentials: Tuple
+    ) -> None:
+        try:
+            self._fetch(key, credentials)
+            with self._lock:
+                self.refreshes += 1
+        except Exception:
+            # 기존 토큰이 아직 유효하므로 다음 호출에서 다시 갱신을 시도
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            self._finish(key)
+
+    def _finish(self, key: Tuple[str, str, str]) -> None:
+        with self._lock:
+            event = self._inflight.pop(key, None)
+        if event:
+            event.set()
+
+
+def _token_expiry(access_token: str, token_response: Dict[str, Any]) -> float:
+    """JWT `exp` 클레임 (없으면 `expires_in`)으로 만료 시각(epoch 초)을 계산합니다."""
+    try:
+        exp = decode_token(access_token).get("exp")
+    except ValueError:
+        exp = None
+    if exp is not None:
+        return float(exp)
+    return time.time() + float(token_response.get("expires_in", 0))
+
 
 def get_bearer_token(
     token_endpoint: str,
     client_id: str,
     client_secret: str,
-    scope: str = ""
+    scope: str = "",
+    cache: Optional[TokenCache] = None,
+    session: Optional[requests.Session] = None
 ) -> str:
     """
     OAuth2 Client Credentials Flow를 사용하여 Bearer 토큰을 발급받습니다.
@@ -25,6 +201,8 @@ def get_bearer_token(
         client_id: Cognito App Client ID
         client_secret: Cognito App Client Secret
         scope: OAuth2 scope (선택사항)
+        cache: 토큰 캐시 (선택사항, 지정 시 만료 전까지 재사용)
+        session: HTTP 세션 (선택사항, 기본값은 공유 세션)
 
     Returns:
         Access Token 문자열
@@ -36,6 +214,21 @@ def get_bearer_token(
         ...     client_secret="secret"
         ... )
     """
+    if cache is not None:
+        return cache.get_token(token_endpoint, client_id, client_secret, scope, session)
+    return _request_token(
+        token_endpoint, client_id, client_secret, scope, session
+    )["access_token"]
+
+
+def _request_token(
+    token_endpoint: str,
+    client_id: str,
+    client_secret: str,
+    scope: str = "",
+    session: Optional[requests.Session] = None
+) -> Dict[str, Any]:
+    """토큰 엔드포인트를 호출하여 전체 토큰 응답을 반환합니다."""
     data = {
         "grant_type": "client_credentials",
         "client_id": client_id,
@@ -46,13 +239,14 @@ def get_bearer_token(
     if scope:
         data["scope"] = scope
 
-    response = requests.post(
+    session = session or get_http_session()
+    response = session.post(
         token_endpoint,
         headers={"Content-Type": "application/x-www-form-urlencoded"},
         data=data,
     )
     response.raise_for_status()
-    return response.json()["access_token"]
+    return response.json()
 
 
 def decode_token(access_token: str) -> Dict[str, Any]:
@@ -90,7 +284,8 @@ def make_gateway_request(
     gateway_url: str,
     bearer_token: str,
     tool_name: str,
-    arguments: Dict[str, Any]
+    arguments: Dict[str, Any],
+    session: Optional[requests.Session] = None
 ) -> Dict[str, Any]:
     """
     Amazon Bedrock AgentCore Gateway에 JSON-RPC 요청을 보냅니다.
@@ -100,6 +295,7 @@ def make_gateway_request(
         bearer_token: OAuth2 Access Token
         tool_name: 호출할 도구 이름
         arguments: 도구 인자
+        session: HTTP 세션 (선택사항, 기본값은 공유 세션)
 
     Returns:
         JSON-RPC 응답
@@ -112,26 +308,183 @@ def make_gateway_request(
         ...     arguments={"amount": 500, "orderId": "test-001"}
         ... )
     """
-    payload = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "tools/call",
-        "params": {"name": tool_name, "arguments": arguments},
-    }
+    payload = build_tools_call_payload(tool_name, arguments, next(_request_ids))
 
-    response = requests.post(
+    session = session or get_http_session()
+    response = session.post(
         gateway_url,
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {bearer_token}",
-            "Accept": "application/json",
-        },
+        headers=build_gateway_headers(bearer_token),
         json=payload,
     )
     response.raise_for_status()
     return response.json()
 
 
+def make_gateway_batch_request(
+    gateway_url: str,
+    bearer_token: str,
+    calls: Sequence[Tuple[str, Dict[str, Any]]],
+    session: Optional[requests.Session] = None,
+    max_batch_size: int = 50
+) -> List[Dict[str, Any]]:
+    """
+    여러 도구 호출을 JSON-RPC 배치(배열) 요청으로 Gateway에 보냅니다.
+
+    각 호출에 고유한 ID를 부여하고, 응답 순서와 관계없이 ID로 응답을 매칭하여
+    `calls`와 같은 순서로 반환합니다. 일부 호출만 실패한 경우 해당 항목에만
+    JSON-RPC 에러가 담기며, 응답이 누락된 항목은 에러 응답으로 채워집니다.
+    Gateway가 배치 요청을 거부하면 해당 청크는 개별 요청으로 보내며,
+    배치를 지원하지 않는 엔드포인트(404/405/501, 배열이 아닌 응답)이면
+    이후 같은 URL로는 바로 개별 요청을 보냅니다. 413 응답은 청크를 나누어 재시도합니다.
+
+    Args:
+        gateway_url: Gateway MCP 엔드포인트 URL
+        bearer_token: OAuth2 Access Token
+        calls: (도구 이름, 도구 인자) 튜플 목록
+        session: HTTP 세션 (선택사항, 기본값은 공유 세션)
+        max_batch_size: HTTP 요청 하나에 담을 최대 호출 수
+
+    Returns:
+        `calls`와 같은 순서의 JSON-RPC 응답 목록
+
+    Example:
+        >>> results = make_gateway_batch_request(
+        ...     gateway_url="https://xxx.gateway...",
+        ...     bearer_token=token,
+        ...     calls=[
+        ...         ("RefundToolTarget___refund", {"amount": 500, "orderId": "o-1"}),
+        ...         ("RefundToolTarget___refund", {"amount": 5000, "orderId": "o-2"}),
+        ...     ],
+        ... )
+        >>> [analyze_response(r) for r in results]
+    """
+    session = session or get_http_session()
+    results: List[Dict[str, Any]] = []
+
+    for offset in range(0, len(calls), max_batch_size):
+        chunk = calls[offset:offset + max_batch_size]
+        results.extend(_send_chunk(gateway_url, bearer_token, chunk, session))
+
+    return results
+
+
+def _send_chunk(
+    gateway_url: str,
+    bearer_token: str,
+    calls: Sequence[Tuple[str, Dict[str, Any]]],
+    session: requests.Session
+) -> List[Dict[str, Any]]:
+    """청크를 배치로 보내고, 413이면 반으로 나누어 재시도, 배치가 거부되면 개별 요청으로 보냅니다."""
+    if gateway_url not in _batch_unsupported_urls:
+        outcome = _send_batch(gateway_url, bearer_token, calls, session)
+        if outcome == _PAYLOAD_TOO_LARGE and len(calls) > 1:
+            middle = len(calls) // 2
+            return (_send_chunk(gateway_url, bearer_token, calls[:middle], session)
+                    + _send_chunk(gateway_url, bearer_token, calls[middle:], session))
+        if isinstance(outcome, list):
+            return outcome
+
+    return [
+        make_gateway_request(gateway_url, bearer_token, tool_name, arguments, session)
+        for tool_name, arguments in calls
+    ]
+
+
+def _send_batch(
+    gateway_url: str,
+    bearer_token: str,
+    calls: Sequence[Tuple[str, Dict[str, Any]]],
+    session: requests.Session
+) -> Union[List[Dict[str, Any]], int, None]:
+    """
+    배치 요청을 보내고 응답을 ID로 매칭합니다.
+
+    본문이 너무 크면 413을, 배치가 거부되면 None을 반환합니다.
+    엔드포인트가 배치를 지원하지 않는 경우(404/405/501, 배열이 아닌 응답)에만
+    URL을 기록하여 이후 개별 요청으로 바로 보냅니다.
+    """
+    payload = [
+        build_tools_call_payload(tool_name, arguments, next(_request_ids))
+        for tool_name, arguments in calls
+    ]
+
+    response = session.post(
+        gateway_url,
+        headers=build_gateway_headers(bearer_token),
+        json=payload,
+    )
+    if response.status_code == _PAYLOAD_TOO_LARGE:
+        return _PAYLOAD_TOO_LARGE
+    if response.status_code in _BATCH_UNSUPPORTED_STATUS_CODES:
+        _batch_unsupported_urls.add(gateway_url)
+        return None
+    if response.status_code in _BATCH_REQUEST_REJECTED_STATUS_CODES:
+        return None
+    response.raise_for_status()
+
+    body = response.json()
+    if not isinstance(body, list):
+        # 배열 대신 단일 에러 객체(예: -32600 Invalid Request)가 반환된 경우
+        _batch_unsupported_urls.add(gateway_url)
+        return None
+
+    responses_by_id = {
+        item.get("id"): item for item in body if isinstance(item, dict)
+    }
+    return [
+        responses_by_id.get(request["id"]) or {
+            "jsonrpc": "2.0",
+            "id": request["id"],
+            "error": {
+                "code": -32603,
+                "message": "No response returned for batched request",
+            },
+        }
+        for request in payload
+    ]
+
+
+def build_tools_call_payload(
+    tool_name: str,
+    arguments: Dict[str, Any],
+    request_id: int = 1
+) -> Dict[str, Any]:
+    """
+    `tools/call` JSON-RPC 요청 본문을 생성합니다.
+
+    Args:
+        tool_name: 호출할 도구 이름
+        arguments: 도구 인자
+        request_id: JSON-RPC 요청 ID
+
+    Returns:
+        JSON-RPC 요청 딕셔너리
+    """
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": "tools/call",
+        "params": {"name": tool_name, "arguments": arguments},
+    }
+
+
+def build_gateway_headers(bearer_token: str) -> Dict[str, str]:
+    """
+    Gateway 요청에 사용할 HTTP 헤더를 생성합니다.
+
+    Args:
+        bearer_token: OAuth2 Access Token
+
+    Returns:
+        HTTP 헤더 딕셔너리
+    """
+    return {
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {bearer_token}",
+        "Accept": "application/json",
+    }
+
+
 def analyze_response(result: Dict[str, Any]) -> str:
     """
     Gateway 응답을 분석하여 결과를 판단합니다.
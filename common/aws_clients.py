@@ -0,0 +1,141 @@
+"""
+AWS 클라이언트 팩토리 모듈
+
+(서비스, 리전, 프로필)별로 boto3 클라이언트를 한 번만 생성해 프로세스 전역에서 공유합니다.
+
+클라이언트 생성은 호출당 수십 ms가 걸리고 매번 새 커넥션 풀을 만들기 때문에,
+스크립트와 공통 모듈이 같은 클라이언트(와 keep-alive 커넥션)를 재사용하도록 합니다.
+boto3 클라이언트는 생성 후에는 스레드 안전하지만 Session은 그렇지 않으므로,
+생성은 잠금 안에서 수행합니다.
+"""
+
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+DEFAULT_RETRY_MODE = "adaptive"
+DEFAULT_MAX_ATTEMPTS = 8
+DEFAULT_REGION = "us-east-1"
+
+_lock = threading.Lock()
+_sessions: Dict[Optional[str], boto3.Session] = {}
+_clients: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+_config_options: Dict[str, Any] = {
+    "max_pool_connections": DEFAULT_MAX_POOL_CONNECTIONS,
+    "retry_mode": DEFAULT_RETRY_MODE,
+    "max_attempts": DEFAULT_MAX_ATTEMPTS,
+}
+
+
+def _client_config() -> Config:
+    return Config(
+        max_pool_connections=_config_options["max_pool_connections"],
+        retries={
+            "mode": _config_options["retry_mode"],
+            "total_max_attempts": _config_options["max_attempts"],
+        },
+    )
+
+
+def _get_session_locked(profile: Optional[str]) -> boto3.Session:
+    session = _sessions.get(profile)
+    if session is None:
+        session = boto3.Session(profile_name=profile) if profile else boto3.Session()
+        _sessions[profile] = session
+    return session
+
+
+def get_session(profile: Optional[str] = None) -> boto3.Session:
+    """
+    프로필별로 공유하는 boto3 Session을 반환합니다 (최초 호출 시 생성).
+
+    Args:
+        profile: AWS 프로필 이름 (None이면 기본 자격 증명 체인)
+
+    Returns:
+        공유 boto3 Session
+    """
+    with _lock:
+        return _get_session_locked(profile)
+
+
+def get_default_region(profile: Optional[str] = None) -> str:
+    """
+    Session 설정의 기본 리전을 반환합니다 (없으면 us-east-1).
+
+    Args:
+        profile: AWS 프로필 이름 (선택사항)
+
+    Returns:
+        리전 이름
+    """
+    return get_session(profile).region_name or DEFAULT_REGION
+
+
+def get_client(service: str, region: Optional[str] = None, profile: Optional[str] = None):
+    """
+    공유 boto3 클라이언트를 반환합니다 (최초 호출 시 생성).
+
+    모든 클라이언트는 같은 설정(커넥션 풀 크기, adaptive 재시도 모드)을 사용합니다.
+
+    Args:
+        service: 서비스 이름 (예: "bedrock-agentcore-control")
+        region: 리전 (None이면 Session 기본 리전)
+        profile: AWS 프로필 이름 (선택사항)
+
+    Returns:
+        boto3 클라이언트
+
+    Example:
+        >>> control_client = get_client("bedrock-agentcore-control", region="us-east-1")
+        >>> get_client("bedrock-agentcore-control", region="us-east-1") is control_client
+        True
+    """
+    key = (service, region, profile)
+    client = _clients.get(key)
+    if client is not None:
+        return client
+
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            session = _get_session_locked(profile)
+            client = session.client(service, region_name=region, config=_client_config())
+            _clients[key] = client
+    return client
+
+
+def configure_clients(
+    max_pool_connections: Optional[int] = None,
+    retry_mode: Optional[str] = None,
+    max_attempts: Optional[int] = None
+) -> None:
+    """
+    이후 생성되는 클라이언트의 설정을 변경합니다. 기존 공유 클라이언트는 버립니다.
+
+    Args:
+        max_pool_connections: 클라이언트당 최대 커넥션 수 (동시 호출 스레드 수 이상 권장)
+        retry_mode: botocore 재시도 모드 ("adaptive" | "standard" | "legacy")
+        max_attempts: 최대 시도 횟수 (첫 요청 포함)
+
+    Example:
+        >>> configure_clients(max_pool_connections=100)
+    """
+    with _lock:
+        if max_pool_connections is not None:
+            _config_options["max_pool_connections"] = max_pool_connections
+        if retry_mode is not None:
+            _config_options["retry_mode"] = retry_mode
+        if max_attempts is not None:
+            _config_options["max_attempts"] = max_attempts
+        _clients.clear()
+
+
+def clear_clients() -> None:
+    """공유 클라이언트와 Session을 모두 버립니다 (예: 자격 증명 교체 후)."""
+    with _lock:
+        _clients.clear()
+        _sessions.clear()
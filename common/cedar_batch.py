@@ -0,0 +1,473 @@
+"""
+Cedar 정책 일괄(벡터화) 평가 모듈
+
+과거 `tools/call` 인자 수백만 건을 제안된 정책 세트에 재생하는 what-if 분석용입니다.
+입력을 열(column) 단위로 받아 단순한 식(`context.input.amount <= 1000`,
+`principal.getTag("department_name") == "finance"`, like, has / hasTag, &&, ||, ! 등)은
+NumPy 배열 연산으로 한 번에 평가하고, 벡터화할 수 없는 식을 가진 정책만 행 단위로 평가합니다.
+
+NumPy는 00_setup/pyproject.toml에 포함되어 있습니다. 설치되어 있지 않으면 경고를 한 번 출력하고
+모든 요청을 행 단위로 평가합니다.
+"""
+
+from typing import Dict, Any, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .cedar_local import (
+    ALLOWED,
+    DENIED,
+    EVALUATION_ERRORS,
+    AndExpr,
+    AttributeExpr,
+    BinaryExpr,
+    Entity,
+    HasExpr,
+    LikeExpr,
+    LiteralExpr,
+    LocalPolicyEngine,
+    LogicalChainExpr,
+    MethodCallExpr,
+    NotExpr,
+    PolicyRequest,
+    VarExpr,
+    to_entity,
+    to_tag_value,
+)
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+# NumPy 없이 평가할 때 경고를 한 번만 출력
+_fallback_warned = False
+
+
+class _Unsupported(Exception):
+    """벡터화할 수 없는 식."""
+
+
+class _Vector:
+    """
+    식의 열 단위 평가 결과.
+
+    values는 배열 또는 스칼라(리터럴), errors는 평가 오류가 난 행의 bool 배열(없으면 None),
+    kind는 값의 타입("bool", "number", "string", "mixed", 모든 행에 값이 없으면 "absent")입니다.
+    """
+
+    __slots__ = ("values", "errors", "kind")
+
+    def __init__(self, values, errors, kind: str):
+        self.values = values
+        self.errors = errors
+        self.kind = kind
+
+
+def _value_kind(value: Any) -> str:
+    if value.__class__ is bool:
+        return "bool"
+    if value.__class__ in (int, float):
+        return "number"
+    if value.__class__ is str:
+        return "string"
+    return "mixed"
+
+
+def _merge_errors(*errors):
+    merged = None
+    for error in errors:
+        if error is None:
+            continue
+        merged = error if merged is None else merged | error
+    return merged
+
+
+class _Columns:
+    """열 단위 입력. 열 벡터와 행 단위 평가용 환경을 필요할 때 만들어 캐시합니다."""
+
+    def __init__(
+        self,
+        size: int,
+        principal_tags: Mapping[str, Any],
+        context_input: Mapping[str, Any],
+        principal: Optional[Entity],
+        action: Entity,
+        resource: Optional[Entity]
+    ):
+        self.size = size
+        self.principal_tags = principal_tags
+        self.context_input = context_input
+        self.principal = principal
+        self.action = action
+        self.resource = resource
+        self._vectors: Dict[Tuple[str, str], _Vector] = {}
+        self._envs: Optional[List[PolicyRequest]] = None
+
+    def _column(self, columns: Mapping[str, Any], name: str) -> Sequence:
+        column = columns.get(name)
+        if column is None or isinstance(column, (str, int, float, bool)):
+            # 스칼라는 모든 행에 같은 값
+            return [column] * self.size
+        return column
+
+    def input_vector(self, name: str) -> _Vector:
+        key = ("input", name)
+        if key not in self._vectors:
+            self._vectors[key] = self._make_vector(self._column(self.context_input, name), convert=None)
+        return self._vectors[key]
+
+    def tag_vector(self, name: str) -> _Vector:
+        key = ("tag", name)
+        if key not in self._vectors:
+            self._vectors[key] = self._make_vector(self._column(self.principal_tags, name), convert=to_tag_value)
+        return self._vectors[key]
+
+    def _make_vector(self, column: Sequence, convert) -> _Vector:
+        """
+        열을 벡터로 변환합니다. None(또는 float 열의 NaN)은 값이 없는 행이며,
+        해당 행에서 속성 접근은 오류, has / hasTag는 false가 됩니다.
+        """
+        if convert is None and isinstance(column, np.ndarray) and column.dtype.kind in "biuf":
+            if column.dtype.kind == "f":
+                missing = np.isnan(column)
+            else:
+                missing = np.zeros(self.size, dtype=bool)
+            kind = "bool" if column.dtype.kind == "b" else "number"
+            return _Vector(column, missing if missing.any() else None, kind)
+
+        column = [None if _is_missing(value) else _row_value(value) for value in column]
+        missing = np.fromiter((value is None for value in column), dtype=bool, count=self.size)
+        if missing.all():
+            return _Vector(np.zeros(self.size, dtype=bool), missing, "absent")
+        if convert is not None:
+            column = [value if value is None else convert(value) for value in column]
+        kinds = {_value_kind(value) for value in column if value is not None}
+        kind = kinds.pop() if len(kinds) == 1 else "mixed"
+
+        if kind == "number":
+            is_integer = all(value.__class__ is int for value in column if value is not None)
+            values = np.array(
+                [0 if value is None else value for value in column],
+                dtype=np.int64 if is_integer else np.float64,
+            )
+        elif kind == "bool":
+            values = np.array([bool(value) for value in column], dtype=bool)
+        else:
+            values = np.empty(self.size, dtype=object)
+            # 값이 없는 행은 오류 mask로 가려지므로 정렬 가능한 빈 문자열로 채움
+            values[:] = ["" if value is None else value for value in column] if kind == "string" else column
+        return _Vector(values, missing if missing.any() else None, kind)
+
+    def present(self, vector: _Vector):
+        if vector.errors is None:
+            return np.ones(self.size, dtype=bool)
+        return ~vector.errors
+
+    def envs(self) -> List[PolicyRequest]:
+        """행 단위 평가용 환경 (벡터화할 수 없는 정책에서만 생성)."""
+        if self._envs is None:
+            inputs = {name: self._column(self.context_input, name) for name in self.context_input}
+            tags = {name: self._column(self.principal_tags, name) for name in self.principal_tags}
+            self._envs = [
+                PolicyRequest(
+                    principal=self.principal,
+                    principal_tags={name: _row_value(column[row]) for name, column in tags.items()
+                                    if not _is_missing(column[row])},
+                    action=self.action,
+                    resource=self.resource,
+                    context={"input": {name: _row_value(column[row]) for name, column in inputs.items()
+                                       if not _is_missing(column[row])}},
+                )
+                for row in range(self.size)
+            ]
+        return self._envs
+
+
+def _is_missing(value: Any) -> bool:
+    return value is None or (value.__class__ is not str and value != value)
+
+
+def _row_value(value: Any) -> Any:
+    # NumPy 스칼라를 Python 값으로 변환
+    return value.item() if hasattr(value, "item") and not isinstance(value, (str, bytes)) else value
+
+
+def _require_bool(vector: _Vector, what: str) -> _Vector:
+    # "absent"는 모든 행이 오류이므로 값과 관계없이 bool로 취급 가능
+    if vector.kind not in ("bool", "absent"):
+        raise _Unsupported(f"non-boolean {what}")
+    return vector
+
+
+def _is_context_input(node) -> bool:
+    return (isinstance(node, AttributeExpr) and node.name == "input"
+            and isinstance(node.target, VarExpr) and node.target.name == "context")
+
+
+_COMPARISONS = {"<": "less", "<=": "less_equal", ">": "greater", ">=": "greater_equal"}
+
+
+def _vectorize(node, columns: _Columns, cache: Dict[Tuple, _Vector]) -> _Vector:
+    """식을 열 단위로 평가합니다. 구조가 같은 부분식은 배치 내에서 한 번만 계산합니다."""
+    key = node.key()
+    vector = cache.get(key)
+    if vector is None:
+        vector = cache[key] = _vectorize_node(node, columns, cache)
+    return vector
+
+
+def _vectorize_node(node, columns: _Columns, cache: Dict[Tuple, _Vector]) -> _Vector:
+    if isinstance(node, LiteralExpr):
+        kind = _value_kind(node.value)
+        if kind == "mixed":
+            raise _Unsupported("entity literal")
+        return _Vector(node.value, None, kind)
+
+    if isinstance(node, AttributeExpr) and _is_context_input(node.target):
+        return columns.input_vector(node.name)
+
+    if isinstance(node, HasExpr) and _is_context_input(node.target):
+        vector = columns.input_vector(node.name)
+        return _Vector(columns.present(vector), None, "bool")
+
+    if (isinstance(node, MethodCallExpr) and node.method in ("hasTag", "getTag")
+            and isinstance(node.args[0], LiteralExpr) and isinstance(node.args[0].value, str)):
+        vector = columns.tag_vector(node.args[0].value)
+        if node.method == "hasTag":
+            return _Vector(columns.present(vector), None, "bool")
+        return vector
+
+    if isinstance(node, LikeExpr):
+        target = _vectorize(node.target, columns, cache)
+        if target.kind == "absent":
+            return _Vector(target.values, target.errors, "bool")
+        if target.kind != "string" or np.ndim(target.values) == 0:
+            raise _Unsupported("like on non-string column")
+        # 고유 값마다 한 번만 패턴을 매칭
+        uniques, inverse = np.unique(target.values, return_inverse=True)
+        fullmatch = node.regex.fullmatch
+        matched = np.fromiter((fullmatch(value) is not None for value in uniques), dtype=bool, count=len(uniques))
+        return _Vector(matched[inverse], target.errors, "bool")
+
+    if isinstance(node, NotExpr):
+        operand = _require_bool(_vectorize(node.operand, columns, cache), "operand of !")
+        return _Vector(np.logical_not(operand.values), operand.errors, "bool")
+
+    if isinstance(node, LogicalChainExpr):
+        return _vectorize_chain(node, columns, cache)
+
+    if isinstance(node, BinaryExpr):
+        return _vectorize_binary(node, columns, cache)
+
+    raise _Unsupported(type(node).__name__)
+
+
+def _vectorize_chain(node: LogicalChainExpr, columns: _Columns, cache: Dict[Tuple, _Vector]) -> _Vector:
+    # 단락 평가 의미 유지: && 는 앞이 true인 행에서만, || 는 앞이 false인 행에서만
+    # 뒤 피연산자의 오류가 결과 오류가 됨
+    is_and = isinstance(node, AndExpr)
+    values, errors = None, None
+    for operand_node in node._operands():
+        operand = _require_bool(_vectorize(operand_node, columns, cache), "operand of logical operator")
+        if values is None:
+            values, errors = operand.values, operand.errors
+            continue
+        if operand.errors is not None:
+            reached = values if is_and else np.logical_not(values)
+            if errors is not None:
+                reached = reached & ~errors
+            errors = _merge_errors(errors, reached & operand.errors)
+        if is_and:
+            values = np.logical_and(values, operand.values)
+        else:
+            values = np.logical_or(values, operand.values)
+    return _Vector(values, errors, "bool")
+
+
+def _vectorize_binary(node: BinaryExpr, columns: _Columns, cache: Dict[Tuple, _Vector]) -> _Vector:
+    if node.operator not in _COMPARISONS and node.operator not in ("==", "!="):
+        raise _Unsupported(f"operator {node.operator}")
+
+    left = _vectorize(node.left, columns, cache)
+    right = _vectorize(node.right, columns, cache)
+    if "mixed" in (left.kind, right.kind):
+        raise _Unsupported("mixed-type column")
+    errors = _merge_errors(left.errors, right.errors)
+    if "absent" in (left.kind, right.kind):
+        return _Vector(np.zeros(columns.size, dtype=bool), errors, "bool")
+
+    if node.operator in _COMPARISONS:
+        if left.kind != "number" or right.kind != "number":
+            raise _Unsupported("non-numeric comparison")
+        compare = getattr(np, _COMPARISONS[node.operator])
+        return _Vector(compare(left.values, right.values), errors, "bool")
+
+    if left.kind != right.kind:
+        # Cedar의 ==는 타입이 다르면 오류 없이 false
+        equal = np.zeros(columns.size, dtype=bool)
+    else:
+        equal = np.asarray(left.values == right.values, dtype=bool)
+    if node.operator == "!=":
+        equal = np.logical_not(equal)
+    return _Vector(equal, errors, "bool")
+
+
+def _policy_mask(policy, columns: _Columns, cache: Dict[Tuple, _Vector]):
+    """정책 조건절 전체가 만족되는 행의 mask. 벡터화할 수 없으면 _Unsupported."""
+    satisfied = np.ones(columns.size, dtype=bool)
+    for is_when, node in policy.conditions:
+        vector = _require_bool(_vectorize(node, columns, cache), "condition")
+        holds = vector.values if is_when else np.logical_not(vector.values)
+        if vector.errors is not None:
+            holds = holds & ~vector.errors
+        satisfied &= holds
+    return satisfied
+
+
+def _row_mask(policy, columns: _Columns, rows):
+    """정책을 지정한 행에서만 행 단위로 평가합니다."""
+    satisfied = np.zeros(columns.size, dtype=bool)
+    envs = columns.envs()
+    condition = policy.condition
+    for row in np.flatnonzero(rows):
+        try:
+            satisfied[row] = condition(envs[row])
+        except EVALUATION_ERRORS:
+            pass
+    return satisfied
+
+
+def _batch_size(*column_sets: Mapping[str, Any]) -> int:
+    sizes = {
+        len(column)
+        for columns in column_sets
+        for column in columns.values()
+        if column is not None and not isinstance(column, (str, int, float, bool))
+    }
+    if len(sizes) > 1:
+        raise ValueError(f"All columns must have the same length, got {sorted(sizes)}")
+    if not sizes:
+        raise ValueError("At least one column must be a sequence (or pass size)")
+    return sizes.pop()
+
+
+def evaluate_batch(
+    engine: LocalPolicyEngine,
+    action: Union[str, Entity],
+    resource: Union[str, Entity, None] = None,
+    principal_tags: Optional[Mapping[str, Any]] = None,
+    context_input: Optional[Mapping[str, Any]] = None,
+    principal: Union[str, Entity, None] = None,
+    size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    하나의 도구(action)에 대한 여러 요청을 열 단위로 평가합니다.
+
+    각 열은 요청 수만큼의 값을 가진 시퀀스(또는 NumPy 배열)이며, None은 해당 요청에
+    값이 없음을 의미합니다. 스칼라를 넘기면 모든 요청에 같은 값이 사용됩니다.
+    결정은 요청마다 `is_authorized`를 호출한 결과와 같습니다.
+
+    Args:
+        engine: LocalPolicyEngine
+        action: 도구 이름 (예: "ClaimTarget___approve_claim") 또는 Action 엔티티
+        resource: Gateway ARN 또는 Gateway 엔티티
+        principal_tags: {태그 이름: 값 열} (JWT 클레임)
+        context_input: {인자 이름: 값 열} (context.input)
+        principal: principal 엔티티 (모든 요청에 공통)
+        size: 요청 수 (모든 열이 스칼라인 경우에만 필요)
+
+    Returns:
+        {"decisions": 'ALLOWED' / 'DENIED' 배열,
+         "allowed": bool 배열,
+         "determining_policies": 요청별 결정 정책 ID (기본 거부는 None),
+         "row_evaluated_policies": 행 단위로 평가된 정책 ID 목록}
+        NumPy가 없으면 배열 대신 리스트를 반환합니다.
+
+    Example:
+        >>> result = evaluate_batch(
+        ...     engine,
+        ...     action="ClaimTarget___approve_claim",
+        ...     resource=GATEWAY_ARN,
+        ...     principal_tags={"department_name": departments},
+        ...     context_input={"amount": amounts, "risk_level": risk_levels},
+        ... )
+        >>> result["allowed"].mean()
+    """
+    principal_tags = principal_tags or {}
+    context_input = context_input or {}
+    if size is None:
+        size = _batch_size(principal_tags, context_input)
+
+    if np is None:
+        global _fallback_warned
+        if not _fallback_warned:
+            print("⚠️  NumPy가 설치되어 있지 않아 행 단위로 평가합니다 (pip install numpy 권장)")
+            _fallback_warned = True
+        return _evaluate_rows(engine, size, action, resource, principal_tags, context_input, principal)
+
+    action_entity, resource_entity, forbids, permits = engine.candidates(action, resource)
+    principal_entity = to_entity(principal, "AgentCore::OAuthUser")
+
+    columns = _Columns(size, principal_tags, context_input, principal_entity, action_entity, resource_entity)
+    cache: Dict[Tuple, _Vector] = {}
+    row_evaluated: List[str] = []
+
+    determining = np.full(size, None, dtype=object)
+    forbidden = np.zeros(size, dtype=bool)
+    allowed = np.zeros(size, dtype=bool)
+
+    # forbid를 먼저 평가하고, permit은 아직 결정되지 않은 행에만 적용
+    for policy in forbids + permits:
+        if not policy.applies_to(principal_entity):
+            continue
+        undecided = ~(forbidden | allowed) if not policy.is_forbid else ~forbidden
+        if not undecided.any():
+            continue
+        try:
+            satisfied = _policy_mask(policy, columns, cache)
+        except _Unsupported:
+            row_evaluated.append(policy.id)
+            satisfied = _row_mask(policy, columns, undecided)
+        newly = satisfied & undecided
+        determining[newly] = policy.id
+        if policy.is_forbid:
+            forbidden |= newly
+        else:
+            allowed |= newly
+
+    return {
+        "decisions": np.where(allowed, ALLOWED, DENIED),
+        "allowed": allowed,
+        "determining_policies": determining,
+        "row_evaluated_policies": row_evaluated,
+    }
+
+
+def _evaluate_rows(engine, size, action, resource, principal_tags, context_input, principal) -> Dict[str, Any]:
+    """NumPy 없이 요청마다 evaluate()를 호출하는 대체 경로."""
+
+    def column(columns, name):
+        value = columns[name]
+        return [value] * size if value is None or isinstance(value, (str, int, float, bool)) else value
+
+    tags = {name: column(principal_tags, name) for name in principal_tags}
+    inputs = {name: column(context_input, name) for name in context_input}
+
+    _, _, forbids, permits = engine.candidates(action, resource)
+    decisions, determining = [], []
+    for row in range(size):
+        result = engine.evaluate(
+            action,
+            resource,
+            principal_tags={name: values[row] for name, values in tags.items() if values[row] is not None},
+            context_input={name: values[row] for name, values in inputs.items() if values[row] is not None},
+            principal=principal,
+        )
+        decisions.append(result["decision"])
+        determining.append(result["determining_policies"][0] if result["determining_policies"] else None)
+
+    return {
+        "decisions": decisions,
+        "allowed": [decision == ALLOWED for decision in decisions],
+        "determining_policies": determining,
+        "row_evaluated_policies": [policy.id for policy in forbids + permits],
+    }
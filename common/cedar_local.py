@@ -0,0 +1,1180 @@
+"""
+로컬 Cedar 정책 평가 모듈
+
+AgentCore Policy Engine에 배포하지 않고도 Cedar 정책의 허용/거부 결과를
+로컬에서 확인할 수 있는 평가기를 제공합니다.
+
+지원 범위 (튜토리얼에서 사용하는 Cedar 문법):
+    - permit / forbid, when / unless 조건절, @id("...") 어노테이션
+    - 스코프: principal, action (==, in [...]), resource (==, in)
+    - 연산자: ||, &&, !, ==, !=, <, <=, >, >=, +, -, *, in, like, has, if-then-else
+    - principal.hasTag() / principal.getTag(), context.input.<field>
+    - 집합 리터럴과 .contains() / .containsAll() / .containsAny()
+
+평가 의미는 Cedar와 동일합니다: forbid가 하나라도 만족되면 거부, 그렇지 않고
+permit이 하나라도 만족되면 허용, 둘 다 없으면 기본 거부입니다.
+평가 중 오류(없는 속성 접근, 타입 불일치 등)가 발생한 정책은 만족되지 않은 것으로 봅니다.
+"""
+
+import json
+import operator
+import re
+from typing import Dict, Any, Callable, Iterable, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+ACTION_TYPE = "AgentCore::Action"
+GATEWAY_TYPE = "AgentCore::Gateway"
+
+ALLOWED = "ALLOWED"
+DENIED = "DENIED"
+
+# (엔티티 타입, 엔티티 ID) 예: ("AgentCore::Action", "RefundToolTarget___refund")
+Entity = Tuple[str, str]
+
+
+class CedarSyntaxError(ValueError):
+    """Cedar 정책문을 해석할 수 없을 때 발생합니다."""
+
+
+class CedarEvaluationError(Exception):
+    """정책 평가 중 오류 (해당 정책은 만족되지 않은 것으로 처리)."""
+
+
+# ============================================================================
+# Tokenizer
+# ============================================================================
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ws>\s+|//[^\n]*)
+    |(?P<string>"(?:[^"\\]|\\.)*")
+    |(?P<number>\d+)
+    |(?P<ident>[A-Za-z_][A-Za-z0-9_]*)
+    |(?P<op>::|==|!=|<=|>=|&&|\|\||[()\[\]{},;.<>!+\-*@:])
+    """,
+    re.VERBOSE,
+)
+
+
+_SIMPLE_ESCAPES = {"n": "\n", "r": "\r", "t": "\t", "0": "\0", "\\": "\\", "'": "'", '"': '"'}
+_UNICODE_ESCAPE = re.compile(r"u\{([0-9A-Fa-f]{1,6})\}")
+
+
+def _unescape_string(body: str, position: int) -> Union[str, Tuple[str, ...]]:
+    """
+    Cedar 문자열 리터럴의 이스케이프(\\n \\r \\t \\0 \\\\ \\' \\" \\u{...})를 해석합니다.
+
+    `\\*`(like 패턴의 리터럴 별표)가 있으면 문자열 대신 `\\*` 위치에서 나눈
+    조각 튜플을 반환합니다. 이 값은 like 패턴으로만 사용할 수 있습니다.
+
+    Raises:
+        CedarSyntaxError: 잘못된 이스케이프
+    """
+    chunks = []
+    current = []
+    index = 0
+    while index < len(body):
+        char = body[index]
+        if char != "\\":
+            current.append(char)
+            index += 1
+            continue
+        escape = body[index + 1]
+        if escape in _SIMPLE_ESCAPES:
+            current.append(_SIMPLE_ESCAPES[escape])
+            index += 2
+        elif escape == "*":
+            chunks.append("".join(current))
+            current = []
+            index += 2
+        else:
+            match = _UNICODE_ESCAPE.match(body, index + 1)
+            code_point = int(match.group(1), 16) if match else None
+            if code_point is None or code_point > 0x10FFFF or 0xD800 <= code_point <= 0xDFFF:
+                raise CedarSyntaxError(f"Invalid escape sequence in string at offset {position + 1 + index}")
+            current.append(chr(code_point))
+            index = match.end()
+    chunks.append("".join(current))
+    return chunks[0] if len(chunks) == 1 else tuple(chunks)
+
+
+def _tokenize(source: str) -> List[Tuple[str, Any, int]]:
+    tokens = []
+    position = 0
+    while position < len(source):
+        match = _TOKEN_PATTERN.match(source, position)
+        if not match:
+            raise CedarSyntaxError(f"Unexpected character {source[position]!r} at offset {position}")
+        kind = match.lastgroup
+        text = match.group(kind)
+        if kind == "string":
+            value = _unescape_string(text[1:-1], position)
+            tokens.append(("string" if isinstance(value, str) else "pattern", value, position))
+        elif kind == "number":
+            tokens.append(("number", int(text), position))
+        elif kind != "ws":
+            tokens.append((kind, text, position))
+        position = match.end()
+    tokens.append(("eof", None, position))
+    return tokens
+
+
+# ============================================================================
+# Expression AST
+# ============================================================================
+
+# 식 노드와 PolicyRequest는 공개 API입니다. 일괄 평가기(cedar_batch)처럼 다른 방식으로
+# 정책을 평가하는 모듈은 CompiledPolicy.conditions의 식 트리를 읽기 전용으로 검사합니다.
+
+
+class PolicyRequest:
+    """
+    단일 요청에 대한 평가 환경 (CompiledPolicy.condition의 인자).
+
+    Attributes:
+        principal: principal 엔티티 (없으면 None)
+        principal_tags: principal 태그 (JWT 클레임)
+        action: Action 엔티티
+        resource: Gateway 엔티티
+        context: {"input": 도구 인자}
+    """
+
+    __slots__ = ("principal", "principal_tags", "action", "resource", "context")
+
+    def __init__(self, principal, principal_tags, action, resource, context):
+        self.principal = principal
+        self.principal_tags = principal_tags
+        self.action = action
+        self.resource = resource
+        self.context = context
+
+
+def _bool_result(value: Any) -> bool:
+    if value is True or value is False:
+        return value
+    raise CedarEvaluationError(f"Expected boolean, got {type(value).__name__}")
+
+
+def _expect_number(value: Any) -> Union[int, float]:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise CedarEvaluationError(f"Expected number, got {type(value).__name__}")
+    return value
+
+
+def _cedar_equals(left: Any, right: Any) -> bool:
+    # Cedar의 ==는 타입이 다르면 오류 없이 false
+    if isinstance(left, bool) != isinstance(right, bool):
+        return False
+    return left == right
+
+
+def _like_regex(pattern: Tuple[str, ...]) -> "re.Pattern":
+    """
+    Cedar like 패턴을 정규식으로 변환합니다.
+
+    pattern은 리터럴 별표(`\\*`) 위치에서 나눈 조각들이며, 각 조각의 `*`는 와일드카드입니다.
+    """
+    literal_star = re.escape("*")
+    return re.compile(
+        literal_star.join(".*".join(re.escape(part) for part in chunk.split("*")) for chunk in pattern),
+        re.DOTALL,
+    )
+
+
+# 각 노드는 compile()로 평가 함수(env -> 값)를 생성합니다.
+# 정책은 등록 시 한 번만 컴파일되며, 요청마다 AST를 다시 해석하지 않습니다.
+Evaluator = Callable[[PolicyRequest], Any]
+
+
+class Expr:
+    """Cedar 식 트리 노드의 기반 클래스."""
+
+    # 항상 bool을 반환하는 노드는 컴파일 시 타입 검사를 생략할 수 있음
+    is_boolean = False
+    # 구조 키 계산에서 제외할 파생 속성
+    _derived = ("is_boolean", "regex", "function", "_key")
+
+    def key(self) -> Tuple:
+        """노드의 구조 키. 구조가 같은 식은 같은 키를 가집니다."""
+        try:
+            return self._key
+        except AttributeError:
+            fields = sorted((name, value) for name, value in vars(self).items() if name not in self._derived)
+            self._key = (self.__class__.__name__,) + tuple(
+                (name, _structural_key(value)) for name, value in fields
+            )
+            return self._key
+
+    def compile(self, cache: Optional[Dict[Tuple, Evaluator]] = None) -> Evaluator:
+        """
+        평가 함수를 생성합니다.
+
+        `cache`를 공유하면 여러 정책에 반복되는 부분식(예: principal.hasTag("department_name"))이
+        하나의 평가 함수를 공유하므로, 정책 수가 많을 때 메모리와 CPU 캐시 사용이 줄어듭니다.
+        """
+        if cache is None:
+            cache = {}
+        key = self.key()
+        evaluator = cache.get(key)
+        if evaluator is None:
+            evaluator = cache[key] = self._build(cache)
+        return evaluator
+
+    def compile_boolean(self, cache: Optional[Dict[Tuple, Evaluator]] = None) -> Evaluator:
+        """bool이 아닌 값에 대해 오류를 내는 평가 함수를 생성합니다."""
+        evaluator = self.compile(cache)
+        if self.is_boolean:
+            return evaluator
+        if cache is None:
+            cache = {}
+        key = ("bool", self.key())
+        checked = cache.get(key)
+        if checked is None:
+            checked = cache[key] = lambda env: _bool_result(evaluator(env))
+        return checked
+
+    def _build(self, cache: Dict[Tuple, Evaluator]) -> Evaluator:
+        raise NotImplementedError
+
+
+def _structural_key(value: Any) -> Any:
+    if isinstance(value, Expr):
+        return value.key()
+    if isinstance(value, (list, tuple)):
+        return tuple(_structural_key(item) for item in value)
+    # 1, 1.0, true가 같은 키가 되지 않도록 타입을 포함
+    return (value.__class__.__name__, value)
+
+
+class LiteralExpr(Expr):
+    def __init__(self, value):
+        self.value = value
+
+    def _build(self, cache):
+        value = self.value
+        return lambda env: value
+
+
+class VarExpr(Expr):
+    def __init__(self, name: str):
+        self.name = name
+
+    def _build(self, cache):
+        return operator.attrgetter(self.name)
+
+
+class SetExpr(Expr):
+    def __init__(self, items: List[Expr]):
+        self.items = items
+
+    def _build(self, cache):
+        items = [item.compile(cache) for item in self.items]
+        return lambda env: [item(env) for item in items]
+
+
+class RecordExpr(Expr):
+    def __init__(self, fields: List[Tuple[str, Expr]]):
+        self.fields = fields
+
+    def _build(self, cache):
+        fields = [(key, node.compile(cache)) for key, node in self.fields]
+        return lambda env: {key: node(env) for key, node in fields}
+
+
+class AttributeExpr(Expr):
+    def __init__(self, target: Expr, name: str):
+        self.target = target
+        self.name = name
+
+    def _build(self, cache):
+        target = self.target.compile(cache)
+        name = self.name
+
+        def attribute(env):
+            value = target(env)
+            if value.__class__ is not dict:
+                raise CedarEvaluationError(
+                    f"Cannot access attribute {name!r} on {type(value).__name__}"
+                )
+            try:
+                return value[name]
+            except KeyError:
+                raise CedarEvaluationError(f"Attribute {name!r} not found") from None
+
+        return attribute
+
+
+class HasExpr(Expr):
+    is_boolean = True
+
+    def __init__(self, target: Expr, name: str):
+        self.target = target
+        self.name = name
+
+    def _build(self, cache):
+        target = self.target.compile(cache)
+        name = self.name
+
+        def has(env):
+            value = target(env)
+            if value.__class__ is dict:
+                return name in value
+            if isinstance(value, tuple):
+                # 엔티티 속성은 모델링하지 않음
+                return False
+            raise CedarEvaluationError(f"'has' requires a record or entity, got {type(value).__name__}")
+
+        return has
+
+
+class LikeExpr(Expr):
+    is_boolean = True
+
+    def __init__(self, target: Expr, pattern: Union[str, Tuple[str, ...]]):
+        self.target = target
+        self.pattern = (pattern,) if isinstance(pattern, str) else pattern
+        self.regex = _like_regex(self.pattern)
+
+    def _build(self, cache):
+        target = self.target.compile(cache)
+        fullmatch = self.regex.fullmatch
+
+        def like(env):
+            value = target(env)
+            if value.__class__ is not str:
+                raise CedarEvaluationError(f"'like' requires a string, got {type(value).__name__}")
+            return fullmatch(value) is not None
+
+        return like
+
+
+class MethodCallExpr(Expr):
+    def __init__(self, target: Expr, method: str, args: List[Expr]):
+        self.target = target
+        self.method = method
+        self.args = args
+        self.is_boolean = method != "getTag"
+        if method not in ("hasTag", "getTag", "contains", "containsAll", "containsAny"):
+            raise CedarSyntaxError(f"Unsupported method: {method}")
+        if len(args) != 1:
+            raise CedarSyntaxError(f"{method}() takes exactly one argument")
+
+    def _build(self, cache):
+        if self.method in ("hasTag", "getTag"):
+            return self._compile_tag(cache)
+
+        target = self.target.compile(cache)
+        argument = self.args[0].compile(cache)
+        method = self.method
+
+        def collection_method(env):
+            collection = target(env)
+            if not isinstance(collection, list):
+                raise CedarEvaluationError(f"{method}() requires a set")
+            other = argument(env)
+            if method == "contains":
+                return any(_cedar_equals(item, other) for item in collection)
+            if not isinstance(other, list):
+                raise CedarEvaluationError(f"{method}() requires a set argument")
+            matches = (any(_cedar_equals(item, value) for item in collection) for value in other)
+            return all(matches) if method == "containsAll" else any(matches)
+
+        return collection_method
+
+    def _compile_tag(self, cache):
+        if not (isinstance(self.target, VarExpr) and self.target.name == "principal"):
+            raise CedarSyntaxError(f"{self.method}() is only supported on principal")
+
+        if isinstance(self.args[0], LiteralExpr) and isinstance(self.args[0].value, str):
+            key = self.args[0].value
+            if self.method == "hasTag":
+                return lambda env: key in env.principal_tags
+
+            def get_tag(env):
+                try:
+                    value = env.principal_tags[key]
+                except KeyError:
+                    raise CedarEvaluationError(f"Tag {key!r} not found") from None
+                return value if value.__class__ is str else to_tag_value(value)
+
+            return get_tag
+
+        key_evaluator = self.args[0].compile(cache)
+        is_has = self.method == "hasTag"
+
+        def dynamic_tag(env):
+            key = key_evaluator(env)
+            if not isinstance(key, str):
+                raise CedarEvaluationError("Tag name must be a string")
+            if is_has:
+                return key in env.principal_tags
+            if key not in env.principal_tags:
+                raise CedarEvaluationError(f"Tag {key!r} not found")
+            return to_tag_value(env.principal_tags[key])
+
+        return dynamic_tag
+
+
+class NotExpr(Expr):
+    is_boolean = True
+
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def _build(self, cache):
+        operand = self.operand.compile_boolean(cache)
+        return lambda env: not operand(env)
+
+
+class NegateExpr(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def _build(self, cache):
+        operand = self.operand.compile(cache)
+        return lambda env: -_expect_number(operand(env))
+
+
+class LogicalChainExpr(Expr):
+    """`&&` / `||` 연산. 같은 연산자가 연속된 체인은 하나의 평가 함수로 펼쳐서 컴파일합니다."""
+
+    is_boolean = True
+    is_and = True
+
+    def __init__(self, left: Expr, right: Expr):
+        self.left = left
+        self.right = right
+
+    def _operands(self) -> List[Expr]:
+        operands = []
+        for node in (self.left, self.right):
+            if node.__class__ is self.__class__:
+                operands.extend(node._operands())
+            else:
+                operands.append(node)
+        return operands
+
+    def _build(self, cache):
+        # 단락 평가: && 는 첫 false, || 는 첫 true에서 멈춤
+        operands = tuple(node.compile_boolean(cache) for node in self._operands())
+        if self.is_and:
+            if len(operands) == 2:
+                first, second = operands
+                return lambda env: first(env) and second(env)
+            if len(operands) == 3:
+                first, second, third = operands
+                return lambda env: first(env) and second(env) and third(env)
+
+            def all_of(env):
+                for operand in operands:
+                    if not operand(env):
+                        return False
+                return True
+
+            return all_of
+
+        if len(operands) == 2:
+            first, second = operands
+            return lambda env: first(env) or second(env)
+
+        def any_of(env):
+            for operand in operands:
+                if operand(env):
+                    return True
+            return False
+
+        return any_of
+
+
+class AndExpr(LogicalChainExpr):
+    is_and = True
+
+
+class OrExpr(LogicalChainExpr):
+    is_and = False
+
+
+class IfThenElseExpr(Expr):
+    def __init__(self, condition: Expr, then_branch: Expr, else_branch: Expr):
+        self.condition = condition
+        self.then_branch = then_branch
+        self.else_branch = else_branch
+
+    def _build(self, cache):
+        condition = self.condition.compile_boolean(cache)
+        then_branch = self.then_branch.compile(cache)
+        else_branch = self.else_branch.compile(cache)
+        return lambda env: then_branch(env) if condition(env) else else_branch(env)
+
+
+def _in(left: Any, right: Any) -> bool:
+    # 엔티티 계층은 모델링하지 않으므로 in은 동일성(또는 집합 포함)으로 평가
+    if not isinstance(left, tuple):
+        raise CedarEvaluationError("'in' requires an entity on the left")
+    if isinstance(right, list):
+        return left in right
+    if isinstance(right, tuple):
+        return left == right
+    raise CedarEvaluationError("'in' requires an entity or set of entities on the right")
+
+
+_BINARY_OPERATIONS = {
+    "==": _cedar_equals,
+    "!=": lambda left, right: not _cedar_equals(left, right),
+    "<": lambda left, right: _expect_number(left) < _expect_number(right),
+    "<=": lambda left, right: _expect_number(left) <= _expect_number(right),
+    ">": lambda left, right: _expect_number(left) > _expect_number(right),
+    ">=": lambda left, right: _expect_number(left) >= _expect_number(right),
+    "+": lambda left, right: _expect_number(left) + _expect_number(right),
+    "-": lambda left, right: _expect_number(left) - _expect_number(right),
+    "*": lambda left, right: _expect_number(left) * _expect_number(right),
+    "in": _in,
+}
+
+_NUMBER_COMPARISONS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge}
+
+
+class BinaryExpr(Expr):
+    def __init__(self, operator: str, left: Expr, right: Expr):
+        self.operator = operator
+        self.left = left
+        self.right = right
+        self.function = _BINARY_OPERATIONS[operator]
+        self.is_boolean = operator not in ("+", "-", "*")
+
+    def _build(self, cache):
+        left = self.left.compile(cache)
+        right_node = self.right
+
+        # 가장 흔한 형태(속성 <op> 리터럴)는 리터럴을 클로저에 고정하여 특수화
+        if isinstance(right_node, LiteralExpr):
+            literal = right_node.value
+            if self.operator in _NUMBER_COMPARISONS and _is_number(literal):
+                compare = _NUMBER_COMPARISONS[self.operator]
+
+                def compare_literal(env):
+                    value = left(env)
+                    if value.__class__ is int or value.__class__ is float:
+                        return compare(value, literal)
+                    return compare(_expect_number(value), literal)
+
+                return compare_literal
+            if self.operator in ("==", "!=") and literal.__class__ in (str, int):
+                literal_class = literal.__class__
+                is_equal = self.operator == "=="
+
+                def equals_literal(env):
+                    value = left(env)
+                    if value.__class__ is literal_class:
+                        return (value == literal) is is_equal
+                    return _cedar_equals(value, literal) is is_equal
+
+                return equals_literal
+
+        right = right_node.compile(cache)
+        function = self.function
+        return lambda env: function(left(env), right(env))
+
+
+def _is_number(value: Any) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float))
+
+
+# ============================================================================
+# Parser
+# ============================================================================
+
+
+class _Parser:
+    def __init__(self, source: str):
+        self.tokens = _tokenize(source)
+        self.index = 0
+
+    # --- token helpers -----------------------------------------------------
+
+    def _peek(self, offset: int = 0) -> Tuple[str, Any, int]:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def _check(self, value: str) -> bool:
+        kind, text, _ = self._peek()
+        return kind in ("op", "ident") and text == value
+
+    def _accept(self, value: str) -> bool:
+        if self._check(value):
+            self.index += 1
+            return True
+        return False
+
+    def _expect(self, value: str) -> None:
+        if not self._accept(value):
+            kind, text, position = self._peek()
+            raise CedarSyntaxError(f"Expected {value!r} at offset {position}, found {text!r}")
+
+    def _expect_kind(self, kind: str) -> Any:
+        token_kind, text, position = self._peek()
+        if token_kind == "pattern":
+            raise CedarSyntaxError(f"'\\*' escape is only allowed in like patterns (offset {position})")
+        if token_kind != kind:
+            raise CedarSyntaxError(f"Expected {kind} at offset {position}, found {text!r}")
+        self.index += 1
+        return text
+
+    # --- policies ------------------------------------------------------------
+
+    def parse_policies(self) -> List[Dict[str, Any]]:
+        policies = []
+        while self._peek()[0] != "eof":
+            policies.append(self._parse_policy())
+        return policies
+
+    def _parse_policy(self) -> Dict[str, Any]:
+        annotations = {}
+        while self._accept("@"):
+            name = self._expect_kind("ident")
+            self._expect("(")
+            annotations[name] = self._expect_kind("string")
+            self._expect(")")
+
+        effect = self._expect_kind("ident")
+        if effect not in ("permit", "forbid"):
+            raise CedarSyntaxError(f"Expected 'permit' or 'forbid', found {effect!r}")
+
+        self._expect("(")
+        principal = self._parse_scope("principal")
+        self._expect(",")
+        action = self._parse_scope("action")
+        self._expect(",")
+        resource = self._parse_scope("resource")
+        self._expect(")")
+
+        conditions = []
+        while self._check("when") or self._check("unless"):
+            kind = self._expect_kind("ident")
+            self._expect("{")
+            conditions.append((kind == "when", self._parse_expression()))
+            self._expect("}")
+        self._expect(";")
+
+        return {
+            "effect": effect,
+            "annotations": annotations,
+            "principal": principal,
+            "action": action,
+            "resource": resource,
+            "conditions": conditions,
+        }
+
+    def _parse_scope(self, variable: str) -> Optional[Tuple[str, Any]]:
+        """스코프 제약을 (연산자, 엔티티 또는 엔티티 목록) 형태로 반환합니다. 제약이 없으면 None."""
+        self._expect(variable)
+        if self._accept("=="):
+            return ("==", self._parse_entity())
+        if self._accept("in"):
+            if self._accept("["):
+                entities = []
+                while not self._accept("]"):
+                    entities.append(self._parse_entity())
+                    if not self._check("]"):
+                        self._expect(",")
+                return ("in", entities)
+            return ("in", [self._parse_entity()])
+        if self._check("is"):
+            raise CedarSyntaxError("'is' scope constraints are not supported")
+        return None
+
+    def _parse_entity(self) -> Entity:
+        path = [self._expect_kind("ident")]
+        self._expect("::")
+        while self._peek()[0] == "ident":
+            path.append(self._expect_kind("ident"))
+            self._expect("::")
+        return ("::".join(path), self._expect_kind("string"))
+
+    # --- expressions ---------------------------------------------------------
+
+    def _parse_expression(self) -> Expr:
+        if self._accept("if"):
+            condition = self._parse_expression()
+            self._expect("then")
+            then_branch = self._parse_expression()
+            self._expect("else")
+            return IfThenElseExpr(condition, then_branch, self._parse_expression())
+        return self._parse_or()
+
+    def _parse_or(self) -> Expr:
+        node = self._parse_and()
+        while self._accept("||"):
+            node = OrExpr(node, self._parse_and())
+        return node
+
+    def _parse_and(self) -> Expr:
+        node = self._parse_relation()
+        while self._accept("&&"):
+            node = AndExpr(node, self._parse_relation())
+        return node
+
+    def _parse_relation(self) -> Expr:
+        node = self._parse_additive()
+        if self._accept("has"):
+            kind, text, position = self._peek()
+            if kind not in ("ident", "string"):
+                raise CedarSyntaxError(f"Expected attribute name after 'has' at offset {position}")
+            self.index += 1
+            return HasExpr(node, text)
+        if self._accept("like"):
+            kind, text, position = self._peek()
+            if kind not in ("string", "pattern"):
+                raise CedarSyntaxError(f"Expected string at offset {position}, found {text!r}")
+            self.index += 1
+            return LikeExpr(node, text)
+        for operator in ("==", "!=", "<=", ">=", "<", ">", "in"):
+            if self._accept(operator):
+                return BinaryExpr(operator, node, self._parse_additive())
+        return node
+
+    def _parse_additive(self) -> Expr:
+        node = self._parse_multiplicative()
+        while self._check("+") or self._check("-"):
+            operator = self._expect_kind("op")
+            node = BinaryExpr(operator, node, self._parse_multiplicative())
+        return node
+
+    def _parse_multiplicative(self) -> Expr:
+        node = self._parse_unary()
+        while self._accept("*"):
+            node = BinaryExpr("*", node, self._parse_unary())
+        return node
+
+    def _parse_unary(self) -> Expr:
+        if self._accept("!"):
+            return NotExpr(self._parse_unary())
+        if self._accept("-"):
+            if self._peek()[0] == "number":
+                return self._parse_member(LiteralExpr(-self._expect_kind("number")))
+            return NegateExpr(self._parse_unary())
+        return self._parse_member(self._parse_primary())
+
+    def _parse_member(self, node: Expr) -> Expr:
+        while True:
+            if self._accept("."):
+                name = self._expect_kind("ident")
+                if self._accept("("):
+                    args = []
+                    while not self._accept(")"):
+                        args.append(self._parse_expression())
+                        if not self._check(")"):
+                            self._expect(",")
+                    node = MethodCallExpr(node, name, args)
+                else:
+                    node = AttributeExpr(node, name)
+            elif self._check("[") and self._peek(1)[0] == "string":
+                self._expect("[")
+                node = AttributeExpr(node, self._expect_kind("string"))
+                self._expect("]")
+            else:
+                return node
+
+    def _parse_primary(self) -> Expr:
+        kind, text, position = self._peek()
+        if kind == "number":
+            self.index += 1
+            return LiteralExpr(text)
+        if kind == "string":
+            self.index += 1
+            return LiteralExpr(text)
+        if kind == "pattern":
+            raise CedarSyntaxError(f"'\\*' escape is only allowed in like patterns (offset {position})")
+        if kind == "ident":
+            if text in ("true", "false"):
+                self.index += 1
+                return LiteralExpr(text == "true")
+            if text in ("principal", "action", "resource", "context"):
+                self.index += 1
+                return VarExpr(text)
+            if self._peek(1)[1] == "::":
+                return LiteralExpr(self._parse_entity())
+        if self._accept("("):
+            node = self._parse_expression()
+            self._expect(")")
+            return node
+        if self._accept("["):
+            items = []
+            while not self._accept("]"):
+                items.append(self._parse_expression())
+                if not self._check("]"):
+                    self._expect(",")
+            return SetExpr(items)
+        if self._accept("{"):
+            fields = []
+            while not self._accept("}"):
+                key_kind, key, key_position = self._peek()
+                if key_kind not in ("ident", "string"):
+                    raise CedarSyntaxError(f"Expected record key at offset {key_position}")
+                self.index += 1
+                self._expect(":")
+                fields.append((key, self._parse_expression()))
+                if not self._check("}"):
+                    self._expect(",")
+            return RecordExpr(fields)
+        raise CedarSyntaxError(f"Unexpected token {text!r} at offset {position}")
+
+
+def parse_policies(statement: str) -> List[Dict[str, Any]]:
+    """
+    Cedar 정책문을 해석합니다.
+
+    Args:
+        statement: 하나 이상의 Cedar 정책이 담긴 문자열
+
+    Returns:
+        정책 정보 딕셔너리 목록 (effect, annotations, principal, action, resource, conditions)
+
+    Raises:
+        CedarSyntaxError: 지원하지 않거나 잘못된 문법
+    """
+    return _Parser(statement).parse_policies()
+
+
+# ============================================================================
+# Policy engine
+# ============================================================================
+
+# 평가 오류로 간주하는 예외 (해당 정책은 만족되지 않은 것으로 처리)
+EVALUATION_ERRORS = (CedarEvaluationError, TypeError)
+
+# (action, resource) 조합별 후보 정책 캐시의 최대 크기
+_CANDIDATE_CACHE_SIZE = 10000
+
+
+def scope_matches(scope: Optional[Tuple[str, Any]], entity: Optional[Entity]) -> bool:
+    if scope is None:
+        return True
+    if entity is None:
+        return False
+    operator_name, target = scope
+    if operator_name == "==":
+        return entity == target
+    return entity in target
+
+
+def _scope_keys(scope: Optional[Tuple[str, Any]]) -> List[Optional[Entity]]:
+    """스코프 제약을 인덱스 키 목록으로 변환합니다 (제약 없음은 None)."""
+    if scope is None:
+        return [None]
+    operator_name, target = scope
+    return [target] if operator_name == "==" else list(target)
+
+
+def to_entity(value: Union[str, Entity, None], default_type: str) -> Optional[Entity]:
+    """'Type::"id"' 문자열, (타입, ID) 튜플, 또는 ID 문자열을 엔티티로 변환합니다."""
+    if value is None or isinstance(value, tuple):
+        return value
+    if '::"' in value and value.endswith('"'):
+        entity_type, entity_id = value.split('::"', 1)
+        return (entity_type, entity_id[:-1])
+    return (default_type, value)
+
+
+def to_tag_value(value: Any) -> Any:
+    """JWT 클레임 값을 Cedar 태그 값(문자열)으로 변환합니다."""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _compile_conditions(
+    conditions: List[Tuple[bool, Expr]],
+    cache: Dict[Tuple, Evaluator]
+) -> Callable[[PolicyRequest], bool]:
+    """when/unless 조건절 전체를 하나의 평가 함수로 컴파일합니다."""
+    compiled = [(is_when, node.compile_boolean(cache)) for is_when, node in conditions]
+    if not compiled:
+        return lambda env: True
+    if len(compiled) == 1:
+        is_when, condition = compiled[0]
+        if is_when:
+            return condition
+        return lambda env: not condition(env)
+
+    def all_conditions(env):
+        for is_when, condition in compiled:
+            if condition(env) is not is_when:
+                return False
+        return True
+
+    return all_conditions
+
+
+class CompiledPolicy:
+    """
+    컴파일된 단일 정책 (스코프와 조건 평가 함수).
+
+    Attributes:
+        id: 정책 ID
+        order: 엔진에 추가된 순서
+        is_forbid: forbid 정책 여부
+        principal: principal 스코프 제약 (없으면 None)
+        conditions: (when 여부, 식 노드) 목록
+        condition: PolicyRequest -> bool 평가 함수 (평가 오류 시 EVALUATION_ERRORS 발생)
+    """
+
+    __slots__ = ("id", "order", "is_forbid", "principal", "conditions", "condition")
+
+    def __init__(self, policy: Dict[str, Any], order: int, cache: Dict[Tuple, Evaluator]):
+        self.id = policy["id"]
+        self.order = order
+        self.is_forbid = policy["effect"] == "forbid"
+        self.principal = policy["principal"]
+        self.conditions = policy["conditions"]
+        self.condition = _compile_conditions(policy["conditions"], cache)
+
+    def applies_to(self, principal: Optional[Entity]) -> bool:
+        """principal 스코프가 주어진 principal 엔티티를 포함하는지 확인합니다."""
+        return self.principal is None or scope_matches(self.principal, principal)
+
+
+class Candidates(NamedTuple):
+    """(action, resource) 요청에 적용될 수 있는 정책 (추가 순서대로 정렬)."""
+
+    action: Optional[Entity]
+    resource: Optional[Entity]
+    forbids: List[CompiledPolicy]
+    permits: List[CompiledPolicy]
+
+
+class LocalPolicyEngine:
+    """
+    Cedar 정책을 로컬에서 평가하는 Policy Engine.
+
+    `create_cedar_policy`에 전달하는 정책문을 그대로 사용하며, JWT 클레임
+    (`decode_token` 결과)과 도구 인자(`context.input`)로 요청을 평가합니다.
+
+    정책은 추가 시 한 번 컴파일되어 스코프의 action / resource 엔티티로 인덱싱됩니다.
+    요청은 해당 (action, resource)에 적용될 수 있는 정책만 평가하므로,
+    정책 수가 많아도 결정 시간은 후보 정책 수에만 비례합니다.
+
+    Args:
+        policies: 정책문 목록, 또는 {정책 ID: 정책문} 딕셔너리
+
+    Example:
+        >>> engine = LocalPolicyEngine({"finance_only": cedar_statement})
+        >>> engine.is_authorized(
+        ...     action="RefundToolTarget___refund",
+        ...     resource=GATEWAY_ARN,
+        ...     principal_tags=decode_token(token),
+        ...     context_input={"amount": 500, "orderId": "test-001"},
+        ... )
+        'ALLOWED'
+    """
+
+    def __init__(self, policies: Union[Iterable[str], Mapping[str, str], None] = None):
+        self.policies: List[Dict[str, Any]] = []
+        # action 키 -> resource 키 -> 정책 목록 (None은 제약 없음)
+        self._index: Dict[Optional[Entity], Dict[Optional[Entity], List[CompiledPolicy]]] = {}
+        # (요청 action, 요청 resource) -> 후보 정책
+        self._candidates: Dict[Tuple[Any, Any], Candidates] = {}
+        # 구조 키 -> 평가 함수 (정책 간 공통 부분식 공유)
+        self._compiled: Dict[Tuple, Evaluator] = {}
+        if policies is None:
+            return
+        if isinstance(policies, str):
+            policies = [policies]
+        items = policies.items() if isinstance(policies, Mapping) else ((None, p) for p in policies)
+        for policy_id, statement in items:
+            self.add_policy(statement, policy_id)
+
+    def add_policy(self, statement: str, policy_id: Optional[str] = None) -> List[str]:
+        """
+        정책문을 추가합니다.
+
+        정책 ID는 `@id("...")` 어노테이션, `policy_id` 인자, 자동 생성 순서로 결정됩니다.
+        한 정책문에 여러 정책이 있으면 `policy_id` 뒤에 `#번호`가 붙습니다.
+
+        Args:
+            statement: Cedar 정책문
+            policy_id: 정책 ID (선택사항)
+
+        Returns:
+            추가된 정책 ID 목록
+        """
+        parsed = parse_policies(statement)
+        added = []
+        for index, policy in enumerate(parsed):
+            if "id" in policy["annotations"]:
+                resolved_id = policy["annotations"]["id"]
+            elif policy_id is not None:
+                resolved_id = policy_id if len(parsed) == 1 else f"{policy_id}#{index}"
+            else:
+                resolved_id = f"policy{len(self.policies)}"
+            policy["id"] = resolved_id
+
+            compiled = CompiledPolicy(policy, len(self.policies), self._compiled)
+            for action_key in _scope_keys(policy["action"]):
+                by_resource = self._index.setdefault(action_key, {})
+                for resource_key in _scope_keys(policy["resource"]):
+                    by_resource.setdefault(resource_key, []).append(compiled)
+
+            self.policies.append(policy)
+            added.append(resolved_id)
+
+        self._candidates.clear()
+        return added
+
+    def candidate_count(self, action: Union[str, Entity], resource: Union[str, Entity, None] = None) -> int:
+        """(action, resource) 요청에 대해 평가 대상이 되는 정책 수를 반환합니다."""
+        _, _, forbids, permits = self.candidates(action, resource)
+        return len(forbids) + len(permits)
+
+    def candidates(self, action: Union[str, Entity], resource: Union[str, Entity, None] = None) -> Candidates:
+        """
+        (action, resource) 요청에 적용될 수 있는 forbid / permit 정책을 반환합니다.
+
+        principal 스코프와 조건은 확인하지 않습니다 (CompiledPolicy.applies_to / condition 사용).
+        결과는 정책이 추가될 때까지 캐시되므로 수정하지 마세요.
+        """
+        key = (action, resource)
+        entry = self._candidates.get(key)
+        if entry is not None:
+            return entry
+
+        action_entity = to_entity(action, ACTION_TYPE)
+        resource_entity = to_entity(resource, GATEWAY_TYPE)
+
+        matched: Dict[int, CompiledPolicy] = {}
+        for action_key in {action_entity, None}:
+            by_resource = self._index.get(action_key)
+            if not by_resource:
+                continue
+            for resource_key in {resource_entity, None}:
+                for policy in by_resource.get(resource_key, ()):
+                    matched[policy.order] = policy
+
+        ordered = [matched[order] for order in sorted(matched)]
+        entry = Candidates(
+            action_entity,
+            resource_entity,
+            [policy for policy in ordered if policy.is_forbid],
+            [policy for policy in ordered if not policy.is_forbid],
+        )
+        if len(self._candidates) >= _CANDIDATE_CACHE_SIZE:
+            self._candidates.clear()
+        self._candidates[key] = entry
+        return entry
+
+    def _make_env(self, entry, principal_tags, context_input, principal) -> PolicyRequest:
+        if context_input is None:
+            context_input = {}
+        elif context_input.__class__ is not dict:
+            context_input = dict(context_input)
+        return PolicyRequest(
+            principal=to_entity(principal, "AgentCore::OAuthUser"),
+            principal_tags=principal_tags if principal_tags is not None else {},
+            action=entry.action,
+            resource=entry.resource,
+            context={"input": context_input},
+        )
+
+    def evaluate(
+        self,
+        action: Union[str, Entity],
+        resource: Union[str, Entity, None] = None,
+        principal_tags: Optional[Mapping[str, Any]] = None,
+        context_input: Optional[Mapping[str, Any]] = None,
+        principal: Union[str, Entity, None] = None
+    ) -> Dict[str, Any]:
+        """
+        요청을 평가하고 결정 근거를 함께 반환합니다.
+
+        Args:
+            action: 도구 이름 (예: "RefundToolTarget___refund") 또는 Action 엔티티
+            resource: Gateway ARN 또는 Gateway 엔티티
+            principal_tags: principal 태그 (JWT 클레임)
+            context_input: 도구 인자 (context.input, JSON 값)
+            principal: principal 엔티티 (스코프에서 특정 principal을 지정한 경우에만 필요)
+
+        Returns:
+            {"decision": "ALLOWED" | "DENIED",
+             "determining_policies": [정책 ID],
+             "errors": [(정책 ID, 오류 메시지)]}
+        """
+        entry = self.candidates(action, resource)
+        env = self._make_env(entry, principal_tags, context_input, principal)
+
+        satisfied = {True: [], False: []}
+        errors: List[Tuple[str, str]] = []
+        for policy in entry.forbids + entry.permits:
+            if policy.principal is not None and not scope_matches(policy.principal, env.principal):
+                continue
+            try:
+                if policy.condition(env):
+                    satisfied[policy.is_forbid].append(policy.id)
+            except EVALUATION_ERRORS as e:
+                errors.append((policy.id, str(e)))
+
+        if satisfied[True]:
+            return {"decision": DENIED, "determining_policies": satisfied[True], "errors": errors}
+        if satisfied[False]:
+            return {"decision": ALLOWED, "determining_policies": satisfied[False], "errors": errors}
+        return {"decision": DENIED, "determining_policies": [], "errors": errors}
+
+    def is_authorized(
+        self,
+        action: Union[str, Entity],
+        resource: Union[str, Entity, None] = None,
+        principal_tags: Optional[Mapping[str, Any]] = None,
+        context_input: Optional[Mapping[str, Any]] = None,
+        principal: Union[str, Entity, None] = None
+    ) -> str:
+        """
+        요청을 평가하여 `analyze_response`와 같은 형식의 결과를 반환합니다.
+
+        forbid 정책이 만족되거나 permit 정책이 만족되는 즉시 평가를 멈춥니다.
+
+        Returns:
+            'ALLOWED' 또는 'DENIED'
+        """
+        entry = self.candidates(action, resource)
+        forbids, permits = entry.forbids, entry.permits
+        if not permits:
+            return DENIED
+
+        env = self._make_env(entry, principal_tags, context_input, principal)
+        principal_entity = env.principal
+        for policy in forbids:
+            if policy.principal is not None and not scope_matches(policy.principal, principal_entity):
+                continue
+            try:
+                if policy.condition(env):
+                    return DENIED
+            except EVALUATION_ERRORS:
+                pass
+        for policy in permits:
+            if policy.principal is not None and not scope_matches(policy.principal, principal_entity):
+                continue
+            try:
+                if policy.condition(env):
+                    return ALLOWED
+            except EVALUATION_ERRORS:
+                pass
+        return DENIED
+
+
+def evaluate_requests(
+    engine: LocalPolicyEngine,
+    request_args: Sequence[Mapping[str, Any]]
+) -> List[str]:
+    """
+    여러 요청을 평가합니다.
+
+    Args:
+        engine: LocalPolicyEngine
+        request_args: evaluate() 인자 딕셔너리 목록
+                  (action, resource, principal_tags, context_input, principal)
+
+    Returns:
+        요청 순서대로의 'ALLOWED' / 'DENIED' 목록
+    """
+    return [engine.is_authorized(**request) for request in request_args]
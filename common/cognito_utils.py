@@ -6,11 +6,10 @@ Amazon Cognito Lambda Trigger 설정 함수를 제공합니다.
 
 import json
 import time
-import os
-import zipfile
-import tempfile
 from typing import Dict, Any, Optional
 
+from .lambda_utils import build_zip_package, create_function_when_role_ready, update_function_code_if_changed
+
 
 def create_lambda_function(
     lambda_client,
@@ -81,70 +80,62 @@ def lambda_handler(event, context):
     return event
 '''
 
-    # 배포 패키지 생성
-    with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp_file:
-        zip_path = tmp_file.name
-        with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zipf:
-            zipf.writestr("lambda_function.py", lambda_code)
+    # 배포 패키지 생성 (메모리)
+    zip_content = build_zip_package({"lambda_function.py": lambda_code})
 
-    try:
-        with open(zip_path, "rb") as f:
-            zip_content = f.read()
-
-        # 기존 함수 업데이트 시도
-        try:
-            lambda_client.update_function_code(
-                FunctionName=function_name, ZipFile=zip_content
-            )
+    # 기존 함수는 코드가 바뀐 경우에만 업데이트
+    existing = update_function_code_if_changed(lambda_client, function_name, zip_content)
+    if existing:
+        if existing["updated"]:
             print("✓ Lambda 함수 코드 업데이트됨")
-            response = lambda_client.get_function(FunctionName=function_name)
-            return response["Configuration"]["FunctionArn"]
-
-        except lambda_client.exceptions.ResourceNotFoundException:
-            # 새 함수 생성 (IAM 역할 포함)
-            role_name = f"{function_name}-role"
-            role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
-
-            # 필요시 IAM 역할 생성
-            try:
-                iam_client.create_role(
-                    RoleName=role_name,
-                    AssumeRolePolicyDocument=json.dumps(
+        else:
+            print("✓ Lambda 함수 코드 변경 없음 (업데이트 생략)")
+        return existing["function_arn"]
+
+    # 새 함수 생성 (IAM 역할 포함)
+    role_name = f"{function_name}-role"
+    role_arn = f"arn:aws:iam::{account_id}:role/{role_name}"
+
+    # 필요시 IAM 역할 생성
+    role_created_at = time.monotonic()
+    try:
+        iam_client.create_role(
+            RoleName=role_name,
+            AssumeRolePolicyDocument=json.dumps(
+                {
+                    "Version": "2012-10-17",
+                    "Statement": [
                         {
-                            "Version": "2012-10-17",
-                            "Statement": [
-                                {
-                                    "Effect": "Allow",
-                                    "Principal": {"Service": "lambda.amazonaws.com"},
-                                    "Action": "sts:AssumeRole",
-                                }
-                            ],
+                            "Effect": "Allow",
+                            "Principal": {"Service": "lambda.amazonaws.com"},
+                            "Action": "sts:AssumeRole",
                         }
-                    ),
-                )
-                iam_client.attach_role_policy(
-                    RoleName=role_name,
-                    PolicyArn="arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
-                )
-                print(f"✓ IAM 역할 생성됨: {role_name}")
-                print("  IAM 역할 전파 대기 중...")
-                time.sleep(10)
-            except iam_client.exceptions.EntityAlreadyExistsException:
-                print(f"  IAM 역할이 이미 존재함: {role_name}")
-
-            response = lambda_client.create_function(
-                FunctionName=function_name,
-                Runtime="python3.12",
-                Role=role_arn,
-                Handler="lambda_function.lambda_handler",
-                Code={"ZipFile": zip_content},
-                Timeout=30,
-                MemorySize=128,
-            )
-            print("✓ Lambda 함수 생성됨")
-            return response["FunctionArn"]
-    finally:
-        os.remove(zip_path)
+                    ],
+                }
+            ),
+        )
+        iam_client.attach_role_policy(
+            RoleName=role_name,
+            PolicyArn="arn:aws:iam::aws:policy/service-role/AWSLambdaBasicExecutionRole",
+        )
+        print(f"✓ IAM 역할 생성됨: {role_name}")
+    except iam_client.exceptions.EntityAlreadyExistsException:
+        print(f"  IAM 역할이 이미 존재함: {role_name}")
+
+    # 역할 전파가 끝날 때까지 create_function 재시도 (고정 대기 없음)
+    response, propagation_seconds = create_function_when_role_ready(
+        lambda_client,
+        since=role_created_at,
+        FunctionName=function_name,
+        Runtime="python3.12",
+        Role=role_arn,
+        Handler="lambda_function.lambda_handler",
+        Code={"ZipFile": zip_content},
+        Timeout=30,
+        MemorySize=128,
+    )
+    print(f"✓ Lambda 함수 생성됨 (IAM 역할 전파 대기: {propagation_seconds:.1f}초)")
+    return response["FunctionArn"]
 
 
 def configure_cognito_trigger(
@@ -5,12 +5,14 @@ Amazon Bedrock AgentCore Gateway setup and management functions,
 including MCP server target support.
 """
 
-import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Collection, Iterator, Optional, List
 from urllib.parse import quote
 
 from botocore.exceptions import ClientError
 
+from .pagination import find_first, iter_pages
+from .waiter import Deadline, fetch_or_none, wait_for_status
+
 
 def get_gateway_details(gateway_control_client, gateway_id: str) -> Dict[str, Any]:
     """
@@ -30,37 +32,43 @@ def wait_for_gateway_ready(
     gateway_control_client,
     gateway_id: str,
     max_wait: int = 300,
-    poll_interval: int = 5
+    poll_interval: int = 5,
+    deadline: Optional[Deadline] = None
 ) -> bool:
     """
     Wait for Gateway to reach READY state.
 
+    Polls with exponential backoff starting at a sub-second interval, so fast
+    transitions are detected quickly while long ones poll less often.
+
     Args:
         gateway_control_client: bedrock-agentcore-control boto3 client
         gateway_id: Gateway ID
         max_wait: Maximum wait time (seconds)
-        poll_interval: Status check interval (seconds)
+        poll_interval: Maximum status check interval (seconds)
+        deadline: Deadline shared with other waits (optional)
 
     Returns:
         Whether READY state was reached
     """
-    terminal_states = {"READY", "FAILED", "UPDATE_UNSUCCESSFUL"}
-    start_time = time.time()
-
-    while time.time() - start_time < max_wait:
-        gateway = get_gateway_details(gateway_control_client, gateway_id)
-        status = gateway.get("status", "UNKNOWN")
-        print(f"  Gateway status: {status}")
-
-        if status == "READY":
-            return True
-        if status in terminal_states:
-            print(f"  ✗ Gateway reached terminal state: {status}")
-            return False
-
-        time.sleep(poll_interval)
+    result = wait_for_status(
+        lambda: fetch_or_none(gateway_control_client.get_gateway, gatewayIdentifier=gateway_id),
+        success_states={"READY"},
+        failure_states={"FAILED", "UPDATE_UNSUCCESSFUL"},
+        timeout=max_wait,
+        deadline=deadline,
+        max_interval=poll_interval,
+        on_status=lambda status: print(f"  Gateway status: {status or 'NOT_FOUND'}"),
+    )
 
-    print("  ✗ Gateway wait timeout")
+    if result["ok"]:
+        return True
+    if result["reason"] == "failure":
+        print(f"  ✗ Gateway reached terminal state: {result['status']}")
+    elif result["reason"] == "error":
+        print(f"  ✗ Gateway status check error: {result['error']}")
+    else:
+        print("  ✗ Gateway wait timeout")
     return False
 
 
@@ -371,12 +379,99 @@ def get_gateway_target(
         return None
 
 
+def iter_gateways(
+    gateway_control_client,
+    page_size: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all Gateways in the account, following nextToken lazily.
+
+    Args:
+        gateway_control_client: bedrock-agentcore-control boto3 client
+        page_size: Maximum items per page (optional)
+
+    Yields:
+        Gateway summaries
+
+    Raises:
+        ClientError: If a page request fails
+    """
+    yield from iter_pages(gateway_control_client.list_gateways, "items", page_size=page_size)
+
+
+def find_gateway(
+    gateway_control_client,
+    name: str,
+    statuses: Optional[Collection[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a Gateway by name, stopping at the first match.
+
+    Args:
+        gateway_control_client: bedrock-agentcore-control boto3 client
+        name: Gateway name
+        statuses: Accepted statuses (optional, e.g. {"READY"})
+
+    Returns:
+        Gateway summary, or None if not found
+    """
+    return find_first(iter_gateways(gateway_control_client), name=name, statuses=statuses)
+
+
+def iter_gateway_targets(
+    gateway_control_client,
+    gateway_id: str,
+    page_size: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over all targets of a Gateway, following nextToken lazily.
+
+    Args:
+        gateway_control_client: bedrock-agentcore-control boto3 client
+        gateway_id: Gateway ID
+        page_size: Maximum items per page (optional)
+
+    Yields:
+        Target summaries
+
+    Raises:
+        ClientError: If a page request fails
+    """
+    yield from iter_pages(
+        gateway_control_client.list_gateway_targets,
+        "items",
+        page_size=page_size,
+        gatewayIdentifier=gateway_id,
+    )
+
+
+def find_gateway_target(
+    gateway_control_client,
+    gateway_id: str,
+    name: str,
+    statuses: Optional[Collection[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Find a Gateway target by name, stopping at the first match.
+
+    Args:
+        gateway_control_client: bedrock-agentcore-control boto3 client
+        gateway_id: Gateway ID
+        name: Target name
+        statuses: Accepted statuses (optional)
+
+    Returns:
+        Target summary, or None if not found
+    """
+    return find_first(iter_gateway_targets(gateway_control_client, gateway_id), name=name, statuses=statuses)
+
+
 def list_gateway_targets(
     gateway_control_client,
     gateway_id: str
 ) -> List[Dict[str, Any]]:
     """
-    List all Gateway targets.
+    List all Gateway targets (all pages).
 
     Args:
         gateway_control_client: bedrock-agentcore-control boto3 client
@@ -389,11 +484,7 @@ def list_gateway_targets(
     print("=" * 70)
 
     try:
-        response = gateway_control_client.list_gateway_targets(
-            gatewayIdentifier=gateway_id
-        )
-
-        targets = response.get("targets", [])
+        targets = list(iter_gateway_targets(gateway_control_client, gateway_id))
         print(f"  Found {len(targets)} target(s)")
 
         for target in targets:
@@ -411,7 +502,8 @@ def wait_for_target_ready(
     gateway_id: str,
     target_id: str,
     max_wait: int = 120,
-    poll_interval: int = 5
+    poll_interval: int = 5,
+    deadline: Optional[Deadline] = None
 ) -> bool:
     """
     Wait for Gateway target to reach READY state.
@@ -421,34 +513,39 @@ def wait_for_target_ready(
         gateway_id: Gateway ID
         target_id: Target ID
         max_wait: Maximum wait time (seconds)
-        poll_interval: Status check interval (seconds)
+        poll_interval: Maximum status check interval (seconds)
+        deadline: Deadline shared with other waits (optional)
 
     Returns:
         Whether READY state was reached
     """
     print(f"\n⏳ Waiting for Target READY state...")
-    start_time = time.time()
-
-    while time.time() - start_time < max_wait:
-        target = get_gateway_target(gateway_control_client, gateway_id, target_id)
-        if not target:
-            print(f"  ⚠️  Target not found: {target_id}")
-            return False
-
-        status = target.get("status", "UNKNOWN")
-        print(f"  Target status: {status}")
-
-        if status == "READY":
-            print("✓ Target is READY")
-            return True
-
-        if status in ["FAILED", "CREATE_FAILED"]:
-            print(f"✗ Target failed: {target.get('statusReason', 'Unknown')}")
-            return False
-
-        time.sleep(poll_interval)
+    result = wait_for_status(
+        lambda: fetch_or_none(
+            gateway_control_client.get_gateway_target,
+            gatewayIdentifier=gateway_id,
+            targetId=target_id,
+        ),
+        success_states={"READY"},
+        failure_states={"FAILED", "CREATE_FAILED"},
+        timeout=max_wait,
+        deadline=deadline,
+        max_interval=poll_interval,
+        fail_if_missing=True,
+        on_status=lambda status: print(f"  Target status: {status or 'NOT_FOUND'}"),
+    )
 
-    print("✗ Target wait timeout")
+    if result["ok"]:
+        print("✓ Target is READY")
+        return True
+    if result["reason"] == "missing":
+        print(f"  ⚠️  Target not found: {target_id}")
+    elif result["reason"] == "failure":
+        print(f"✗ Target failed: {result['resource'].get('statusReason', 'Unknown')}")
+    elif result["reason"] == "error":
+        print(f"✗ Target status check error: {result['error']}")
+    else:
+        print("✗ Target wait timeout")
     return False
 
 
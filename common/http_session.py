@@ -0,0 +1,120 @@
+"""
+HTTP 세션 유틸리티 모듈
+
+토큰 발급 및 Gateway 호출에 공유하는 커넥션 풀 기반 HTTP 세션을 제공합니다.
+"""
+
+import random
+import threading
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_CONNECT_TIMEOUT = 3.05
+DEFAULT_READ_TIMEOUT = 30.0
+# 서버가 요청을 처리하지 않았음이 보장되는 응답만 재시도
+# (500/502/504는 refund 같은 tools/call이 이미 실행되었을 수 있으므로 제외)
+RETRY_STATUS_CODES = (429, 503)
+
+_default_session: Optional["PooledSession"] = None
+_default_session_lock = threading.Lock()
+
+
+class _JitterRetry(Retry):
+    """지수 백오프에 full jitter를 적용하는 Retry (urllib3 1.x/2.x 공용)."""
+
+    def get_backoff_time(self) -> float:
+        backoff = super().get_backoff_time()
+        return random.uniform(0, backoff) if backoff > 0 else 0
+
+
+class PooledSession(requests.Session):
+    """
+    Keep-alive 커넥션 풀과 기본 타임아웃을 갖는 requests.Session.
+
+    호스트별로 `pool_maxsize`개의 커넥션을 유지하며, 호출 시 timeout을
+    지정하지 않으면 (connect_timeout, read_timeout)을 사용합니다.
+    연결 오류와 429/503 응답은 jitter가 적용된 지수 백오프로 재시도합니다.
+    요청이 처리되었을 수 있는 다른 5xx 응답과 읽기 타임아웃은 재시도하지 않습니다.
+
+    Args:
+        pool_connections: 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 최대 커넥션 수
+        connect_timeout: 연결 타임아웃 (초)
+        read_timeout: 응답 대기 타임아웃 (초)
+        max_retries: 429/503 및 연결 오류 재시도 횟수
+        backoff_factor: 재시도 백오프 기준 시간 (초)
+
+    Example:
+        >>> session = PooledSession(pool_maxsize=50, read_timeout=10)
+        >>> token = get_bearer_token(endpoint, client_id, secret, session=session)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 20,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5
+    ):
+        super().__init__()
+        self.timeout: Tuple[float, float] = (connect_timeout, read_timeout)
+
+        retry = _JitterRetry(
+            total=max_retries,
+            connect=max_retries,
+            read=0,
+            status=max_retries,
+            status_forcelist=RETRY_STATUS_CODES,
+            # 토큰 발급과 tools/call 모두 POST 이므로 재시도 대상에 포함
+            # (처리되지 않은 요청만 재시도하므로 POST도 안전)
+            allowed_methods=None,
+            backoff_factor=backoff_factor,
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Connection"] = "keep-alive"
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def get_http_session() -> PooledSession:
+    """
+    프로세스 전역에서 공유하는 기본 세션을 반환합니다 (최초 호출 시 생성).
+
+    Returns:
+        공유 PooledSession
+    """
+    global _default_session
+    if _default_session is None:
+        with _default_session_lock:
+            if _default_session is None:
+                _default_session = PooledSession()
+    return _default_session
+
+
+def set_http_session(session: Optional[PooledSession]) -> None:
+    """
+    기본 세션을 교체합니다 (예: 풀 크기나 타임아웃을 변경할 때).
+
+    Args:
+        session: 새 기본 세션, None이면 다음 호출 시 기본값으로 다시 생성
+    """
+    global _default_session
+    with _default_session_lock:
+        previous, _default_session = _default_session, session
+    if previous is not None and previous is not session:
+        previous.close()
@@ -0,0 +1,182 @@
+"""
+Lambda 유틸리티 모듈
+
+Lambda 배포 패키지를 메모리에서 만들고, 함수의 CodeSha256과 비교해
+코드가 바뀐 경우에만 업로드하는 함수를 제공합니다.
+
+새로 만든 IAM 역할로 Lambda 함수를 생성할 때, 고정 시간 대기 대신
+역할 전파가 끝날 때까지 create_function을 짧은 간격으로 재시도하는 함수도 제공합니다.
+"""
+
+import base64
+import hashlib
+import io
+import time
+import zipfile
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+from botocore.exceptions import ClientError
+
+from .waiter import poll_intervals
+
+# 배포 패키지 고정 메타데이터 (같은 코드는 어느 환경에서든 같은 zip 바이트가 되도록)
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_ZIP_CREATE_SYSTEM = 3  # Unix (Windows에서 만들어도 같은 헤더)
+_ZIP_FILE_MODE = 0o100644  # 일반 파일, rw-r--r--
+# 압축하지 않고 저장 (DEFLATE 출력은 zlib 빌드에 따라 달라질 수 있음)
+_ZIP_COMPRESSION = zipfile.ZIP_STORED
+
+# IAM 역할이 아직 Lambda에 전파되지 않았을 때의 오류 메시지
+_ROLE_NOT_READY_MESSAGES = ("cannot be assumed", "role defined for the function")
+
+
+def build_zip_package(files: Mapping[str, Union[str, bytes]]) -> bytes:
+    """
+    Lambda 배포 패키지(zip)를 메모리에서 결정적으로 만듭니다.
+
+    항목 순서(경로 정렬), 수정 시각, 생성 시스템, 파일 권한을 고정하고 압축 없이
+    저장(ZIP_STORED)하므로, 같은 입력은 zlib 버전 등 실행 환경과 관계없이
+    바이트 단위로 같은 zip이 됩니다. 따라서 code_sha256 값으로 코드 변경 여부를 판단할 수 있습니다.
+    (튜토리얼 Lambda 코드는 작으므로 압축하지 않아도 패키지 크기 제한과 무관합니다.)
+
+    Args:
+        files: {zip 내 경로: 파일 내용 (str은 UTF-8로 인코딩)}
+
+    Returns:
+        zip 바이트
+
+    Example:
+        >>> zip_content = build_zip_package({"lambda_function.py": code})
+        >>> build_zip_package({"lambda_function.py": code}) == zip_content
+        True
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", _ZIP_COMPRESSION) as zipf:
+        for name in sorted(files):
+            content = files[name]
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+            info.compress_type = _ZIP_COMPRESSION
+            info.create_system = _ZIP_CREATE_SYSTEM
+            info.external_attr = _ZIP_FILE_MODE << 16
+            zipf.writestr(info, content)
+    return buffer.getvalue()
+
+
+def code_sha256(zip_content: bytes) -> str:
+    """
+    Lambda `CodeSha256`과 같은 형식(SHA-256 다이제스트의 base64)으로 패키지 해시를 계산합니다.
+
+    Args:
+        zip_content: zip 바이트
+
+    Returns:
+        base64 인코딩된 SHA-256 해시
+    """
+    return base64.b64encode(hashlib.sha256(zip_content).digest()).decode("ascii")
+
+
+def update_function_code_if_changed(
+    lambda_client,
+    function_name: str,
+    zip_content: bytes
+) -> Optional[Dict[str, Any]]:
+    """
+    기존 Lambda 함수의 코드가 패키지와 다를 때만 업로드합니다.
+
+    코드가 같으면 get_function 한 번으로 끝나며, 다르면 update_function_code 후
+    업데이트가 끝날 때까지 대기합니다.
+
+    Args:
+        lambda_client: Lambda boto3 클라이언트
+        function_name: Lambda 함수 이름
+        zip_content: 배포할 zip 바이트
+
+    Returns:
+        {"function_arn": ARN, "updated": 업로드 여부}, 함수가 없으면 None
+    """
+    try:
+        configuration = lambda_client.get_function(FunctionName=function_name)["Configuration"]
+    except lambda_client.exceptions.ResourceNotFoundException:
+        return None
+
+    if configuration.get("CodeSha256") == code_sha256(zip_content):
+        return {"function_arn": configuration["FunctionArn"], "updated": False}
+
+    response = lambda_client.update_function_code(FunctionName=function_name, ZipFile=zip_content)
+    lambda_client.get_waiter("function_updated_v2").wait(FunctionName=function_name)
+    return {"function_arn": response["FunctionArn"], "updated": True}
+
+
+def is_role_not_ready_error(error: Exception) -> bool:
+    """
+    IAM 역할 전파 전이라 Lambda가 역할을 맡을 수 없다는 오류인지 확인합니다.
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        역할 미전파 오류 여부
+    """
+    if not isinstance(error, ClientError):
+        return False
+    details = error.response.get("Error", {})
+    if details.get("Code") != "InvalidParameterValueException":
+        return False
+    message = details.get("Message", "")
+    return any(text in message for text in _ROLE_NOT_READY_MESSAGES)
+
+
+def create_function_when_role_ready(
+    lambda_client,
+    timeout: float = 60,
+    initial_interval: float = 0.5,
+    max_interval: float = 2.0,
+    since: Optional[float] = None,
+    **create_kwargs
+) -> Tuple[Dict[str, Any], float]:
+    """
+    IAM 역할이 전파될 때까지 재시도하며 Lambda 함수를 생성합니다.
+
+    "role cannot be assumed" 오류만 재시도하며, 그 외 오류는 그대로 전파됩니다.
+    대부분 1~3초 안에 성공하고, 전파가 느린 경우에도 timeout까지 재시도합니다.
+
+    Args:
+        lambda_client: Lambda boto3 클라이언트
+        timeout: 최대 재시도 시간 (초)
+        initial_interval: 첫 재시도 간격 (초)
+        max_interval: 최대 재시도 간격 (초)
+        since: 전파 지연 측정 기준 시각 (time.monotonic 값, 예: 역할 생성 직후).
+               None이면 첫 create_function 호출 시각
+        **create_kwargs: create_function 인자
+
+    Returns:
+        (create_function 응답, 관측된 전파 지연 시간 (초))
+
+    Raises:
+        ClientError: 역할 미전파가 아닌 오류 또는 timeout 초과 시
+
+    Example:
+        >>> role_created_at = time.monotonic()
+        >>> response, delay = create_function_when_role_ready(
+        ...     lambda_client, since=role_created_at,
+        ...     FunctionName=name, Runtime="python3.12", Role=role_arn,
+        ...     Handler="lambda_function.lambda_handler", Code={"ZipFile": zip_content},
+        ... )
+        >>> print(f"IAM 역할 전파: {delay:.1f}초")
+    """
+    start = time.monotonic()
+    since = start if since is None else since
+    deadline = start + timeout
+    intervals = poll_intervals(initial_interval, max_interval)
+
+    while True:
+        try:
+            response = lambda_client.create_function(**create_kwargs)
+            return response, time.monotonic() - since
+        except ClientError as e:
+            remaining = deadline - time.monotonic()
+            if not is_role_not_ready_error(e) or remaining <= 0:
+                raise
+            time.sleep(min(next(intervals), remaining))
@@ -0,0 +1,85 @@
+"""
+목록 API 페이지 순회 유틸리티 모듈
+
+`nextToken`을 따라 AgentCore 목록 API(list_gateways, list_gateway_targets,
+list_policy_engines, list_policies)의 모든 페이지를 순회하는 제너레이터와
+조건에 맞는 첫 항목을 찾는 함수를 제공합니다.
+
+다음 페이지는 필요할 때만 요청하므로, 찾는 항목이 나오면 나머지 페이지는 조회하지 않습니다.
+"""
+
+from typing import Any, Callable, Collection, Dict, Iterable, Iterator, Optional
+
+from .throttle import call_with_backoff
+
+
+def iter_pages(
+    operation: Callable[..., Dict[str, Any]],
+    items_key: str,
+    page_size: Optional[int] = None,
+    **request
+) -> Iterator[Dict[str, Any]]:
+    """
+    목록 API의 항목을 모든 페이지에 걸쳐 순회합니다.
+
+    스로틀링 오류는 call_with_backoff로 재시도하며, 그 외 오류는 그대로 전파됩니다.
+
+    Args:
+        operation: boto3 목록 메서드 (예: client.list_gateways)
+        items_key: 응답에서 항목 목록의 키 (예: "items", "policies")
+        page_size: 페이지당 최대 항목 수 (선택사항, maxResults)
+        **request: 목록 API 요청 인자 (서버 측 필터 포함)
+
+    Yields:
+        항목 딕셔너리
+
+    Raises:
+        ClientError: 조회 실패 시
+
+    Example:
+        >>> for gateway in iter_pages(client.list_gateways, "items", page_size=100):
+        ...     print(gateway["name"])
+    """
+    if page_size:
+        request["maxResults"] = page_size
+
+    while True:
+        response = call_with_backoff(operation, **request)
+        yield from response.get(items_key, [])
+
+        next_token = response.get("nextToken")
+        if not next_token:
+            return
+        request["nextToken"] = next_token
+
+
+def find_first(
+    items: Iterable[Dict[str, Any]],
+    predicate: Optional[Callable[[Dict[str, Any]], bool]] = None,
+    name: Optional[str] = None,
+    statuses: Optional[Collection[str]] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    조건에 맞는 첫 항목을 반환합니다. 찾으면 순회를 즉시 멈춥니다.
+
+    Args:
+        items: 항목 이터러블 (예: iter_pages 결과)
+        predicate: 추가 조건 함수 (선택사항)
+        name: 일치해야 하는 name 값 (선택사항)
+        statuses: 허용하는 status 값 목록 (선택사항)
+
+    Returns:
+        첫 번째로 일치하는 항목, 없으면 None
+
+    Example:
+        >>> find_first(iter_pages(client.list_gateways, "items"), name="my-gateway", statuses={"READY"})
+    """
+    for item in items:
+        if name is not None and item.get("name") != name:
+            continue
+        if statuses is not None and item.get("status") not in statuses:
+            continue
+        if predicate is not None and not predicate(item):
+            continue
+        return item
+    return None
@@ -4,12 +4,19 @@ Policy 유틸리티 모듈
 Policy Engine 및 Cedar 정책 관리 함수를 제공합니다.
 """
 
+import hashlib
+import re
 import time
 import uuid
-from typing import Dict, Any, Optional, List
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Any, Callable, Iterable, Iterator, Mapping, Optional, List, Sequence, Tuple, Union
 
 from botocore.exceptions import ClientError
 
+from .pagination import find_first, iter_pages
+from .throttle import RateLimiter, call_with_backoff
+from .waiter import Deadline, fetch_or_none, poll_intervals, wait_for_many, wait_for_status
+
 
 def create_policy_engine(
     policy_client,
@@ -68,7 +75,8 @@ def get_policy_engine(policy_client, policy_engine_id: str) -> Optional[Dict[str
 def wait_for_policy_engine_active(
     policy_client,
     policy_engine_id: str,
-    timeout: int = 300
+    timeout: int = 300,
+    deadline: Optional[Deadline] = None
 ) -> bool:
     """
     Policy Engine이 ACTIVE 상태가 될 때까지 대기합니다.
@@ -77,33 +85,31 @@ def wait_for_policy_engine_active(
         policy_client: bedrock-agentcore-control boto3 클라이언트
         policy_engine_id: Policy Engine ID
         timeout: 최대 대기 시간 (초)
+        deadline: 다른 대기 작업과 공유하는 마감 시각 (선택사항)
 
     Returns:
         ACTIVE 상태 도달 여부
     """
     print("\nPolicy Engine ACTIVE 상태 대기 중...")
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        engine = get_policy_engine(policy_client, policy_engine_id)
-        if not engine:
-            time.sleep(5)
-            continue
-
-        status = engine.get("status")
-        print(f"  상태: {status}")
-
-        if status == "ACTIVE":
-            print("✓ Policy Engine이 ACTIVE 상태입니다")
-            return True
-
-        if status in ["CREATE_FAILED", "UPDATE_FAILED", "DELETE_FAILED"]:
-            print(f"✗ Policy Engine 실패: {engine.get('statusReason', '알 수 없음')}")
-            return False
-
-        time.sleep(5)
-
-    print("✗ Policy Engine 대기 시간 초과")
+    result = wait_for_status(
+        lambda: fetch_or_none(policy_client.get_policy_engine, policyEngineId=policy_engine_id),
+        success_states={"ACTIVE"},
+        failure_states={"CREATE_FAILED", "UPDATE_FAILED", "DELETE_FAILED"},
+        timeout=timeout,
+        deadline=deadline,
+        max_interval=5,
+        on_status=lambda status: print(f"  상태: {status or '조회 불가'}"),
+    )
+
+    if result["ok"]:
+        print("✓ Policy Engine이 ACTIVE 상태입니다")
+        return True
+    if result["reason"] == "failure":
+        print(f"✗ Policy Engine 실패: {result['resource'].get('statusReason', '알 수 없음')}")
+    elif result["reason"] == "error":
+        print(f"✗ Policy Engine 상태 조회 오류: {result['error']}")
+    else:
+        print("✗ Policy Engine 대기 시간 초과")
     return False
 
 
@@ -187,7 +193,8 @@ def wait_for_policy_active(
     policy_client,
     policy_engine_id: str,
     policy_id: str,
-    timeout: int = 60
+    timeout: int = 60,
+    deadline: Optional[Deadline] = None
 ) -> bool:
     """
     정책이 ACTIVE 상태가 될 때까지 대기합니다.
@@ -197,32 +204,257 @@ def wait_for_policy_active(
         policy_engine_id: Policy Engine ID
         policy_id: 정책 ID
         timeout: 최대 대기 시간 (초)
+        deadline: 다른 대기 작업과 공유하는 마감 시각 (선택사항)
 
     Returns:
         ACTIVE 상태 도달 여부
     """
-    start_time = time.time()
+    result = wait_for_status(
+        lambda: fetch_or_none(policy_client.get_policy, policyEngineId=policy_engine_id, policyId=policy_id),
+        success_states={"ACTIVE"},
+        failure_states={"CREATE_FAILED", "UPDATE_FAILED"},
+        timeout=timeout,
+        deadline=deadline,
+        max_interval=3,
+        fail_if_missing=True,
+        on_status=lambda status: print(f"  정책 상태: {status or '조회 불가'}"),
+    )
+
+    if result["ok"]:
+        return True
+    if result["reason"] == "missing":
+        print(f"  ⚠️  정책을 찾을 수 없음: {policy_id}")
+    elif result["reason"] == "failure":
+        print(f"  ✗ 정책 실패: {result['resource'].get('statusReason', '알 수 없음')}")
+    elif result["reason"] == "error":
+        print(f"  ✗ 정책 상태 조회 오류: {result['error']}")
+    else:
+        print("  ✗ 정책 ACTIVE 대기 시간 초과")
+    return False
 
-    while time.time() - start_time < timeout:
-        policy = get_policy(policy_client, policy_engine_id, policy_id)
-        if not policy:
-            print(f"  ⚠️  정책을 찾을 수 없음: {policy_id}")
-            return False
 
-        status = policy.get("status")
-        print(f"  정책 상태: {status}")
+def wait_for_policies_active(
+    policy_client,
+    policy_engine_id: str,
+    policy_ids: Iterable[str],
+    timeout: int = 300,
+    deadline: Optional[Deadline] = None
+) -> Dict[str, bool]:
+    """
+    여러 정책이 ACTIVE 상태가 될 때까지 함께 대기합니다.
 
-        if status == "ACTIVE":
-            return True
+    정책별로 조회하지 않고 간격마다 `list_policies` 한 번으로 모든 상태를 확인합니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        policy_ids: 정책 ID 목록
+        timeout: 최대 대기 시간 (초)
+        deadline: 다른 대기 작업과 공유하는 마감 시각 (선택사항)
 
-        if status in ["CREATE_FAILED", "UPDATE_FAILED"]:
-            print(f"  ✗ 정책 실패: {policy.get('statusReason', '알 수 없음')}")
-            return False
+    Returns:
+        {정책 ID: ACTIVE 상태 도달 여부}
+    """
+    print("\n정책 ACTIVE 상태 대기 중...")
+    results = wait_for_many(
+        lambda ids: {p.get("policyId"): p for p in iter_policies(policy_client, policy_engine_id)},
+        policy_ids,
+        success_states={"ACTIVE"},
+        failure_states={"CREATE_FAILED", "UPDATE_FAILED"},
+        timeout=timeout,
+        deadline=deadline,
+        max_interval=3,
+    )
+
+    for policy_id, result in results.items():
+        if result["ok"]:
+            continue
+        if result["reason"] == "failure":
+            print(f"  ✗ 정책 실패 {policy_id}: {result['resource'].get('statusReason', '알 수 없음')}")
+        else:
+            print(f"  ✗ 정책 대기 실패 {policy_id}: {result['reason']}")
 
-        time.sleep(3)
+    active = sum(1 for result in results.values() if result["ok"])
+    print(f"✓ {active}/{len(results)}개 정책 ACTIVE")
+    return {policy_id: result["ok"] for policy_id, result in results.items()}
 
-    print("  ✗ 정책 ACTIVE 대기 시간 초과")
-    return False
+
+def apply_policies(
+    policy_client,
+    policy_engine_id: str,
+    policies: Sequence[Tuple[str, ...]],
+    max_workers: int = 8,
+    max_rate: float = 5.0,
+    timeout: int = 300,
+    poll_interval: float = 2.0
+) -> List[Dict[str, Any]]:
+    """
+    여러 Cedar 정책을 병렬로 생성하고 모두 ACTIVE 상태가 될 때까지 대기합니다.
+
+    생성 요청은 스레드 풀에서 초당 `max_rate`회 이내로 보내며, 스로틀링 오류는
+    백오프 후 재시도합니다. 생성된 정책의 상태는 정책별 대기 루프 대신 하나의 공유
+    폴러가 `list_policies`로 한꺼번에 확인합니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        policies: (정책 이름, Cedar 정책문[, 설명]) 튜플 목록
+        max_workers: 동시 생성 요청 수
+        max_rate: 초당 최대 제어 평면 요청 수 (생성 + 상태 조회)
+        timeout: ACTIVE 대기 최대 시간 (초)
+        poll_interval: 상태 조회 간격 (초)
+
+    Returns:
+        입력 순서와 같은 정책별 결과 목록
+        [{"name", "policy_id", "status", "error", "request_seconds", "elapsed_seconds"}]
+        status는 ACTIVE, CREATE_FAILED, ERROR(생성 요청 실패), TIMEOUT 중 하나입니다.
+
+    Example:
+        >>> results = apply_policies(policy_client, engine_id, [
+        ...     ("finance_only", finance_statement, "재무팀만 환불 허용"),
+        ...     ("amount_limit", limit_statement),
+        ... ])
+        >>> all(r["status"] == "ACTIVE" for r in results)
+    """
+    print(f"\nCedar 정책 일괄 생성: {len(policies)}개")
+    print("=" * 70)
+
+    limiter = RateLimiter(rate=max_rate)
+
+    def create(policy: Tuple[str, ...]) -> Callable[[], Dict[str, Any]]:
+        name, statement, *rest = policy
+        return lambda: call_with_backoff(
+            policy_client.create_policy,
+            limiter=limiter,
+            policyEngineId=policy_engine_id,
+            name=name,
+            description=(rest[0] if rest and rest[0] else f"정책: {name}"),
+            definition={"cedar": {"statement": statement}},
+        )
+
+    return _run_policy_operations(
+        policy_client,
+        policy_engine_id,
+        [(policy[0], create(policy)) for policy in policies],
+        limiter,
+        max_workers=max_workers,
+        timeout=timeout,
+        poll_interval=poll_interval,
+    )
+
+
+def _run_policy_operations(
+    policy_client,
+    policy_engine_id: str,
+    operations: Sequence[Tuple[str, Callable[[], Dict[str, Any]]]],
+    limiter: RateLimiter,
+    max_workers: int,
+    timeout: int,
+    poll_interval: float
+) -> List[Dict[str, Any]]:
+    """
+    정책 생성/수정 요청을 스레드 풀에서 실행하고, 하나의 공유 폴러로 ACTIVE 상태를 기다립니다.
+
+    operations는 (정책 이름, 요청 함수) 목록이며, 요청 함수는 policyId와 status가 담긴
+    create_policy / update_policy 응답을 반환합니다.
+    """
+    start_time = time.monotonic()
+    results = [
+        {
+            "name": name,
+            "policy_id": None,
+            "status": "PENDING",
+            "error": None,
+            "request_seconds": None,
+            "elapsed_seconds": None,
+        }
+        for name, _ in operations
+    ]
+
+    def run(index: int) -> Dict[str, Any]:
+        request_start = time.monotonic()
+        response = operations[index][1]()
+        results[index]["request_seconds"] = time.monotonic() - request_start
+        return response
+
+    def finish(index: int, status: str, error: Optional[str] = None) -> None:
+        result = results[index]
+        result["status"] = status
+        result["error"] = error
+        result["elapsed_seconds"] = time.monotonic() - start_time
+        if status == "ACTIVE":
+            print(f"  ✓ {result['name']} ({result['policy_id']}) - {result['elapsed_seconds']:.1f}초")
+        else:
+            print(f"  ✗ {result['name']}: {status} {error or ''}")
+
+    waiting: Dict[str, int] = {}  # 정책 ID -> 입력 인덱스
+    deadline = start_time + timeout
+    next_poll = start_time
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(run, index): index for index in range(len(operations))}
+
+        while pending or waiting:
+            if pending:
+                done, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    try:
+                        response = future.result()
+                        results[index]["policy_id"] = response["policyId"]
+                    except ClientError as e:
+                        error = e.response["Error"]
+                        finish(index, "ERROR", f"{error['Code']}: {error['Message']}")
+                        continue
+                    except Exception as e:
+                        # 연결 오류, 파라미터 검증 오류 등도 정책별 결과로 기록 (일괄 작업은 계속)
+                        finish(index, "ERROR", f"{type(e).__name__}: {e}")
+                        continue
+                    if response.get("status") == "ACTIVE":
+                        finish(index, "ACTIVE")
+                    else:
+                        waiting[response["policyId"]] = index
+
+            now = time.monotonic()
+            if waiting and now >= next_poll:
+                try:
+                    _poll_policy_statuses(policy_client, policy_engine_id, waiting, limiter, finish)
+                except Exception as e:
+                    # 상태 조회 실패는 다음 폴링에서 다시 시도 (대기 시간 초과 시 TIMEOUT)
+                    print(f"  ⚠️  정책 상태 조회 실패: {e}")
+                next_poll = time.monotonic() + poll_interval
+
+            if waiting and time.monotonic() > deadline:
+                for index in waiting.values():
+                    finish(index, "TIMEOUT", "ACTIVE 대기 시간 초과")
+                waiting.clear()
+
+            if waiting and not pending:
+                time.sleep(max(0.0, next_poll - time.monotonic()))
+
+    active = sum(1 for result in results if result["status"] == "ACTIVE")
+    print(f"\n✓ {active}/{len(results)}개 정책 ACTIVE ({time.monotonic() - start_time:.1f}초)")
+    return results
+
+
+def _poll_policy_statuses(policy_client, policy_engine_id: str, waiting: Dict[str, int], limiter, finish) -> None:
+    """대기 중인 정책 상태를 한 번에 조회하고, 결과가 확정된 정책을 waiting에서 제거합니다."""
+    limiter.acquire()
+    statuses = {p.get("policyId"): p for p in list_policies(policy_client, policy_engine_id)}
+
+    for policy_id, index in list(waiting.items()):
+        policy = statuses.get(policy_id)
+        if policy is None:
+            # 목록에 아직 반영되지 않은 정책은 다음 조회에서 확인
+            continue
+
+        status = policy.get("status")
+        if status == "ACTIVE":
+            del waiting[policy_id]
+            finish(index, "ACTIVE")
+        elif status in ["CREATE_FAILED", "UPDATE_FAILED"]:
+            del waiting[policy_id]
+            finish(index, status, policy.get("statusReason", "알 수 없음"))
 
 
 def delete_policy(
@@ -250,12 +482,85 @@ def delete_policy(
         return False
 
 
+def iter_policies(
+    policy_client,
+    policy_engine_id: str,
+    page_size: Optional[int] = None,
+    target_resource_scope: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Policy Engine의 정책을 모든 페이지에 걸쳐 순회합니다.
+
+    `nextToken`을 따라 다음 페이지를 필요할 때 조회하므로, 중간에 순회를 멈추면
+    나머지 페이지는 요청하지 않습니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        page_size: 페이지당 최대 항목 수 (선택사항)
+        target_resource_scope: 대상 리소스(예: Gateway ARN) 서버 측 필터 (선택사항)
+
+    Yields:
+        정책 요약 딕셔너리
+
+    Raises:
+        ClientError: 조회 실패 시
+    """
+    request = {"policyEngineId": policy_engine_id}
+    if target_resource_scope:
+        request["targetResourceScope"] = target_resource_scope
+    yield from iter_pages(policy_client.list_policies, "policies", page_size=page_size, **request)
+
+
+def iter_policy_engines(
+    policy_client,
+    page_size: Optional[int] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    계정의 Policy Engine을 모든 페이지에 걸쳐 순회합니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        page_size: 페이지당 최대 항목 수 (선택사항)
+
+    Yields:
+        Policy Engine 요약 딕셔너리
+
+    Raises:
+        ClientError: 조회 실패 시
+    """
+    yield from iter_pages(policy_client.list_policy_engines, "policyEngines", page_size=page_size)
+
+
+def find_policy_engine(
+    policy_client,
+    name: Optional[str] = None,
+    statuses: Optional[Iterable[str]] = ("ACTIVE",)
+) -> Optional[Dict[str, Any]]:
+    """
+    조건에 맞는 첫 Policy Engine을 찾습니다. 찾으면 나머지 페이지는 조회하지 않습니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        name: Policy Engine 이름 (선택사항, 없으면 이름과 관계없이 검색)
+        statuses: 허용하는 상태 목록 (기본값: ACTIVE, None이면 모든 상태)
+
+    Returns:
+        Policy Engine 요약, 없으면 None
+    """
+    return find_first(
+        iter_policy_engines(policy_client),
+        name=name,
+        statuses=set(statuses) if statuses is not None else None,
+    )
+
+
 def list_policies(
     policy_client,
     policy_engine_id: str
 ) -> List[Dict[str, Any]]:
     """
-    Policy Engine의 모든 정책을 조회합니다.
+    Policy Engine의 모든 정책을 조회합니다 (모든 페이지).
 
     Args:
         policy_client: bedrock-agentcore-control boto3 클라이언트
@@ -263,29 +568,148 @@ def list_policies(
 
     Returns:
         정책 목록
+
+    Raises:
+        ClientError: 조회 실패 시 (스로틀링은 재시도 후)
     """
-    try:
-        response = policy_client.list_policies(policyEngineId=policy_engine_id)
-        return response.get("policies", [])
-    except ClientError:
-        return []
+    return list(iter_policies(policy_client, policy_engine_id))
+
+
+def delete_policies(
+    policy_client,
+    policy_engine_id: str,
+    policies: Sequence[Dict[str, Any]],
+    max_workers: int = 8,
+    max_rate: float = 5.0
+) -> List[Dict[str, Any]]:
+    """
+    여러 정책을 병렬로 삭제합니다.
+
+    삭제 요청은 스레드 풀에서 초당 `max_rate`회 이내로 보내며, 스로틀링 오류는
+    백오프 후 재시도합니다. 이미 삭제된 정책(ResourceNotFoundException)은 성공으로 봅니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        policies: 삭제할 정책 목록 (`list_policies` 결과 항목, policyId 필수)
+        max_workers: 동시 삭제 요청 수
+        max_rate: 초당 최대 삭제 요청 수
+
+    Returns:
+        입력 순서와 같은 정책별 결과 목록
+        [{"policy_id", "name", "status", "error", "seconds"}]
+        status는 DELETED(삭제 요청 완료) 또는 FAILED입니다.
+    """
+    limiter = RateLimiter(rate=max_rate)
+
+    def delete(policy: Dict[str, Any]) -> Dict[str, Any]:
+        outcome = {
+            "policy_id": policy.get("policyId"),
+            "name": policy.get("name"),
+            "status": "DELETED",
+            "error": None,
+            "seconds": None,
+        }
+        request_start = time.monotonic()
+        try:
+            call_with_backoff(
+                policy_client.delete_policy,
+                limiter=limiter,
+                policyEngineId=policy_engine_id,
+                policyId=outcome["policy_id"],
+            )
+            print(f"✓ 정책 삭제됨: {outcome['policy_id']}")
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ResourceNotFoundException":
+                outcome["status"] = "FAILED"
+                outcome["error"] = f"{e.response['Error']['Code']}: {e.response['Error']['Message']}"
+                print(f"⚠️  정책 삭제 실패 {outcome['policy_id']}: {e}")
+        outcome["seconds"] = time.monotonic() - request_start
+        return outcome
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(delete, policies))
+
+
+def wait_for_policies_deleted(
+    policy_client,
+    policy_engine_id: str,
+    policy_ids: Optional[Iterable[str]] = None,
+    timeout: int = 120,
+    poll_interval: float = 3.0
+) -> List[Dict[str, Any]]:
+    """
+    정책이 모두 삭제될 때까지 대기합니다.
+
+    남은 정책이 모두 DELETE_FAILED 상태이면 더 기다리지 않습니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        policy_ids: 대기할 정책 ID 목록 (기본값: Policy Engine의 모든 정책)
+        timeout: 최대 대기 시간 (초)
+        poll_interval: 최대 조회 간격 (초)
+
+    Returns:
+        남아 있는 정책 목록 (모두 삭제되었으면 빈 목록)
+
+    Raises:
+        ClientError: 정책 목록 조회 실패 시 (스로틀링은 재시도 후)
+    """
+    print("\n정책 삭제 완료 대기 중...")
+    start_time = time.time()
+    targets = set(policy_ids) if policy_ids is not None else None
+    intervals = poll_intervals(maximum=poll_interval)
+
+    while True:
+        remaining = [
+            p for p in list_policies(policy_client, policy_engine_id)
+            if targets is None or p.get("policyId") in targets
+        ]
+        if not remaining:
+            print("✓ 모든 정책이 삭제되었습니다")
+            return []
+
+        print(f"  남은 정책: {len(remaining)}개")
+        if all(p.get("status") == "DELETE_FAILED" for p in remaining):
+            print("✗ 남은 정책이 모두 DELETE_FAILED 상태입니다")
+            return remaining
+
+        if time.time() - start_time >= timeout:
+            print("✗ 정책 삭제 대기 시간 초과")
+            return remaining
+
+        time.sleep(next(intervals))
 
 
 def cleanup_existing_policies(
     policy_client,
     policy_engine_id: str,
-    require_confirmation: bool = False
-) -> int:
+    require_confirmation: bool = False,
+    max_workers: int = 8,
+    max_rate: float = 5.0,
+    wait_until_empty: bool = False,
+    timeout: int = 120
+) -> List[Dict[str, Any]]:
     """
     Policy Engine의 기존 정책을 모두 삭제합니다.
 
+    모든 페이지의 정책을 조회한 뒤 병렬로 삭제합니다 (`delete_policies` 참고).
+
     Args:
         policy_client: bedrock-agentcore-control boto3 클라이언트
         policy_engine_id: Policy Engine ID
         require_confirmation: True인 경우 삭제 전 확인 요청
+        max_workers: 동시 삭제 요청 수
+        max_rate: 초당 최대 삭제 요청 수
+        wait_until_empty: True인 경우 삭제 요청한 정책이 모두 사라질 때까지 대기
+        timeout: wait_until_empty 대기 최대 시간 (초)
 
     Returns:
-        삭제된 정책 수
+        정책별 삭제 결과 목록 (삭제한 정책이 없으면 빈 목록)
+        [{"policy_id", "name", "status", "error", "seconds"}]
+        wait_until_empty인 경우 대기 후에도 남은 정책의 status는 해당 정책 상태
+        (예: DELETING, DELETE_FAILED)로 바뀝니다.
     """
     print("\n🧹 기존 정책 확인 중...")
     print("=" * 70)
@@ -294,7 +718,7 @@ def cleanup_existing_policies(
 
     if not policies:
         print("✓ 기존 정책이 없습니다. 진행 준비 완료.")
-        return 0
+        return []
 
     print(f"\n⚠️  {len(policies)}개의 기존 정책 발견:")
     for p in policies:
@@ -312,17 +736,229 @@ def cleanup_existing_policies(
         if confirm != "yes":
             print("\n⏭️  정리를 건너뜁니다. 기존 정책이 유지됩니다.")
             print("   참고: 예상치 못한 정책 평가 결과가 발생할 수 있습니다.")
-            return 0
+            return []
 
     print("\n🗑️  기존 정책 삭제 중...")
-    deleted_count = 0
-    for p in policies:
-        policy_id = p.get("policyId")
-        if policy_id and delete_policy(policy_client, policy_engine_id, policy_id):
-            deleted_count += 1
-
+    outcomes = delete_policies(
+        policy_client,
+        policy_engine_id,
+        [p for p in policies if p.get("policyId")],
+        max_workers=max_workers,
+        max_rate=max_rate,
+    )
+    deleted_count = sum(1 for outcome in outcomes if outcome["status"] == "DELETED")
     print(f"\n✓ {deleted_count}/{len(policies)}개 정책 삭제됨")
-    return deleted_count
+
+    if wait_until_empty:
+        remaining = {
+            p.get("policyId"): p.get("status")
+            for p in wait_for_policies_deleted(
+                policy_client,
+                policy_engine_id,
+                policy_ids=[outcome["policy_id"] for outcome in outcomes if outcome["status"] == "DELETED"],
+                timeout=timeout,
+            )
+        }
+        for outcome in outcomes:
+            if outcome["policy_id"] in remaining and outcome["status"] == "DELETED":
+                outcome["status"] = remaining[outcome["policy_id"]]
+
+    return outcomes
+
+
+# 문자열 리터럴, 주석, 공백, 식별자/숫자, 두 글자 연산자, 그 외 기호 한 글자
+_CEDAR_TOKEN_PATTERN = re.compile(
+    r'"(?:[^"\\]|\\.)*"|//[^\n]*|\s+|[A-Za-z0-9_]+|==|!=|<=|>=|&&|\|\||::|.',
+    re.DOTALL,
+)
+
+
+def normalize_cedar_statement(statement: str) -> str:
+    """
+    Cedar 정책문을 비교용 정규형으로 변환합니다.
+
+    주석을 제거하고 토큰 사이 공백을 하나로 통일하므로, 줄바꿈·들여쓰기·주석만 다른
+    정책문은 같은 정규형을 가집니다. 문자열 리터럴 내부는 그대로 유지됩니다.
+
+    Args:
+        statement: Cedar 정책문
+
+    Returns:
+        정규화된 정책문
+    """
+    tokens = [
+        token for token in _CEDAR_TOKEN_PATTERN.findall(statement)
+        if not token.isspace() and not token.startswith("//")
+    ]
+    return " ".join(tokens)
+
+
+def cedar_statement_hash(statement: str) -> str:
+    """정규화된 Cedar 정책문의 SHA-256 해시를 반환합니다."""
+    return hashlib.sha256(normalize_cedar_statement(statement).encode("utf-8")).hexdigest()
+
+
+def sync_policies(
+    policy_client,
+    policy_engine_id: str,
+    desired: Union[Mapping[str, str], Sequence[Tuple[str, ...]]],
+    delete_extra: bool = True,
+    max_workers: int = 8,
+    max_rate: float = 5.0,
+    timeout: int = 300,
+    poll_interval: float = 2.0,
+    dry_run: bool = False
+) -> Optional[Dict[str, Any]]:
+    """
+    Policy Engine의 정책을 원하는 상태와 일치시킵니다.
+
+    정책 이름으로 기존 정책과 비교하여 바뀐 부분만 반영합니다.
+    정규화한 정책문의 해시(`cedar_statement_hash`)가 같으면 건너뛰고, 다르면
+    `update_policy`로 수정하며, 없는 정책은 생성합니다. 원하는 상태에 없는 정책은
+    생성/수정이 모두 ACTIVE가 된 뒤에 삭제하므로, 반영 도중 정책이 비는 구간이 없습니다.
+    생성/수정에 실패한 정책이 있으면 삭제는 건너뜁니다.
+
+    Args:
+        policy_client: bedrock-agentcore-control boto3 클라이언트
+        policy_engine_id: Policy Engine ID
+        desired: {정책 이름: Cedar 정책문} 또는 (정책 이름, Cedar 정책문[, 설명]) 튜플 목록
+        delete_extra: 원하는 상태에 없는 기존 정책 삭제 여부
+        max_workers: 동시 요청 수
+        max_rate: 초당 최대 제어 평면 요청 수
+        timeout: ACTIVE 대기 최대 시간 (초)
+        poll_interval: 상태 조회 간격 (초)
+        dry_run: True인 경우 변경 계획만 출력하고 반영하지 않음
+
+    Returns:
+        {"created": [정책별 결과], "updated": [정책별 결과], "deleted": [정책별 삭제 결과],
+         "unchanged": [정책 이름], "deletes_skipped": bool}
+        dry_run인 경우 결과 대신 계획된 정책 이름 목록, 기존 정책 조회 실패 시 None
+
+    Example:
+        >>> summary = sync_policies(policy_client, engine_id, {
+        ...     "finance_only": finance_statement,
+        ...     "amount_limit": limit_statement,
+        ... })
+        >>> print(len(summary["updated"]), len(summary["unchanged"]))
+    """
+    print("\n🔄 정책 동기화")
+    print("=" * 70)
+
+    items = desired.items() if isinstance(desired, Mapping) else desired
+    wanted: Dict[str, Tuple[str, Optional[str]]] = {}
+    for name, statement, *rest in items:
+        wanted[name] = (statement, rest[0] if rest else None)
+
+    try:
+        existing_policies = list(iter_policies(policy_client, policy_engine_id))
+    except ClientError as e:
+        print(f"✗ 기존 정책 조회 오류: {e}")
+        return None
+
+    existing: Dict[str, Dict[str, Any]] = {}
+    to_delete: List[Dict[str, Any]] = []
+    for policy in existing_policies:
+        name = policy.get("name")
+        if name in wanted and name not in existing:
+            existing[name] = policy
+        elif delete_extra:
+            # 원하는 상태에 없거나 같은 이름이 중복된 정책
+            to_delete.append(policy)
+
+    to_create, to_update, unchanged = [], [], []
+    for name, (statement, description) in wanted.items():
+        policy = existing.get(name)
+        if policy is None:
+            to_create.append(name)
+            continue
+        current = policy.get("definition", {}).get("cedar", {}).get("statement", "")
+        if (
+            cedar_statement_hash(current) != cedar_statement_hash(statement)
+            or (description is not None and description != policy.get("description"))
+            or policy.get("status") in ["CREATE_FAILED", "UPDATE_FAILED"]
+        ):
+            to_update.append(name)
+        else:
+            unchanged.append(name)
+
+    print(f"  생성: {len(to_create)}개, 수정: {len(to_update)}개, "
+          f"삭제: {len(to_delete)}개, 변경 없음: {len(unchanged)}개")
+    for name in to_create:
+        print(f"   + {name}")
+    for name in to_update:
+        print(f"   ~ {name} (ID: {existing[name].get('policyId')})")
+    for policy in to_delete:
+        print(f"   - {policy.get('name', '이름 없음')} (ID: {policy.get('policyId')})")
+
+    if dry_run:
+        return {
+            "created": to_create,
+            "updated": to_update,
+            "deleted": [policy.get("name") for policy in to_delete],
+            "unchanged": unchanged,
+        }
+
+    limiter = RateLimiter(rate=max_rate)
+
+    def create(name: str) -> Callable[[], Dict[str, Any]]:
+        statement, description = wanted[name]
+        return lambda: call_with_backoff(
+            policy_client.create_policy,
+            limiter=limiter,
+            policyEngineId=policy_engine_id,
+            name=name,
+            description=description or f"정책: {name}",
+            definition={"cedar": {"statement": statement}},
+        )
+
+    def update(name: str) -> Callable[[], Dict[str, Any]]:
+        statement, description = wanted[name]
+        request = {
+            "policyEngineId": policy_engine_id,
+            "policyId": existing[name]["policyId"],
+            "definition": {"cedar": {"statement": statement}},
+        }
+        if description is not None:
+            request["description"] = {"optionalValue": description}
+        return lambda: call_with_backoff(policy_client.update_policy, limiter=limiter, **request)
+
+    operations = [(name, create(name)) for name in to_create] + [(name, update(name)) for name in to_update]
+    results = []
+    if operations:
+        results = _run_policy_operations(
+            policy_client,
+            policy_engine_id,
+            operations,
+            limiter,
+            max_workers=max_workers,
+            timeout=timeout,
+            poll_interval=poll_interval,
+        )
+
+    deleted: List[Dict[str, Any]] = []
+    deletes_skipped = False
+    if to_delete:
+        if all(result["status"] == "ACTIVE" for result in results):
+            print("\n🗑️  원하는 상태에 없는 정책 삭제 중...")
+            deleted = delete_policies(
+                policy_client,
+                policy_engine_id,
+                to_delete,
+                max_workers=max_workers,
+                max_rate=max_rate,
+            )
+        else:
+            deletes_skipped = True
+            print("\n⚠️  생성/수정에 실패한 정책이 있어 삭제를 건너뜁니다")
+
+    print("\n✓ 정책 동기화 완료")
+    return {
+        "created": results[:len(to_create)],
+        "updated": results[len(to_create):],
+        "deleted": deleted,
+        "unchanged": unchanged,
+        "deletes_skipped": deletes_skipped,
+    }
 
 
 def ensure_policy_engine(
@@ -354,14 +990,11 @@ def ensure_policy_engine(
 
     # 기존 Policy Engine 목록 확인
     try:
-        response = policy_client.list_policy_engines()
-        engines = response.get("policyEngines", [])
-
-        for engine in engines:
-            if engine.get("status") == "ACTIVE":
-                found_id = engine["policyEngineId"]
-                print(f"✓ 기존 ACTIVE Policy Engine 발견: {found_id}")
-                return found_id
+        engine = find_policy_engine(policy_client)
+        if engine:
+            found_id = engine["policyEngineId"]
+            print(f"✓ 기존 ACTIVE Policy Engine 발견: {found_id}")
+            return found_id
     except ClientError:
         pass
 
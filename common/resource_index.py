@@ -0,0 +1,216 @@
+"""
+리소스 이름 인덱스 모듈
+
+Gateway, Target, Policy Engine, Policy 이름을 ID/ARN으로 변환하는 로컬 캐시를 제공합니다.
+
+범위(예: 특정 Gateway의 Target 목록)별로 한 번의 페이지 순회로 인덱스를 채우고,
+TTL이 지나면 다시 조회합니다. 직접 생성/삭제한 리소스는 인덱스에 바로 반영하며,
+파일 경로를 지정하면 인덱스를 디스크에 저장해 다음 실행에서 API 호출 없이 이름을 찾습니다.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+from .gateway_utils import iter_gateway_targets, iter_gateways
+from .policy_utils import iter_policies, iter_policy_engines
+
+DEFAULT_TTL = 300
+
+# 리소스 종류별 (ID 필드, ARN 필드)
+_RESOURCE_FIELDS = {
+    "gateway": ("gatewayId", "gatewayArn"),
+    "target": ("targetId", None),
+    "policy_engine": ("policyEngineId", "policyEngineArn"),
+    "policy": ("policyId", "policyArn"),
+}
+
+
+def _entry(kind: str, resource: Dict[str, Any]) -> Dict[str, Any]:
+    id_field, arn_field = _RESOURCE_FIELDS[kind]
+    return {
+        "id": resource.get(id_field),
+        "arn": resource.get(arn_field) if arn_field else None,
+        "status": resource.get("status"),
+    }
+
+
+class ResourceIndex:
+    """
+    이름 → {id, arn, status} TTL 캐시.
+
+    범위 키는 종류별로 다릅니다: gateway / policy_engine은 범위 없음,
+    target은 Gateway ID, policy는 Policy Engine ID.
+
+    Args:
+        control_client: bedrock-agentcore-control boto3 클라이언트
+        ttl: 범위별 인덱스 유효 시간 (초)
+        path: 인덱스를 저장할 JSON 파일 경로 (선택사항)
+
+    Example:
+        >>> index = ResourceIndex(control_client, path=".resource_index.json")
+        >>> gateway = index.gateway("TestGWforPolicyEngine")
+        >>> if gateway:
+        ...     print(gateway["id"])
+        >>> index.record_created("target", target_response, scope=gateway["id"])
+    """
+
+    def __init__(self, control_client, ttl: float = DEFAULT_TTL,
+                 path: Optional[Union[str, Path]] = None):
+        self.client = control_client
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._scopes: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if self.path:
+            self._load()
+
+    @staticmethod
+    def _scope_key(kind: str, scope: Optional[str]) -> str:
+        if kind not in _RESOURCE_FIELDS:
+            raise ValueError(f"Unknown resource kind: {kind}")
+        return f"{kind}:{scope or ''}"
+
+    def _sweep(self, kind: str, scope: Optional[str]) -> Iterable[Dict[str, Any]]:
+        sweeps: Dict[str, Callable[[], Iterable[Dict[str, Any]]]] = {
+            "gateway": lambda: iter_gateways(self.client),
+            "target": lambda: iter_gateway_targets(self.client, scope),
+            "policy_engine": lambda: iter_policy_engines(self.client),
+            "policy": lambda: iter_policies(self.client, scope),
+        }
+        return sweeps[kind]()
+
+    def _fresh_names(self, kind: str, scope: Optional[str]) -> Dict[str, Dict[str, Any]]:
+        key = self._scope_key(kind, scope)
+        with self._lock:
+            cached = self._scopes.get(key)
+            if cached and time.time() - cached["loaded_at"] < self.ttl:
+                return cached["names"]
+
+        names = {}
+        for resource in self._sweep(kind, scope):
+            if resource.get("name"):
+                names[resource["name"]] = _entry(kind, resource)
+
+        with self._lock:
+            self._scopes[key] = {"loaded_at": time.time(), "names": names}
+            self._save()
+        return names
+
+    def resolve(self, kind: str, name: str, scope: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        이름으로 리소스를 찾습니다. 범위 인덱스가 없거나 만료되었으면 한 번 순회해 채웁니다.
+
+        Args:
+            kind: "gateway" | "target" | "policy_engine" | "policy"
+            name: 리소스 이름
+            scope: target은 Gateway ID, policy는 Policy Engine ID
+
+        Returns:
+            {"id": ..., "arn": ..., "status": ...}, 없으면 None
+
+        Raises:
+            ClientError: 인덱스를 채우는 목록 조회 실패 시
+        """
+        entry = self._fresh_names(kind, scope).get(name)
+        return dict(entry) if entry else None
+
+    def gateway(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.resolve("gateway", name)
+
+    def target(self, gateway_id: str, name: str) -> Optional[Dict[str, Any]]:
+        return self.resolve("target", name, scope=gateway_id)
+
+    def policy_engine(self, name: str) -> Optional[Dict[str, Any]]:
+        return self.resolve("policy_engine", name)
+
+    def policy(self, policy_engine_id: str, name: str) -> Optional[Dict[str, Any]]:
+        return self.resolve("policy", name, scope=policy_engine_id)
+
+    def record_created(self, kind: str, resource: Dict[str, Any], scope: Optional[str] = None) -> None:
+        """
+        직접 생성(또는 갱신)한 리소스를 인덱스에 반영합니다.
+
+        Args:
+            kind: 리소스 종류
+            resource: create_* 응답 또는 리소스 요약 (name 필드 필요)
+            scope: 범위 키
+        """
+        name = resource.get("name")
+        if not name:
+            return
+        key = self._scope_key(kind, scope)
+        with self._lock:
+            cached = self._scopes.get(key)
+            if cached is not None:
+                cached["names"][name] = _entry(kind, resource)
+                self._save()
+
+    def record_deleted(self, kind: str, name_or_id: str, scope: Optional[str] = None) -> None:
+        """
+        직접 삭제한 리소스를 인덱스에서 제거합니다.
+
+        Args:
+            kind: 리소스 종류
+            name_or_id: 리소스 이름 또는 ID
+            scope: 범위 키
+        """
+        key = self._scope_key(kind, scope)
+        with self._lock:
+            cached = self._scopes.get(key)
+            if cached is None:
+                return
+            names = cached["names"]
+            for name in [n for n, e in names.items() if name_or_id in (n, e["id"])]:
+                del names[name]
+            if kind == "gateway":
+                self._scopes.pop(self._scope_key("target", name_or_id), None)
+            elif kind == "policy_engine":
+                self._scopes.pop(self._scope_key("policy", name_or_id), None)
+            self._save()
+
+    def invalidate(self, kind: Optional[str] = None, scope: Optional[str] = None) -> None:
+        """
+        인덱스를 비웁니다. 다음 조회 시 다시 순회합니다.
+
+        Args:
+            kind: 비울 리소스 종류 (None이면 전체)
+            scope: 비울 범위 (None이면 해당 종류의 모든 범위)
+        """
+        with self._lock:
+            if kind is None:
+                self._scopes.clear()
+            elif scope is None:
+                prefix = self._scope_key(kind, None)
+                for key in [k for k in self._scopes if k.startswith(prefix)]:
+                    del self._scopes[key]
+            else:
+                self._scopes.pop(self._scope_key(kind, scope), None)
+            self._save()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        now = time.time()
+        self._scopes = {
+            key: value for key, value in data.get("scopes", {}).items()
+            if now - value.get("loaded_at", 0) < self.ttl
+        }
+
+    def _save(self) -> None:
+        """인덱스를 임시 파일에 쓴 뒤 교체합니다 (호출 시 잠금 보유)."""
+        if not self.path:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"scopes": self._scopes}, f, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"⚠️  리소스 인덱스 저장 실패: {e}")
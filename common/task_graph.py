@@ -0,0 +1,137 @@
+"""
+작업 의존성 그래프 실행 모듈
+
+리소스 프로비저닝 단계를 의존 관계가 있는 DAG로 선언하고,
+의존 단계가 끝난 단계부터 스레드 풀에서 동시에 실행합니다.
+
+이미 완료된 단계의 결과를 넘기면 해당 단계는 건너뛰므로,
+중간에 실패한 설정 스크립트를 완료된 단계 이후부터 다시 실행할 수 있습니다.
+"""
+
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional
+
+
+class Step:
+    """
+    DAG의 한 단계.
+
+    Args:
+        name: 단계 이름 (결과 딕셔너리의 키)
+        func: 앞선 단계 결과 {이름: 결과}를 받아 이 단계의 결과를 반환하는 함수
+        depends_on: 먼저 완료되어야 하는 단계 이름 목록
+
+    Example:
+        >>> Step("gateway", lambda results: create_gateway(results["cognito"]), depends_on=["cognito"])
+    """
+
+    def __init__(self, name: str, func: Callable[[Dict[str, Any]], Any], depends_on: Iterable[str] = ()):
+        self.name = name
+        self.func = func
+        self.depends_on = tuple(depends_on)
+
+
+def _check_graph(steps: List[Step]) -> None:
+    names = [step.name for step in steps]
+    if len(set(names)) != len(names):
+        raise ValueError("Duplicate step names")
+    known = set(names)
+    for step in steps:
+        missing = [dep for dep in step.depends_on if dep not in known]
+        if missing:
+            raise ValueError(f"Step {step.name} depends on unknown steps: {missing}")
+
+    # 위상 정렬로 순환 의존 확인
+    remaining = {step.name: set(step.depends_on) for step in steps}
+    while remaining:
+        ready = [name for name, deps in remaining.items() if not deps & remaining.keys()]
+        if not ready:
+            raise ValueError(f"Dependency cycle among steps: {sorted(remaining)}")
+        for name in ready:
+            del remaining[name]
+
+
+def run_graph(
+    steps: Iterable[Step],
+    completed: Optional[Mapping[str, Any]] = None,
+    max_workers: int = 4,
+    on_complete: Optional[Callable[[str, Any], None]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    단계들을 의존 관계에 따라 최대한 동시에 실행합니다.
+
+    실패한 단계에 (직접 또는 간접) 의존하는 단계는 실행하지 않고 SKIPPED로 기록합니다.
+    서로 독립적인 나머지 단계는 계속 실행합니다.
+
+    Args:
+        steps: 단계 목록
+        completed: 이전 실행에서 완료된 단계 결과 {이름: 결과} (해당 단계는 CACHED)
+        max_workers: 동시에 실행할 최대 단계 수
+        on_complete: 단계가 성공할 때마다 (이름, 결과)로 호출되는 함수
+                     (메인 스레드에서 호출되므로 진행 상태 저장에 사용 가능)
+
+    Returns:
+        {단계 이름: {"status": "DONE" | "CACHED" | "FAILED" | "SKIPPED",
+                    "result": 결과, "error": 예외, "seconds": 실행 시간}}
+
+    Raises:
+        ValueError: 이름 중복, 알 수 없는 의존 단계, 순환 의존이 있는 경우
+
+    Example:
+        >>> outcomes = run_graph([
+        ...     Step("lambda", lambda r: create_lambda()),
+        ...     Step("cognito", lambda r: create_cognito()),
+        ...     Step("gateway", lambda r: create_gateway(r["cognito"]), depends_on=["cognito"]),
+        ...     Step("target", lambda r: create_target(r["gateway"], r["lambda"]),
+        ...          depends_on=["gateway", "lambda"]),
+        ... ])
+    """
+    steps = list(steps)
+    _check_graph(steps)
+
+    results: Dict[str, Any] = {}
+    outcomes: Dict[str, Dict[str, Any]] = {}
+    for step in steps:
+        if completed and step.name in completed:
+            results[step.name] = completed[step.name]
+            outcomes[step.name] = {"status": "CACHED", "result": completed[step.name], "error": None, "seconds": 0.0}
+
+    def timed(step: Step, inputs: Dict[str, Any]):
+        start = time.perf_counter()
+        try:
+            return step.func(inputs), None, time.perf_counter() - start
+        except Exception as e:
+            return None, e, time.perf_counter() - start
+
+    pending = [step for step in steps if step.name not in outcomes]
+    running = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="task-graph") as executor:
+        while pending or running:
+            for step in list(pending):
+                dep_statuses = [outcomes.get(dep, {}).get("status") for dep in step.depends_on]
+                if any(status in ("FAILED", "SKIPPED") for status in dep_statuses):
+                    outcomes[step.name] = {"status": "SKIPPED", "result": None, "error": None, "seconds": 0.0}
+                    pending.remove(step)
+                elif all(status in ("DONE", "CACHED") for status in dep_statuses):
+                    inputs = {dep: results[dep] for dep in step.depends_on}
+                    running[executor.submit(timed, step, inputs)] = step
+                    pending.remove(step)
+
+            if not running:
+                # 남은 단계가 모두 SKIPPED로 처리된 경우
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                result, error, seconds = future.result()
+                if error is None:
+                    results[step.name] = result
+                    outcomes[step.name] = {"status": "DONE", "result": result, "error": None, "seconds": seconds}
+                    if on_complete is not None:
+                        on_complete(step.name, result)
+                else:
+                    outcomes[step.name] = {"status": "FAILED", "result": None, "error": error, "seconds": seconds}
+
+    return outcomes
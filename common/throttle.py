@@ -0,0 +1,126 @@
+"""
+제어 평면 호출 제한 유틸리티 모듈
+
+AgentCore 제어 평면 API를 대량으로 호출할 때 사용하는 요청 속도 제한기와
+스로틀링 오류 재시도 함수를 제공합니다.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from botocore.exceptions import ClientError
+
+# 재시도할 스로틀링 오류 코드
+THROTTLING_ERROR_CODES = {
+    "ThrottlingException",
+    "Throttling",
+    "TooManyRequestsException",
+    "RequestLimitExceeded",
+    "SlowDown",
+}
+
+# 재시도해도 해결되지 않는 한도 오류 (즉시 오류로 보고)
+QUOTA_ERROR_CODES = {"ServiceQuotaExceededException"}
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """
+    스로틀링(요청 한도 초과) 오류인지 확인합니다.
+
+    Args:
+        error: 발생한 예외
+
+    Returns:
+        스로틀링 오류 여부
+    """
+    if not isinstance(error, ClientError):
+        return False
+    code = error.response.get("Error", {}).get("Code", "")
+    if code in QUOTA_ERROR_CODES:
+        return False
+    status = error.response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return code in THROTTLING_ERROR_CODES or status == 429
+
+
+class RateLimiter:
+    """
+    스레드 간 공유되는 토큰 버킷 요청 속도 제한기.
+
+    Args:
+        rate: 초당 허용 요청 수
+        burst: 한 번에 허용하는 최대 요청 수 (기본값: rate)
+
+    Example:
+        >>> limiter = RateLimiter(rate=5)
+        >>> limiter.acquire()  # 한도를 넘으면 토큰이 생길 때까지 대기
+        >>> policy_client.create_policy(...)
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """요청 토큰 하나를 사용합니다. 토큰이 없으면 생길 때까지 대기합니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+def call_with_backoff(
+    func: Callable[..., Any],
+    *args,
+    max_attempts: int = 6,
+    base_delay: float = 0.5,
+    max_delay: float = 20.0,
+    limiter: Optional[RateLimiter] = None,
+    **kwargs
+) -> Any:
+    """
+    스로틀링 오류 시 지수 백오프(full jitter)로 재시도하며 함수를 호출합니다.
+
+    스로틀링이 아닌 오류는 그대로 전파됩니다.
+
+    Args:
+        func: 호출할 함수 (예: policy_client.create_policy)
+        *args: 함수 위치 인자
+        max_attempts: 최대 시도 횟수
+        base_delay: 첫 재시도 기준 대기 시간 (초)
+        max_delay: 최대 대기 시간 (초)
+        limiter: 매 시도 전에 사용할 요청 속도 제한기 (선택사항)
+        **kwargs: 함수 키워드 인자
+
+    Returns:
+        함수 반환값
+
+    Example:
+        >>> response = call_with_backoff(
+        ...     policy_client.create_policy,
+        ...     policyEngineId=engine_id, name=name, definition=definition,
+        ... )
+    """
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return func(*args, **kwargs)
+        except ClientError as e:
+            attempt += 1
+            if not is_throttling_error(e) or attempt >= max_attempts:
+                raise
+            time.sleep(random.uniform(0, min(max_delay, base_delay * (2 ** attempt))))
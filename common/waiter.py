@@ -0,0 +1,329 @@
+"""
+리소스 상태 대기 유틸리티 모듈
+
+Gateway, Target, Policy, Policy Engine, Runtime 등 AgentCore 리소스가 원하는 상태가
+될 때까지 기다리는 공통 대기 엔진을 제공합니다.
+
+고정 간격 대신 짧은 초기 간격에서 시작하는 지수 백오프(+지터)로 조회하므로,
+빠르게 끝나는 상태 전이는 1초 안에 감지하고 오래 걸리는 전이는 조회 횟수를 줄입니다.
+"""
+
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, Mapping, Optional
+
+from botocore.exceptions import ClientError
+
+from .throttle import is_throttling_error
+
+DEFAULT_INITIAL_INTERVAL = 0.25
+DEFAULT_MAX_INTERVAL = 10.0
+DEFAULT_MULTIPLIER = 2.0
+
+# 리소스가 (아직) 없음을 뜻하는 오류 코드
+MISSING_ERROR_CODES = {"ResourceNotFoundException", "NotFoundException"}
+
+
+class Deadline:
+    """
+    여러 대기 작업이 공유하는 마감 시각.
+
+    Args:
+        timeout: 지금부터 마감까지의 시간 (초)
+
+    Example:
+        >>> deadline = Deadline(600)
+        >>> wait_for_gateway_ready(client, gateway_id, deadline=deadline)
+        >>> wait_for_target_ready(client, gateway_id, target_id, deadline=deadline)
+    """
+
+    def __init__(self, timeout: float):
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 0 이상)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+
+def poll_intervals(
+    initial: float = DEFAULT_INITIAL_INTERVAL,
+    maximum: float = DEFAULT_MAX_INTERVAL,
+    multiplier: float = DEFAULT_MULTIPLIER
+) -> Iterator[float]:
+    """
+    지수 백오프 조회 간격을 생성합니다.
+
+    각 간격은 기준 간격의 절반에 0 ~ 절반 사이의 지터를 더한 값이므로,
+    동시에 시작한 대기 작업들의 조회 시점이 겹치지 않습니다.
+
+    Args:
+        initial: 첫 기준 간격 (초)
+        maximum: 최대 기준 간격 (초)
+        multiplier: 간격 증가 배수
+
+    Yields:
+        다음 조회까지 대기할 시간 (초)
+    """
+    base = initial
+    while True:
+        yield base / 2 + random.uniform(0, base / 2)
+        base = min(maximum, base * multiplier)
+
+
+def _result(ok: bool, reason: str, status: Optional[str], resource, start: float, polls: int,
+            error: Optional[str] = None) -> Dict[str, Any]:
+    return {
+        "ok": ok,
+        "reason": reason,
+        "status": status,
+        "resource": resource,
+        "error": error,
+        "elapsed_seconds": time.monotonic() - start,
+        "polls": polls,
+    }
+
+
+def wait_for_status(
+    fetch: Callable[[], Optional[Dict[str, Any]]],
+    success_states: Iterable[str],
+    failure_states: Iterable[str] = (),
+    timeout: float = 300,
+    deadline: Optional[Deadline] = None,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    fail_if_missing: bool = False,
+    status_key: str = "status",
+    on_status: Optional[Callable[[Optional[str]], None]] = None
+) -> Dict[str, Any]:
+    """
+    리소스가 성공 상태 또는 실패 상태가 될 때까지 대기합니다.
+
+    스로틀링 오류는 조회 실패로만 처리하고 다음 간격에 다시 조회합니다.
+    ResourceNotFoundException(또는 fetch가 None 반환)은 리소스 없음으로 처리합니다.
+    그 외 ClientError가 발생하면 대기를 중단합니다.
+
+    Args:
+        fetch: 리소스 상세 정보를 반환하는 함수 (없으면 None)
+        success_states: 성공 상태 목록 (예: {"READY"})
+        failure_states: 실패 상태 목록 (예: {"FAILED"})
+        timeout: 최대 대기 시간 (초, deadline이 주어지면 둘 중 빠른 쪽)
+        deadline: 여러 대기 작업이 공유하는 마감 시각 (선택사항)
+        initial_interval: 첫 조회 간격 (초)
+        max_interval: 최대 조회 간격 (초)
+        fail_if_missing: True인 경우 리소스가 없으면 즉시 실패, False인 경우 계속 대기
+        status_key: 상태 필드 이름
+        on_status: 상태가 바뀔 때마다 호출되는 함수 (로그 출력용)
+
+    Returns:
+        {"ok": bool,
+         "reason": "success" | "failure" | "timeout" | "missing" | "error",
+         "status": 마지막 상태, "resource": 마지막 조회 결과, "error": 오류 메시지,
+         "elapsed_seconds": 경과 시간, "polls": 조회 횟수}
+
+    Example:
+        >>> result = wait_for_status(
+        ...     lambda: client.get_gateway(gatewayIdentifier=gateway_id),
+        ...     success_states={"READY"},
+        ...     failure_states={"FAILED"},
+        ...     on_status=lambda status: print(f"  Gateway status: {status}"),
+        ... )
+    """
+    results = wait_for_many(
+        lambda keys: {key: fetch() for key in keys},
+        [None],
+        success_states,
+        failure_states,
+        timeout=timeout,
+        deadline=deadline,
+        initial_interval=initial_interval,
+        max_interval=max_interval,
+        fail_if_missing=fail_if_missing,
+        status_key=status_key,
+        on_status=(lambda key, status: on_status(status)) if on_status else None,
+    )
+    return results[None]
+
+
+def wait_for_many(
+    fetch_all: Callable[[list], Mapping[Any, Optional[Dict[str, Any]]]],
+    keys: Iterable[Any],
+    success_states: Iterable[str],
+    failure_states: Iterable[str] = (),
+    timeout: float = 300,
+    deadline: Optional[Deadline] = None,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    fail_if_missing: bool = False,
+    status_key: str = "status",
+    on_status: Optional[Callable[[Any, Optional[str]], None]] = None
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    여러 리소스를 한 번의 조회로 함께 대기합니다.
+
+    매 간격마다 아직 끝나지 않은 리소스 키 목록으로 `fetch_all`을 한 번 호출합니다.
+    목록 API(예: list_policies) 하나로 모든 상태를 가져오면 리소스 수와 관계없이
+    간격당 한 번만 조회합니다.
+
+    Args:
+        fetch_all: 키 목록을 받아 {키: 리소스 상세 정보 또는 None}을 반환하는 함수
+                   (결과에 없는 키는 None으로 처리)
+        keys: 대기할 리소스 키 목록 (예: 정책 ID)
+        나머지 인자는 wait_for_status와 같으며, on_status는 (키, 상태)로 호출됩니다.
+
+    Returns:
+        {키: wait_for_status와 같은 형식의 결과}
+
+    Example:
+        >>> results = wait_for_many(
+        ...     lambda ids: {p["policyId"]: p for p in list_policies(client, engine_id)},
+        ...     policy_ids,
+        ...     success_states={"ACTIVE"},
+        ...     failure_states={"CREATE_FAILED", "UPDATE_FAILED"},
+        ... )
+    """
+    state = _WaitState(keys, success_states, failure_states, timeout, deadline,
+                       initial_interval, max_interval, fail_if_missing, status_key, on_status)
+    while True:
+        try:
+            snapshot = fetch_all(state.begin_poll())
+        except ClientError as e:
+            snapshot = state.snapshot_for_error(e)
+        state.record(snapshot)
+
+        delay = state.next_delay()
+        if delay is None:
+            return state.results
+        time.sleep(delay)
+
+
+async def async_wait_for_many(
+    fetch_all: Callable[[list], Awaitable[Mapping[Any, Optional[Dict[str, Any]]]]],
+    keys: Iterable[Any],
+    success_states: Iterable[str],
+    failure_states: Iterable[str] = (),
+    timeout: float = 300,
+    deadline: Optional[Deadline] = None,
+    initial_interval: float = DEFAULT_INITIAL_INTERVAL,
+    max_interval: float = DEFAULT_MAX_INTERVAL,
+    fail_if_missing: bool = False,
+    status_key: str = "status",
+    on_status: Optional[Callable[[Any, Optional[str]], None]] = None
+) -> Dict[Any, Dict[str, Any]]:
+    """
+    wait_for_many의 asyncio 버전.
+
+    `fetch_all`은 코루틴 함수이며, 조회 사이의 대기는 asyncio.sleep으로 하므로
+    대기 중에 이벤트 루프나 스레드를 점유하지 않습니다.
+    """
+    state = _WaitState(keys, success_states, failure_states, timeout, deadline,
+                       initial_interval, max_interval, fail_if_missing, status_key, on_status)
+    while True:
+        try:
+            snapshot = await fetch_all(state.begin_poll())
+        except ClientError as e:
+            snapshot = state.snapshot_for_error(e)
+        state.record(snapshot)
+
+        delay = state.next_delay()
+        if delay is None:
+            return state.results
+        await asyncio.sleep(delay)
+
+
+class _WaitState:
+    """대기 중인 리소스 상태와 다음 조회 시점을 관리합니다 (동기/비동기 대기 공용)."""
+
+    def __init__(self, keys, success_states, failure_states, timeout, deadline,
+                 initial_interval, max_interval, fail_if_missing, status_key, on_status):
+        self.success_states = set(success_states)
+        self.failure_states = set(failure_states)
+        self.fail_if_missing = fail_if_missing
+        self.status_key = status_key
+        self.on_status = on_status
+
+        self.start = time.monotonic()
+        self.expires_at = self.start + timeout
+        if deadline is not None:
+            self.expires_at = min(self.expires_at, deadline.expires_at)
+
+        self.pending = list(dict.fromkeys(keys))
+        self.results: Dict[Any, Dict[str, Any]] = {}
+        self.last_status: Dict[Any, Optional[str]] = {}
+        self.last_resource: Dict[Any, Optional[Dict[str, Any]]] = {}
+        self.polls = 0
+        self.intervals = poll_intervals(initial_interval, max_interval)
+
+    def begin_poll(self) -> list:
+        self.polls += 1
+        return list(self.pending)
+
+    def _finish(self, key, ok: bool, reason: str, error: Optional[str] = None) -> None:
+        self.results[key] = _result(ok, reason, self.last_status.get(key), self.last_resource.get(key),
+                                    self.start, self.polls, error=error)
+
+    def snapshot_for_error(self, error: ClientError) -> Optional[Dict[Any, Any]]:
+        """조회 오류 처리: 스로틀링은 이번 조회만 건너뛰고, 그 외 오류는 대기를 중단합니다."""
+        if is_throttling_error(error):
+            return None
+        if error.response.get("Error", {}).get("Code", "") in MISSING_ERROR_CODES:
+            return {}
+        for key in self.pending:
+            self._finish(key, False, "error", error=str(error))
+        self.pending = []
+        return None
+
+    def record(self, snapshot: Optional[Mapping[Any, Optional[Dict[str, Any]]]]) -> None:
+        if snapshot is None:
+            return
+        for key in list(self.pending):
+            resource = snapshot.get(key)
+            status = resource.get(self.status_key) if resource else None
+            self.last_resource[key] = resource
+            if key not in self.last_status or status != self.last_status[key]:
+                self.last_status[key] = status
+                if self.on_status is not None:
+                    self.on_status(key, status)
+
+            if resource is None:
+                if self.fail_if_missing:
+                    self._finish(key, False, "missing")
+                    self.pending.remove(key)
+            elif status in self.success_states:
+                self._finish(key, True, "success")
+                self.pending.remove(key)
+            elif status in self.failure_states:
+                self._finish(key, False, "failure")
+                self.pending.remove(key)
+
+    def next_delay(self) -> Optional[float]:
+        """다음 조회까지 대기할 시간. 모두 끝났거나 마감되면 None."""
+        if not self.pending:
+            return None
+        remaining = self.expires_at - time.monotonic()
+        if remaining <= 0:
+            for key in self.pending:
+                self._finish(key, False, "timeout")
+            self.pending = []
+            return None
+        return min(next(self.intervals), remaining)
+
+
+def fetch_or_none(func: Callable[..., Dict[str, Any]], **kwargs) -> Optional[Dict[str, Any]]:
+    """
+    get_* API를 호출하고, 리소스가 없으면 None을 반환합니다.
+
+    스로틀링 및 그 외 오류는 그대로 전파되어 대기 엔진이 처리합니다.
+
+    Example:
+        >>> fetch = lambda: fetch_or_none(client.get_policy, policyEngineId=engine_id, policyId=policy_id)
+    """
+    try:
+        return func(**kwargs)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code", "") in MISSING_ERROR_CODES:
+            return None
+        raise
@@ -0,0 +1,58 @@
+"""Tests for Cedar string escapes in the local policy evaluator."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from common.cedar_local import CedarSyntaxError, LocalPolicyEngine, parse_policies  # noqa: E402
+
+ACTION = "RefundToolTarget___refund"
+
+
+def _reason_policy(pattern: str) -> str:
+    return f"""
+    permit(principal, action == AgentCore::Action::"{ACTION}", resource)
+    when {{ context.input.reason like "{pattern}" }};
+    """
+
+
+def _decision(engine: LocalPolicyEngine, reason: str) -> str:
+    return engine.is_authorized(action=ACTION, context_input={"reason": reason})
+
+
+def test_like_escaped_star_matches_literal_star():
+    engine = LocalPolicyEngine([_reason_policy(r"a\*b*")])
+
+    assert _decision(engine, "a*b") == "ALLOWED"
+    assert _decision(engine, "a*bcd") == "ALLOWED"
+    assert _decision(engine, "axb") == "DENIED"
+
+
+def test_escaped_backslash_before_wildcard_stays_a_wildcard():
+    engine = LocalPolicyEngine([_reason_policy(r"a\\*")])
+
+    assert _decision(engine, "a\\anything") == "ALLOWED"
+    assert _decision(engine, "a*") == "DENIED"
+
+
+def test_string_escapes_are_decoded():
+    engine = LocalPolicyEngine([f"""
+    permit(principal, action == AgentCore::Action::"{ACTION}", resource)
+    when {{ context.input.reason == "tab\\there \\u{{e9}} \\"q\\"" }};
+    """])
+
+    assert _decision(engine, 'tab\there é "q"') == "ALLOWED"
+
+
+@pytest.mark.parametrize("literal", [r'"bad \q escape"', r'"\u{110000}"', r'"\u{}"'])
+def test_invalid_escape_raises_syntax_error(literal):
+    with pytest.raises(CedarSyntaxError):
+        parse_policies(f"permit(principal, action, resource) when {{ context.input.reason == {literal} }};")
+
+
+def test_escaped_star_outside_like_raises_syntax_error():
+    with pytest.raises(CedarSyntaxError):
+        parse_policies(r'permit(principal, action, resource) when { context.input.reason == "a\*" };')
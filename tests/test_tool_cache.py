@@ -0,0 +1,138 @@
+"""Tests for the MCP server result caches (LRU/TTL, read-through, idempotency)."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "02-MCP-Server-Target"))
+
+from tool_cache import IdempotencyCache, LRUCache, ReadThroughCache  # noqa: E402
+from tool_offload import ToolExecutor  # noqa: E402
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2, ttl=None)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "b" is now the least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    metrics = cache.metrics()
+    assert metrics["entries"] == 2
+    assert metrics["evictions"] == 1
+    assert metrics["hits"] == 3
+    assert metrics["misses"] == 1
+
+
+def test_lru_entries_expire_after_ttl():
+    cache = LRUCache(max_entries=10, ttl=0.05)
+    cache.set("short", 1)
+    cache.set("long", 2, ttl=60)
+    time.sleep(0.1)
+
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+    metrics = cache.metrics()
+    assert metrics["entries"] == 1
+    assert metrics["expirations"] == 1
+    assert metrics["evictions"] == 0
+
+
+def test_read_through_counts_negative_hits_separately():
+    loads = []
+
+    def load(order_id):
+        loads.append(order_id)
+        return {"orderId": order_id} if order_id == "o1" else None
+
+    cache = ReadThroughCache(load, ttl=60, negative_ttl=60)
+    for _ in range(3):
+        cache.get("o1")
+        cache.get("missing")
+
+    assert loads == ["o1", "missing"]
+    metrics = cache.metrics()
+    assert metrics["misses"] == 2
+    assert metrics["hits"] == 2
+    assert metrics["negative_hits"] == 2
+    assert metrics["hit_ratio"] == 2 / 6
+
+
+def test_read_through_returns_copies():
+    cache = ReadThroughCache(lambda order_id: {"orderId": order_id, "items": ["book"]})
+    first = cache.get("o1")
+    first["items"].append("pen")
+    first["orderId"] = "changed"
+
+    assert cache.get("o1") == {"orderId": "o1", "items": ["book"]}
+    cache.invalidate("o1")
+    assert cache.metrics()["invalidations"] == 1
+    assert cache.metrics()["entries"] == 0
+
+
+def test_cancelled_call_is_not_executed_again_on_retry():
+    idempotency = IdempotencyCache()
+    executor = ToolExecutor(max_workers=2)
+    executions = []
+    release = threading.Event()
+
+    @idempotency.idempotent(key_arg="order_id")
+    @executor.limit(max_concurrency=1)
+    def refund(amount: float, order_id: str) -> dict:
+        release.wait(timeout=5)
+        executions.append(order_id)
+        return {"order_id": order_id, "amount": amount}
+
+    async def scenario():
+        first = asyncio.ensure_future(refund(100.0, "o1"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        retry = asyncio.ensure_future(refund(100.0, "o1"))
+        await asyncio.sleep(0.05)
+        release.set()
+        result = await retry
+        again = await refund(100.0, "o1")
+        return result, again
+
+    try:
+        result, again = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert executions == ["o1"]
+    assert result == again == {"order_id": "o1", "amount": 100.0}
+    assert idempotency.metrics()["executions"] == 1
+    assert idempotency.metrics()["in_flight"] == 0
+
+
+def test_concurrent_identical_calls_are_coalesced():
+    idempotency = IdempotencyCache()
+    executions = []
+
+    @idempotency.idempotent(key_arg="order_id")
+    async def approve_claim(amount: float, order_id: str) -> dict:
+        executions.append(order_id)
+        await asyncio.sleep(0.05)
+        return {"order_id": order_id, "approved": amount}
+
+    async def scenario():
+        same = await asyncio.gather(*(approve_claim(250.0, "o1") for _ in range(5)))
+        other = await approve_claim(300.0, "o1")  # different arguments execute again
+        return same, other
+
+    same, other = asyncio.run(scenario())
+
+    assert same == [{"order_id": "o1", "approved": 250.0}] * 5
+    assert other == {"order_id": "o1", "approved": 300.0}
+    assert executions == ["o1", "o1"]
+    metrics = idempotency.metrics()
+    assert metrics["executions"] == 2
+    assert metrics["coalesced"] == 4
+    assert metrics["in_flight"] == 0
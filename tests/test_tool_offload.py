@@ -0,0 +1,85 @@
+"""Tests for the MCP tool executor (per-tool concurrency limits, cancellation)."""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "02-MCP-Server-Target"))
+
+from tool_offload import ToolExecutor  # noqa: E402
+
+
+def test_concurrency_limit_is_enforced():
+    executor = ToolExecutor(max_workers=8)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    @executor.limit(max_concurrency=2)
+    def lookup(order_id: str) -> str:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+        return order_id
+
+    async def scenario():
+        return await asyncio.gather(*(lookup(f"o{i}") for i in range(10)))
+
+    try:
+        results = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert results == [f"o{i}" for i in range(10)]
+    assert peak == 2
+    stats = executor.metrics()["tools"]["lookup"]
+    assert stats["calls"] == 10
+    assert stats["running"] == 0
+    assert stats["queued"] == 0
+
+
+def test_cancelled_call_holds_slot_until_thread_finishes():
+    executor = ToolExecutor(max_workers=2)
+    started = []
+    release = threading.Event()
+
+    @executor.limit(max_concurrency=1)
+    def refund(order_id: str) -> str:
+        started.append(order_id)
+        if order_id == "o1":
+            release.wait(timeout=5)
+        return order_id
+
+    async def scenario():
+        first = asyncio.ensure_future(refund("o1"))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+
+        second = asyncio.ensure_future(refund("o2"))
+        await asyncio.sleep(0.05)
+        # The cancelled call's thread is still running, so "o2" waits for the slot
+        blocked = (list(started), executor.metrics()["tools"]["refund"])
+        release.set()
+        return blocked, await second
+
+    try:
+        (started_while_blocked, stats_while_blocked), result = asyncio.run(scenario())
+    finally:
+        executor.shutdown()
+
+    assert started_while_blocked == ["o1"]
+    assert stats_while_blocked["running"] == 1
+    assert stats_while_blocked["queued"] == 1
+    assert stats_while_blocked["cancelled"] == 1
+    assert result == "o2"
+    assert started == ["o1", "o2"]
+    stats = executor.metrics()["tools"]["refund"]
+    assert stats["running"] == 0
+    assert stats["calls"] == 2